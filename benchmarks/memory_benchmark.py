@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the game models.
+
+Uses tracemalloc to measure the bytes allocated per Player, Upgrade and
+Particle, comparing the slotted classes against equivalent classes with a
+per-instance __dict__ (and particles against their old dict form).
+
+Usage:
+    python -m benchmarks.memory_benchmark [--count N] [--output FILE]
+"""
+
+import os
+import sys
+import argparse
+import json
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import COLORS
+from src.models.player import Player
+from src.models.upgrade import Upgrade
+from src.utils.helpers import Particle
+
+def without_slots(cls):
+    """
+    Build a copy of a slotted class that stores attributes in a __dict__.
+    
+    Args:
+        cls (type): A class that defines __slots__.
+    
+    Returns:
+        type: A class with the same methods but no __slots__.
+    """
+    skip = set(cls.__slots__) | {'__slots__', '__dict__', '__weakref__'}
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in skip}
+    return type(f"{cls.__name__}WithDict", (), namespace)
+
+def bytes_per_object(factory, count):
+    """
+    Measure the memory allocated per object created by a factory.
+    
+    Args:
+        factory (function): Creates one object per call.
+        count (int): The number of objects to create.
+    
+    Returns:
+        float: The average number of bytes allocated per object.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    # Exclude the list holding the objects
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    total -= sys.getsizeof(objects)
+    return total / count
+
+def player_factory(cls):
+    """Create a player with a few owned upgrades."""
+    def factory():
+        player = cls()
+        player.currency = 12345
+        player.owned_upgrades = {'click_power': 3, 'auto_clicker': 2}
+        return player
+    return factory
+
+def upgrade_factory(cls):
+    """Create an upgrade from the first config definition."""
+    return lambda: cls('click_power', 'Click Power', 'Increases the value of each click', 10, 1.5, 1, 5)
+
+def particle_factory(cls):
+    """Create a circle particle."""
+    return lambda: cls([400.0, 300.0], [12.5, -80.0], COLORS['highlight'], 5, 1.0, 0.0)
+
+def run(count):
+    """
+    Run the memory benchmark.
+    
+    Args:
+        count (int): The number of objects created per measurement.
+    
+    Returns:
+        dict: A dictionary of model name -> {'before', 'after'} bytes per object.
+    """
+    cases = {
+        'player': (player_factory(without_slots(Player)), player_factory(Player)),
+        'upgrade': (upgrade_factory(without_slots(Upgrade)), upgrade_factory(Upgrade)),
+        'particle': (lambda: particle_factory(Particle)().to_dict(), particle_factory(Particle)),
+    }
+    
+    results = {}
+    print(f"{'model':<12}{'before':>12}{'after':>12}{'saved':>10}")
+    for name, (before_factory, after_factory) in cases.items():
+        before = bytes_per_object(before_factory, count)
+        after = bytes_per_object(after_factory, count)
+        results[name] = {'before': before, 'after': after}
+        print(f"{name:<12}{before:>10.1f} B{after:>10.1f} B{(1 - after / before) * 100:>9.1f}%")
+    return results
+
+def main(argv=None):
+    """
+    Run the memory benchmark from the command line.
+    
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Measure bytes per model object.")
+    parser.add_argument('--count', type=int, default=10000, help="Objects created per measurement.")
+    parser.add_argument('--output', help="Optional path to write the results as JSON.")
+    args = parser.parse_args(argv)
+    
+    results = run(args.count)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
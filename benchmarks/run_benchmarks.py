@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the clicker game's hot paths.
+
+Runs headlessly with the dummy SDL drivers, stores results as JSON and
+compares them against a baseline file.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--baseline FILE] [--output FILE]
+                                        [--save-baseline] [--threshold PCT]
+"""
+
+import os
+import sys
+
+# The dummy drivers must be selected before pygame is imported
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import COLORS, CLICK_AREA_POSITION, CLICK_AREA_SIZE, LEVI_SIZE, STATS_GRAPH_RANGES
+from src.models.currency import Currency
+from src.models.player import Player
+from src.models.upgrade import Upgrade, create_upgrades_from_config
+from src.models.achievement import AchievementTracker, create_achievements_from_config
+from src.models.unlocks import UnlockGraph
+from src.utils.content_packs import discover_packs
+from src.server.game_server import GameServer
+from src.ui.text import draw_text
+from src.utils.helpers import init_subsystems, create_particle
+from src.utils.leaderboard import Leaderboard
+from src.utils.save_manager import SaveManager
+from src.utils.texture_atlas import SpriteBatch
+from src.utils.analytics import AnalyticsLog, CLICKS
+from src.utils.click_rate import ClickRateTracker, MacroDetector
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, 'results', 'latest.json')
+BENCHMARKS = []
+
+def benchmark(name, ops=1, repeat=7):
+    """
+    Register a benchmark.
+    
+    The decorated function receives no arguments and returns the callable
+    to time, so that setup cost is not included in the measurement.
+    
+    Args:
+        name (str): The name of the benchmark.
+        ops (int, optional): The number of operations performed per call.
+        repeat (int, optional): The number of timed repetitions.
+    """
+    def decorator(setup):
+        BENCHMARKS.append((name, setup, ops, repeat))
+        return setup
+    return decorator
+
+def time_callable(func, ops, repeat):
+    """
+    Time a callable and compute per-operation statistics.
+    
+    Args:
+        func (function): The callable to time.
+        ops (int): The number of operations performed per call.
+        repeat (int): The number of timed repetitions.
+    
+    Returns:
+        dict: The min/median/max time per operation in microseconds.
+    """
+    func()  # Warm up caches and lazy initialization
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) / ops * 1e6)
+    
+    return {
+        'min_us': min(timings),
+        'median_us': statistics.median(timings),
+        'max_us': max(timings),
+        'ops': ops,
+        'repeat': repeat,
+    }
+
+def make_game():
+    """
+    Create a game instance on the dummy display.
+    
+    Returns:
+        Game: A new game.
+    """
+    from src.game import Game
+    from src.utils.rng import RandomService
+    save_manager = SaveManager(os.path.join(tempfile.gettempdir(), 'bench_save_data.json'))
+    return Game(rng=RandomService(seed=0), save_manager=save_manager)
+
+def make_particles(count):
+    """
+    Create long-lived particles around the click area.
+    
+    Args:
+        count (int): The number of particles.
+    
+    Returns:
+        list: The particles.
+    """
+    center = (CLICK_AREA_POSITION[0] + CLICK_AREA_SIZE[0] // 2,
+              CLICK_AREA_POSITION[1] + CLICK_AREA_SIZE[1] // 2)
+    return [
+        create_particle(center, COLORS['highlight'], size=random.randint(3, 8), lifetime=1e6)
+        for _ in range(count)
+    ]
+
+def _render_benchmark(particle_count):
+    """Register a Game.render benchmark for a particle count."""
+    @benchmark(f"game_render_{particle_count}_particles", ops=10, repeat=5)
+    def setup():
+        game = make_game()
+        game.particles = make_particles(particle_count)
+        
+        def run():
+            for _ in range(10):
+                game.render()
+        return run
+
+for _count in (0, 100, 1000):
+    _render_benchmark(_count)
+
+@benchmark('draw_text', ops=200)
+def bench_draw_text():
+    surface = pygame.Surface((800, 600))
+    
+    def run():
+        for i in range(200):
+            draw_text(surface, f"{i} Mullet Bucks", (400, 300), centered=True)
+    return run
+
+@benchmark('currency_format', ops=10000)
+def bench_currency_format():
+    amounts = [random.randint(0, 10 ** random.randint(1, 30)) for _ in range(10000)]
+    
+    def run():
+        for amount in amounts:
+            Currency.format(amount)
+    return run
+
+@benchmark('player_purchase_upgrade_chain', ops=1000)
+def bench_purchase_chain():
+    upgrade = Upgrade('click_power', 'Click Power', '', 10, 1.01, 1)
+    
+    def run():
+        player = Player()
+        player.currency = 10 ** 12
+        for _ in range(1000):
+            player.purchase_upgrade(upgrade)
+    return run
+
+@benchmark('save_load_round_trip', ops=100)
+def bench_save_load():
+    player = Player()
+    player.currency = 123456789
+    player.owned_upgrades = {'click_power': 5, 'auto_clicker': 3, 'click_multiplier': 1}
+    upgrades = create_upgrades_from_config()
+    achievements = AchievementTracker(create_achievements_from_config())
+    save_manager = SaveManager(os.path.join(tempfile.mkdtemp(), 'bench_save.json'))
+    
+    def run():
+        for _ in range(100):
+            save_manager.save_game(player, upgrades, achievements)
+            Player.from_dict(save_manager.load_game()['player'])
+    return run
+
+@benchmark('click_burst_200', ops=200, repeat=5)
+def bench_click_burst():
+    game = make_game()
+    pos = (CLICK_AREA_POSITION[0] + 10, CLICK_AREA_POSITION[1] + 10)
+    
+    def run():
+        game.particles = []
+        for _ in range(200):
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+        game.handle_events()
+    return run
+
+@benchmark('leaderboard_insert_query_100k', ops=100)
+def bench_leaderboard():
+    rng = random.Random(0)
+    leaderboard = Leaderboard(':memory:')
+    leaderboard.add_scores([(rng.uniform(30, 600), f"player{i % 5000}", None) for i in range(100000)])
+    
+    def run():
+        for _ in range(100):
+            run_time = rng.uniform(30, 600)
+            leaderboard.add_score(run_time, "bench")
+            leaderboard.get_top(10)
+            leaderboard.get_profile_rank("bench")
+    return run
+
+@benchmark('levi_frame_500', ops=10, repeat=5)
+def bench_levi_frame():
+    game = make_game()
+    rng = random.Random(0)
+    for _ in range(500):
+        game.levis.spawn(rng)
+    
+    def run():
+        # Move, hit-test a few clicks and draw 500 Levis without recycling any
+        game.levis.update(0.0)
+        for x in range(0, 800, 200):
+            game.levis.hit_test((x, 200))
+        game.levis.render(game.screen, None, COLORS['levi'])
+    return run
+
+@benchmark('sprite_batch_500', ops=10, repeat=5)
+def bench_sprite_batch():
+    game = make_game()
+    game.assets.wait()
+    batch = SpriteBatch(game.assets.atlas)
+    rng = random.Random(0)
+    positions = [(rng.uniform(0, 710), rng.uniform(100, 300)) for _ in range(500)]
+    
+    def run():
+        batch.add_many('levi', LEVI_SIZE, positions)
+        batch.draw(game.screen)
+    return run
+
+@benchmark('viewport_present_1080p', ops=10, repeat=5)
+def bench_viewport_present():
+    game = make_game()
+    game.viewport.resize(pygame.Surface((1920, 1080)))
+    game.render()
+    
+    def run():
+        # A typical frame: only the currency text changes
+        game.player.currency += 1
+        game.update(0.2)
+        game.render()
+    return run
+
+@benchmark('stats_graph_week', ops=10, repeat=5)
+def bench_stats_graph():
+    game = make_game()
+    series = game.stats.series['income']
+    for second in range(7 * 24 * 3600):
+        series.add(second % 977)
+    game.graph_panel.range_index = len(STATS_GRAPH_RANGES) - 1
+    
+    def run():
+        # Record one more second of a week-long session and redraw the 30 day graph
+        series.add(1)
+        game.graph_panel.render(game.screen)
+    return run
+
+@benchmark('analytics_log_100k', ops=100000, repeat=5)
+def bench_analytics_log():
+    log = AnalyticsLog(os.path.join(tempfile.mkdtemp(), 'analytics.log'), capacity=65536)
+    
+    def run():
+        # Wraps the ring about one and a half times
+        for count in range(100000):
+            log.log(CLICKS, count=1, value=count)
+    return run
+
+@benchmark('click_rate_100k', ops=100000, repeat=5)
+def bench_click_rate():
+    tracker = ClickRateTracker(detector=MacroDetector())
+    clock = [0.0]
+    
+    def run():
+        # 100k single clicks at 5000 clicks per second
+        now = clock[0]
+        for click in range(100000):
+            tracker.record(now + click * 0.0002)
+        clock[0] = now + 100
+    return run
+
+@benchmark('unlock_graph_10k', ops=10000, repeat=5)
+def bench_unlock_graph():
+    # A 10k upgrade chain where each upgrade needs the one before and some earnings
+    upgrades = {}
+    for index in range(10000):
+        requires = {'upgrades': {f'u{index - 1}': 1}, 'currency_earned': index * 10} if index else None
+        upgrades[f'u{index}'] = Upgrade(f'u{index}', f'Upgrade {index}', '', 10, 1.5, 1, 1, requires)
+    
+    def run():
+        # Compile the graph, then buy down the chain while earning every step
+        graph = UnlockGraph(upgrades)
+        for index in range(10000):
+            graph.update('currency_earned', index * 10)
+            graph.update(f'u{index}_level', 1)
+    return run
+
+def make_content_pack(upgrade_count):
+    """Write a content pack of one JSON file and return (packs directory, cache directory)."""
+    packs_dir = os.path.join(tempfile.mkdtemp(), 'packs')
+    pack_dir = os.path.join(packs_dir, 'bench')
+    os.makedirs(pack_dir)
+    upgrades = [{'id': f'u{index}', 'name': f'Upgrade {index}', 'description': 'A benchmark upgrade',
+                 'base_cost': 10 * index, 'cost_multiplier': 1.5, 'effect_value': 1, 'effect': 'click_power',
+                 'max_level': 10, 'requires': {'upgrades': {f'u{index - 1}': 1}} if index else None}
+                for index in range(upgrade_count)]
+    with open(os.path.join(pack_dir, 'upgrades.json'), 'w') as f:
+        json.dump({'upgrades': upgrades}, f)
+    return packs_dir, os.path.join(packs_dir, '.cache')
+
+@benchmark('content_pack_10k_cold', ops=1, repeat=5)
+def bench_content_pack_cold():
+    packs_dir, cache_dir = make_content_pack(10000)
+    
+    def run():
+        # Parse, validate and compile with an empty cache
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        for pack in discover_packs(packs_dir, cache_dir):
+            pack.upgrades
+    return run
+
+@benchmark('content_pack_10k_warm', ops=1, repeat=5)
+def bench_content_pack_warm():
+    packs_dir, cache_dir = make_content_pack(10000)
+    for pack in discover_packs(packs_dir, cache_dir):
+        pack.upgrades  # Fill the cache
+    
+    def run():
+        for pack in discover_packs(packs_dir, cache_dir):
+            pack.upgrades
+    return run
+
+class NullWriter:
+    """A stand-in for a client connection that discards everything."""
+    
+    class transport:
+        @staticmethod
+        def get_write_buffer_size():
+            return 0
+    
+    def write(self, data):
+        pass
+
+@benchmark('server_tick_10k_sessions', ops=1, repeat=5)
+def bench_server_tick():
+    server = GameServer()
+    writer = NullWriter()
+    for i in range(10000):
+        session = server.create_session()
+        session.writer = writer
+        # One in ten sessions has auto income
+        if i % 10 == 0:
+            session.player.auto_click_power = 5
+            server.update_income(session)
+    
+    def run():
+        server.tick()
+        server.flush()
+    return run
+
+def run_benchmarks(selected=None):
+    """
+    Run the registered benchmarks.
+    
+    Args:
+        selected (list, optional): Benchmark names to run, or None for all.
+    
+    Returns:
+        dict: A dictionary of benchmark name -> statistics.
+    """
+    results = {}
+    for name, setup, ops, repeat in BENCHMARKS:
+        if selected and name not in selected:
+            continue
+        random.seed(0)
+        results[name] = time_callable(setup(), ops, repeat)
+        print(f"{name:<36}{results[name]['median_us']:>12.2f} us/op")
+    return results
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+    
+    Args:
+        results (dict): The current benchmark results.
+        baseline (dict): The baseline benchmark results.
+        threshold (float): The slowdown in percent reported as a regression.
+    
+    Returns:
+        list: The names of the benchmarks that regressed.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<36}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<36}{'-':>12}{stats['median_us']:>12.2f}{'new':>10}")
+            continue
+        
+        change = (stats['median_us'] / base['median_us'] - 1) * 100 if base['median_us'] else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<36}{base['median_us']:>12.2f}{stats['median_us']:>12.2f}{change:>+9.1f}%{flag}")
+    return regressions
+
+def write_json(path, results):
+    """
+    Write benchmark results to a JSON file.
+    
+    Args:
+        path (str): The path of the JSON file.
+        results (dict): The benchmark results.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = {
+        'meta': {
+            'timestamp': time.time(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'video_driver': os.environ.get('SDL_VIDEODRIVER'),
+        },
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def main(argv=None):
+    """
+    Run the benchmark suite from the command line.
+    
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(description="Run the LiamClickerV2 benchmark suite.")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="Where to write the results JSON.")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON to compare against.")
+    parser.add_argument('--save-baseline', action='store_true', help="Also store the results as the new baseline.")
+    parser.add_argument('--threshold', type=float, default=10.0, help="Slowdown in percent flagged as a regression.")
+    parser.add_argument('--fail-on-regression', action='store_true', help="Exit with status 1 on regressions.")
+    parser.add_argument('names', nargs='*', help="Only run the named benchmarks.")
+    args = parser.parse_args(argv)
+    
+    init_subsystems()
+    results = run_benchmarks(args.names)
+    write_json(args.output, results)
+    
+    regressions = []
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)['results'], args.threshold)
+    else:
+        print(f"\nNo baseline at {args.baseline}; use --save-baseline to create one.")
+    
+    if args.save_baseline:
+        write_json(args.baseline, results)
+    
+    pygame.quit()
+    return 1 if regressions and args.fail_on_regression else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Launcher script for the LiamClickerV2 headless game server.
+"""
+
+import sys
+import os
+
+# Add the project directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import the server module
+from src.server.game_server import main
+
+if __name__ == "__main__":
+    # Run the server
+    main()
@@ -7,6 +7,10 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 TITLE = "Liam Clicker V2"
+FULLSCREEN = False  # Start fullscreen; the window is resizable otherwise
+FULLSCREEN_TOGGLE_KEY = 'f11'
+VIEWPORT_BAND_HEIGHT = 40  # Rows compared at a time to find the parts of a frame to scale again
+VIEWPORT_SMOOTH = True  # Filter when scaling to the window; False scales nearest pixels
 
 # Colors
 COLORS = {
@@ -18,14 +22,30 @@ COLORS = {
     'highlight': (100, 149, 237),  # Cornflower blue
     'positive': (50, 205, 50),     # Lime green
     'negative': (220, 20, 60),     # Crimson
+    'levi': (65, 105, 225),        # Royal blue
 }
 
 # Game settings
 CLICK_BASE_VALUE = 1
 CURRENCY_NAME = "Mullet Bucks"
+WIN_AMOUNT = 2000  # Currency needed to win a speedrun
 CLICK_AREA_SIZE = (200, 200)
 CLICK_AREA_POSITION = (SCREEN_WIDTH // 2 - CLICK_AREA_SIZE[0] // 2, 
                        SCREEN_HEIGHT // 2 - CLICK_AREA_SIZE[1] // 2)
+CLICK_PARTICLES = 5  # Particles spawned per click
+MAX_CLICK_PARTICLES_PER_FRAME = 30  # Cap for clicks coalesced into one frame
+
+# Levi settings (Stage 2 moving targets)
+LEVI_VALUE = 150
+LEVI_SPAWN_MIN_TIME = 5  # Minimum seconds between Levi spawns
+LEVI_SPAWN_MAX_TIME = 15  # Maximum seconds between Levi spawns
+LEVI_SPEED_MIN = 100  # Minimum Levi speed (pixels per second)
+LEVI_SPEED_MAX = 300  # Maximum Levi speed (pixels per second)
+LEVI_SIZE = (90, 90)
+LEVI_MIN_Y = 100
+LEVI_MAX_Y = 300
+LEVI_OFFSCREEN_MARGIN = 100  # Levis start and leave this many pixels past the screen edge
+LEVI_POOL_SIZE = 1024  # Maximum number of Levis on screen at once
 
 # Font settings
 FONT_SIZES = {
@@ -36,6 +56,8 @@ FONT_SIZES = {
 }
 
 # Upgrade definitions
+# 'requires' lists the prerequisites an upgrade needs before it can be bought:
+# upgrade levels, 'currency_earned', 'total_clicks' and achievement IDs.
 UPGRADES = [
     {
         'id': 'click_power',
@@ -64,13 +86,129 @@ UPGRADES = [
         'effect_value': 2,
         'max_level': 5,  # Maximum of 5 levels
     },
+    {
+        'id': 'stage_2_unlock',
+        'name': 'Release the LEVI!',
+        'description': 'Unlock Stage 2 with Levi attacks',
+        'base_cost': 100,
+        'cost_multiplier': 1.0,
+        'effect_value': 1,
+        'max_level': 1,  # Can only be purchased once
+    },
 ]
 
+# Content pack settings
+# Each directory in CONTENT_PACKS_DIR is a pack of upgrade definitions in
+# .json or .toml files, loaded after UPGRADES. Pack upgrades name one of the
+# built-in effects with 'effect'.
+CONTENT_PACKS_ENABLED = True
+CONTENT_PACKS_DIR = 'content_packs'  # Relative to the project directory
+CONTENT_CACHE_DIR = 'content_packs/.cache'  # Compiled packs, keyed by file hash
+
+# Achievement definitions
+# Each achievement unlocks once its stat reaches the threshold. Stats are
+# 'total_clicks', 'currency_earned' and '<upgrade_id>_level'.
+ACHIEVEMENTS = [
+    {'id': 'first_click', 'name': 'First Click', 'description': 'Click for the first time',
+     'stat': 'total_clicks', 'threshold': 1},
+    {'id': 'clicks_100', 'name': 'Clicker', 'description': 'Click 100 times',
+     'stat': 'total_clicks', 'threshold': 100},
+    {'id': 'clicks_1000', 'name': 'Click Machine', 'description': 'Click 1,000 times',
+     'stat': 'total_clicks', 'threshold': 1000},
+    {'id': 'earned_1k', 'name': 'Thousandaire', 'description': 'Earn 1,000 Mullet Bucks',
+     'stat': 'currency_earned', 'threshold': 1000},
+    {'id': 'earned_100k', 'name': 'Mullet Mogul', 'description': 'Earn 100,000 Mullet Bucks',
+     'stat': 'currency_earned', 'threshold': 100000},
+    {'id': 'earned_1m', 'name': 'Business in the Front', 'description': 'Earn 1,000,000 Mullet Bucks',
+     'stat': 'currency_earned', 'threshold': 1000000},
+    {'id': 'hands_free', 'name': 'Hands Free', 'description': 'Buy an Auto Clicker',
+     'stat': 'auto_clicker_level', 'threshold': 1},
+    {'id': 'max_click_power', 'name': 'Party in the Back', 'description': 'Max out Click Power',
+     'stat': 'click_power_level', 'threshold': 5},
+    {'id': 'levi_unleashed', 'name': 'Levi Unleashed', 'description': 'Release the Levi',
+     'stat': 'stage_2_unlock_level', 'threshold': 1},
+]
+ACHIEVEMENT_TOAST_TIME = 3.0  # seconds an unlocked achievement is shown
+
 # Animation settings
 ANIMATION_DURATION = 500  # milliseconds
 CLICK_ANIMATION_SCALE = 1.2
 PURCHASE_ANIMATION_DURATION = 300  # milliseconds
 
+# Idle settings
+IDLE_ENABLED = True  # Sleep until input or the next visible change when nothing is animating
+IDLE_MAX_WAIT = 5.0  # Longest time in seconds to sleep without redrawing
+TEXT_REFRESH_INTERVAL = 100  # milliseconds between checks of the stat texts
+
+# Timed event settings
+AUTOSAVE_INTERVAL = 30  # seconds of game time between autosaves
+
+# Click rate settings
+CLICK_RATE_WINDOWS = (1, 10, 60)  # Sliding windows in seconds; the first is shown on screen
+CLICK_RATE_BUCKETS = 20  # Buckets per window
+MACRO_DETECTION_ENABLED = True
+MACRO_SAMPLES = 30  # Click intervals looked at by each check
+MACRO_MAX_CV = 0.05  # Interval standard deviation / mean below this is too regular to be human
+MACRO_MAX_RATE = 25  # Clicks per second above this are too fast to be human
+MACRO_RESET_GAP = 2.0  # seconds without clicks that start a new streak
+
+# Stats settings
+STATS_INTERVAL = 1.0  # seconds of game time between samples
+STATS_LEVELS = [  # (seconds per point, points kept), finest first
+    (1, 600),  # 10 minutes per second
+    (60, 1440),  # 24 hours per minute
+    (3600, 720),  # 30 days per hour
+]
+STATS_GRAPH_RANGES = [('10m', 600), ('24h', 86400), ('30d', 2592000)]  # (label, seconds) shown by the graph
+STATS_GRAPH_KEY = 'f5'  # Cycles the graph's time range; clicking the graph cycles the stat
+
 # Sound settings
 SOUND_ENABLED = True
-SOUND_VOLUME = 0.5
\ No newline at end of file
+SOUND_VOLUME = 0.5
+SOUND_BUFFER_SIZE = 512  # Mixer buffer in samples; smaller means lower latency
+SOUND_CHANNELS = 16  # Total mixer channels
+SOUND_RESERVED_CHANNELS = 8  # Channels reserved for the sound manager's effect pool
+SOUND_DEFAULT_LIMITS = {'max_voices': 2, 'min_interval': 0.0}
+SOUND_LIMITS = {
+    # Rapid clicking would otherwise start a new voice every click
+    'click': {'max_voices': 3, 'min_interval': 0.04},  # min_interval in seconds
+}
+
+# Server settings
+SERVER_HOST = '127.0.0.1'
+SERVER_PORT = 8765
+SERVER_TICK_INTERVAL = 0.1  # seconds between scheduler ticks (income and state diffs)
+SERVER_MAX_WRITE_BUFFER = 64 * 1024  # bytes queued for a client before its diffs are held back
+SERVER_SESSION_TTL = 3600  # seconds a disconnected session is kept for the client to resume
+SERVER_MAX_SESSIONS = 100000  # sessions kept at once; the longest disconnected is dropped for a new one
+
+# Random number settings
+RNG_SEED = None  # Set to an integer for reproducible effects and simulations
+
+# Profiler settings
+PROFILER_ENABLED = True
+PROFILER_WINDOW = 300  # Frames used for rolling percentiles
+PROFILER_TRACE_LENGTH = 36000  # Frames kept for CSV dumps (10 minutes at 60 FPS)
+PROFILER_OVERLAY_REFRESH = 0.5  # seconds
+PROFILER_TOGGLE_KEY = 'f3'
+PROFILER_DUMP_KEY = 'f4'
+PROFILER_TRACE_FILE = 'frame_trace.csv'
+STARTUP_REPORT = True  # Print a startup time breakdown after the first frame
+
+# Analytics settings
+ANALYTICS_ENABLED = True  # Log session events for python -m src.utils.analytics_report
+ANALYTICS_FILE = 'analytics.log'  # Relative to the project directory
+ANALYTICS_CAPACITY = 262144  # Events kept before the oldest are overwritten (24 bytes each)
+ANALYTICS_FRAME_SAMPLE_INTERVAL = 60  # Frames between frame time samples
+
+# Leaderboard settings
+LEADERBOARD_FILE = 'leaderboard.db'  # Relative to the project directory
+LEADERBOARD_SIZE = 10  # Runs shown on the leaderboard
+
+# Asset settings
+ASSET_MANIFEST = 'manifest.json'  # Relative to the assets directory
+ATLAS_ENABLED = True  # Pack manifest images into one texture atlas
+ATLAS_IMAGE = 'atlas.png'  # Generated in the assets directory
+ATLAS_INDEX = 'atlas.json'  # Generated in the assets directory
+ATLAS_PADDING = 2  # Pixels between sprites
+ATLAS_MAX_WIDTH = 1024
@@ -0,0 +1 @@
+# Moving entities package
\ No newline at end of file
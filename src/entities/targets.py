@@ -0,0 +1,202 @@
+"""
+Moving click targets (Levi) for the clicker game.
+"""
+
+from array import array
+import pygame
+from src.config import (SCREEN_WIDTH, LEVI_SIZE, LEVI_SPEED_MIN, LEVI_SPEED_MAX,
+                        LEVI_MIN_Y, LEVI_MAX_Y, LEVI_OFFSCREEN_MARGIN, LEVI_POOL_SIZE)
+
+class TargetPool:
+    """
+    A fixed-capacity pool of moving targets stored as parallel arrays.
+    
+    Live targets are packed into the first `count` slots of the position
+    and velocity arrays. Spawning fills the next slot and removing a
+    target moves the last live target into its slot, so neither allocates
+    and updates walk one contiguous range.
+    
+    Clicks are hit-tested against a uniform grid whose cells are the size
+    of a target. The grid is rebuilt at most once per frame, and only when
+    a click needs it, so a hit test checks the few targets near the click
+    instead of every target.
+    """
+    def __init__(self, capacity=LEVI_POOL_SIZE, size=LEVI_SIZE):
+        """
+        Initialize the pool.
+        
+        Args:
+            capacity (int, optional): The maximum number of live targets.
+            size (tuple, optional): The size (width, height) of a target.
+        """
+        self.capacity = capacity
+        self.width, self.height = size
+        self.xs = array('d', bytes(8 * capacity))  # Left edges
+        self.ys = array('d', bytes(8 * capacity))  # Top edges
+        self.vxs = array('d', bytes(8 * capacity))  # Horizontal speeds in pixels per second
+        self.count = 0
+        self.grid = {}  # Dictionary of (column, row) -> list of slots
+        self.grid_dirty = True
+    
+    def __len__(self):
+        """Get the number of live targets."""
+        return self.count
+    
+    def spawn(self, rng):
+        """
+        Spawn a target at the left or right edge, moving across the screen.
+        
+        Args:
+            rng (random.Random): The random stream to draw from.
+        
+        Returns:
+            int: The slot of the new target, or -1 if the pool is full.
+        """
+        if self.count >= self.capacity:
+            return -1
+        
+        speed = rng.uniform(LEVI_SPEED_MIN, LEVI_SPEED_MAX)
+        if rng.random() < 0.5:
+            x, vx = -LEVI_OFFSCREEN_MARGIN, speed
+        else:
+            x, vx = SCREEN_WIDTH + LEVI_OFFSCREEN_MARGIN, -speed
+        
+        slot = self.count
+        self.xs[slot] = x
+        self.ys[slot] = rng.uniform(LEVI_MIN_Y, LEVI_MAX_Y)
+        self.vxs[slot] = vx
+        self.count += 1
+        self.grid_dirty = True
+        return slot
+    
+    def remove(self, slot):
+        """
+        Remove a target by moving the last live target into its slot.
+        
+        Args:
+            slot (int): The slot of the target to remove.
+        """
+        last = self.count - 1
+        if slot != last:
+            self.xs[slot] = self.xs[last]
+            self.ys[slot] = self.ys[last]
+            self.vxs[slot] = self.vxs[last]
+        self.count = last
+        self.grid_dirty = True
+    
+    def clear(self):
+        """Remove every target."""
+        self.count = 0
+        self.grid_dirty = True
+    
+    def update(self, dt):
+        """
+        Move every target and remove those that left the screen.
+        
+        Args:
+            dt (float): The time elapsed since the last update in seconds.
+        
+        Returns:
+            int: The number of targets removed.
+        """
+        xs = self.xs
+        vxs = self.vxs
+        left = -LEVI_OFFSCREEN_MARGIN
+        right = SCREEN_WIDTH + LEVI_OFFSCREEN_MARGIN
+        removed = 0
+        
+        slot = 0
+        while slot < self.count:
+            x = xs[slot] + vxs[slot] * dt
+            xs[slot] = x
+            if (x > right and vxs[slot] > 0) or (x < left and vxs[slot] < 0):
+                self.remove(slot)
+                removed += 1
+                continue  # The moved-in target still has to be updated
+            slot += 1
+        
+        if self.count:
+            self.grid_dirty = True
+        return removed
+    
+    def rebuild_grid(self):
+        """Bucket every live target into the grid cell of its top-left corner."""
+        grid = {}
+        width = self.width
+        height = self.height
+        xs = self.xs
+        ys = self.ys
+        for slot in range(self.count):
+            cell = (int(xs[slot] // width), int(ys[slot] // height))
+            bucket = grid.get(cell)
+            if bucket is None:
+                grid[cell] = [slot]
+            else:
+                bucket.append(slot)
+        self.grid = grid
+        self.grid_dirty = False
+    
+    def hit_test(self, position):
+        """
+        Find the target under a point.
+        
+        A target covers at most one cell width and height, so only the
+        point's cell and the cells to its left and above can hold a target
+        that contains it.
+        
+        Args:
+            position (tuple): The point (x, y) to test.
+        
+        Returns:
+            int: The slot of the topmost target under the point, or -1 if none.
+        """
+        if not self.count:
+            return -1
+        if self.grid_dirty:
+            self.rebuild_grid()
+        
+        px, py = position
+        width = self.width
+        height = self.height
+        column = int(px // width)
+        row = int(py // height)
+        xs = self.xs
+        ys = self.ys
+        grid = self.grid
+        
+        # Later slots are drawn on top
+        hit = -1
+        for cell in ((column, row), (column - 1, row), (column, row - 1), (column - 1, row - 1)):
+            for slot in grid.get(cell, ()):
+                if slot > hit and xs[slot] <= px < xs[slot] + width and ys[slot] <= py < ys[slot] + height:
+                    hit = slot
+        return hit
+    
+    def positions(self):
+        """
+        Get the top-left position of every live target.
+        
+        Returns:
+            list: The positions (x, y), in slot order.
+        """
+        return list(zip(self.xs[:self.count], self.ys[:self.count]))
+    
+    def render(self, surface, image, color):
+        """
+        Draw every target.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            image (pygame.Surface): The target image, or None to draw a placeholder.
+            color (tuple): The placeholder color (R, G, B).
+        """
+        xs = self.xs
+        ys = self.ys
+        if image is not None:
+            surface.blits([(image, (xs[slot], ys[slot])) for slot in range(self.count)], False)
+            return
+        
+        radius = min(self.width, self.height) // 2
+        for slot in range(self.count):
+            center = (int(xs[slot]) + self.width // 2, int(ys[slot]) + self.height // 2)
+            pygame.draw.circle(surface, color, center, radius)
\ No newline at end of file
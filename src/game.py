@@ -5,45 +5,126 @@ Main game class for the clicker game.
 import pygame
 import sys
 import time
-import random
-from src.config import COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, CLICK_AREA_POSITION, CLICK_AREA_SIZE
+from concurrent.futures import ThreadPoolExecutor
+from src.config import (COLORS, SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, CLICK_AREA_POSITION, CLICK_AREA_SIZE,
+                        CLICK_PARTICLES, MAX_CLICK_PARTICLES_PER_FRAME,
+                        PROFILER_ENABLED, PROFILER_TOGGLE_KEY, PROFILER_DUMP_KEY, PROFILER_TRACE_FILE,
+                        STARTUP_REPORT, AUTOSAVE_INTERVAL, FULLSCREEN, FULLSCREEN_TOGGLE_KEY,
+                        LEVI_VALUE, LEVI_SIZE, LEVI_SPAWN_MIN_TIME, LEVI_SPAWN_MAX_TIME, WIN_AMOUNT,
+                        IDLE_ENABLED, IDLE_MAX_WAIT, TEXT_REFRESH_INTERVAL, ACHIEVEMENT_TOAST_TIME,
+                        STATS_GRAPH_RANGES, STATS_GRAPH_KEY, ANALYTICS_ENABLED, ANALYTICS_FRAME_SAMPLE_INTERVAL,
+                        CLICK_RATE_WINDOWS, MACRO_DETECTION_ENABLED, CONTENT_PACKS_ENABLED)
 from src.models.player import Player
 from src.models.upgrade import create_upgrades_from_config
+from src.models.achievement import AchievementTracker, create_achievements_from_config, upgrade_stat
+from src.models.unlocks import UnlockGraph, achievement_stat
 from src.models.currency import Currency
+from src.entities.targets import TargetPool
 from src.ui.button import Button
 from src.ui.panel import Panel
+from src.ui.graph import GraphPanel
 from src.ui.text import Text, DynamicText, draw_text
+from src.ui.viewport import Viewport
 from src.utils.save_manager import SaveManager
-from src.utils.helpers import create_particle, update_particle, render_particle
+from src.utils.scheduler import Scheduler
+from src.utils.stats import StatsRecorder
+from src.utils.analytics import AnalyticsLog, CLICKS, PURCHASE, LEVI_CAUGHT, MACRO
+from src.utils.click_rate import ClickRateTracker, MacroDetector
+from src.utils.texture_atlas import SpriteBatch, sprite_key
+from src.utils.asset_manager import AssetManager
+from src.utils.sound_manager import SoundManager
+from src.utils.helpers import (init_subsystems, create_particle_burst, create_text_particle,
+                               update_particle, render_particle)
+from src.utils.profiler import FrameProfiler
+from src.utils.rng import RandomService
 
 class Game:
     """
     Main game class that manages the game state and coordinates between different modules.
     """
-    def __init__(self):
-        """Initialize the game."""
-        # Initialize Pygame
-        pygame.init()
-        pygame.font.init()
-        pygame.mixer.init()
-        
-        # Create the window
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(self, startup_timer=None, rng=None, save_manager=None, analytics=None, content_packs=None):
+        """
+        Initialize the game.
+        
+        Args:
+            startup_timer (StartupTimer, optional): Timer to report time-to-first-frame to.
+            rng (RandomService, optional): The random streams to use; seeded from RNG_SEED by default.
+            save_manager (SaveManager, optional): Where to save to; the default save file if None.
+            analytics (AnalyticsLog, optional): The log to record session events to. If None,
+                run() opens the default log when ANALYTICS_ENABLED is set.
+            content_packs (list, optional): The ContentPack objects to add upgrades from once the
+                first frame is shown. If None, the packs in CONTENT_PACKS_DIR are used when
+                CONTENT_PACKS_ENABLED is set.
+        """
+        # Initialize the pygame subsystems we need; the mixer starts on first sound
+        init_subsystems()
+        self.startup_timer = startup_timer
+        
+        # Create the window; the game draws at SCREEN_WIDTH x SCREEN_HEIGHT and is scaled to fit it
+        self.viewport = Viewport(fullscreen=FULLSCREEN)
+        self.screen = self.viewport.surface
+        self.fullscreen_key = pygame.key.key_code(FULLSCREEN_TOGGLE_KEY)
         pygame.display.set_caption(TITLE)
         
         # Set up the clock
         self.clock = pygame.time.Clock()
         self.running = True
         
+        # Frame-time profiler
+        self.profiler = FrameProfiler(enabled=PROFILER_ENABLED)
+        self.profiler_toggle_key = pygame.key.key_code(PROFILER_TOGGLE_KEY)
+        self.profiler_dump_key = pygame.key.key_code(PROFILER_DUMP_KEY)
+        self.graph_key = pygame.key.key_code(STATS_GRAPH_KEY)
+        
         # Game state
-        self.player = Player()
+        self.rng = rng or RandomService()
+        self.game_time = 0.0  # Seconds of game time, advanced by update()
+        self.analytics = analytics
+        self.save_manager = save_manager or SaveManager()
+        save_data = self.save_manager.load_game() or {}
+        self.player = Player.from_dict(save_data.get('player', {}), clock=self.get_game_time)
+        self.achievements = AchievementTracker(create_achievements_from_config(),
+                                               save_data.get('achievements', []))
+        self.achievements.update_many(self.get_progress_stats())  # Catch up with the restored stats
         self.upgrades = create_upgrades_from_config()
-        self.save_manager = SaveManager()
+        self.upgrade_codes = {upgrade_id: code for code, upgrade_id in enumerate(self.upgrades)}  # For the analytics log
+        self.unlocks = UnlockGraph(self.upgrades, self.achievements.achievements)
+        self.unlocks.update_many(self.get_progress_stats())
+        if content_packs is None and not CONTENT_PACKS_ENABLED:
+            content_packs = []
+        self.content_packs = content_packs  # Packs not yet being loaded; None for the default packs
+        self.pack_loader = None  # Future of the content packs being loaded in the background
+        self.leaderboard = None  # Opened on the first win
+        self.run_start_time = None  # Game time of the first click
+        self.won = False
+        self.stats = StatsRecorder(gauges=('currency',), counters=('income', 'clicks'))
+        self.click_rate = ClickRateTracker(detector=MacroDetector() if MACRO_DETECTION_ENABLED else None)
+        
+        # Timed events (spawns, buffs, autosaves) run from the game clock
+        self.scheduler = Scheduler()
+        self.autosave_timer = self.scheduler.schedule(AUTOSAVE_INTERVAL, self.autosave, repeat=True)
+        
+        # Start loading assets in the background so drawing never waits on disk
+        self.assets = AssetManager()
+        self.assets.preload()
+        self.sounds = SoundManager(self.assets)
         
         # UI elements
         self.ui_elements = []
         self.particles = []
         
+        # Stage 2 moving targets
+        self.levis = TargetPool()
+        self.levi_timer = None
+        if any(upgrade.effect == 'stage_2_unlock' and self.player.get_upgrade_level(upgrade_id)
+               for upgrade_id, upgrade in self.upgrades.items()):
+            self.spawn_levi()  # A restored game already reached stage 2
+        self.sprite_batch = None  # Draws sprites from the texture atlas
+        
+        # Achievement unlock notice
+        self.toast = None
+        self.toast_timer = None
+        
         # Initialize the game
         self.initialize()
     
@@ -58,7 +139,8 @@ class Game:
             (SCREEN_WIDTH // 2, 50),
             COLORS['text'],
             'large',
-            centered=True
+            centered=True,
+            update_interval=TEXT_REFRESH_INTERVAL
         )
         self.ui_elements.append(self.currency_text)
         
@@ -68,7 +150,8 @@ class Game:
             (SCREEN_WIDTH // 2, 90),
             COLORS['text'],
             'medium',
-            centered=True
+            centered=True,
+            update_interval=TEXT_REFRESH_INTERVAL
         )
         self.ui_elements.append(self.click_power_text)
         
@@ -78,10 +161,22 @@ class Game:
             (SCREEN_WIDTH // 2, 120),
             COLORS['text'],
             'medium',
-            centered=True
+            centered=True,
+            update_interval=TEXT_REFRESH_INTERVAL
         )
         self.ui_elements.append(self.auto_click_text)
         
+        # Create the live click rate display
+        self.click_rate_text = DynamicText(
+            lambda: f"Clicks/s: {self.get_click_rate():.1f}",
+            (SCREEN_WIDTH // 2, 150),
+            COLORS['text'],
+            'medium',
+            centered=True,
+            update_interval=TEXT_REFRESH_INTERVAL
+        )
+        self.ui_elements.append(self.click_rate_text)
+        
         # Create the shop panel
         self.shop_panel = Panel(
             pygame.Rect(SCREEN_WIDTH - 250, 50, 200, SCREEN_HEIGHT - 100),
@@ -89,31 +184,292 @@ class Game:
         )
         
         # Create upgrade buttons
-        y_offset = 20
-        for upgrade_id, upgrade in self.upgrades.items():
-            level = self.player.get_upgrade_level(upgrade_id)
-            
-            # Check if the upgrade is at max level
-            is_max_level = upgrade.max_level is not None and level >= upgrade.max_level
-            
-            # Create button text based on level
-            if is_max_level:
-                button_text = f"{upgrade.name} (Lvl {level})\nMAX LEVEL"
-            else:
-                button_text = f"{upgrade.name}{' (Lvl ' + str(level) + ')' if level > 0 else ''}\nCost: {upgrade.get_cost(level)}"
+        self.upgrade_buttons = {}  # Dictionary of upgrade_id -> Button
+        self.add_upgrade_buttons(self.upgrades)
+        
+        self.ui_elements.append(self.shop_panel)
+        
+        # Create the stats graph
+        self.graph_panel = GraphPanel(
+            pygame.Rect(30, 380, 240, 180),
+            [("Income/s", self.stats.series['income']),
+             ("Mullet Bucks", self.stats.series['currency']),
+             ("Clicks/s", self.stats.series['clicks'])],
+            STATS_GRAPH_RANGES
+        )
+        self.ui_elements.append(self.graph_panel)
+    
+    def get_game_time(self):
+        """
+        Get the game time, used as the player's income clock.
+        
+        Returns:
+            float: The seconds of game time elapsed.
+        """
+        return self.game_time
+    
+    def handle_win(self):
+        """Record the run time on the leaderboard and show it."""
+        self.won = True
+        run_time = self.game_time - self.run_start_time
+        
+        from src.utils.leaderboard import Leaderboard, format_time  # sqlite3 is only needed once the game is won
+        if self.leaderboard is None:
+            self.leaderboard = Leaderboard()
+        self.leaderboard.add_score(run_time)
+        rank = self.leaderboard.get_rank(run_time)
+        
+        self.particles.append(create_text_particle(
+            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
+            f"You win! {format_time(run_time)} (#{rank})",
+            COLORS['positive']
+        ))
+    
+    def get_idle_timeout(self):
+        """
+        Get how long the game can sleep before the screen has to change.
+        
+        Returns:
+            float: The time in seconds until the next visible change, or None
+                if something is animating and every frame must be drawn.
+        """
+        if self.particles or self.levis.count or self.profiler.overlay_visible or self.get_click_rate():
+            return None
+        
+        timeout = IDLE_MAX_WAIT
+        for delay in (self.player.time_to_next_unit(), self.scheduler.time_until_next()):
+            if delay is not None and delay < timeout:
+                timeout = delay
+        
+        # Changes faster than the stat texts refresh count as animation
+        if timeout < TEXT_REFRESH_INTERVAL / 1000:
+            return None
+        return timeout
+    
+    def wait_for_activity(self, timeout):
+        """
+        Sleep until an event arrives or the timeout passes.
+        
+        The event that ends the wait is put back on the queue, so the next
+        frame handles it as usual.
+        
+        Args:
+            timeout (float): The longest time to sleep in seconds.
+        """
+        event = pygame.event.wait(int(timeout * 1000))
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+    
+    def get_click_rate(self):
+        """
+        Get the clicks per second over the shortest click rate window.
+        
+        Returns:
+            float: The recent click rate.
+        """
+        return self.click_rate.rate(CLICK_RATE_WINDOWS[0], time.perf_counter())
+    
+    def handle_macro(self):
+        """Warn about clicks that look automated and log them."""
+        reason = self.click_rate.detector.reason
+        self.show_toast("Those clicks look automated!")
+        if self.analytics is not None:
+            self.analytics.log(MACRO, code=1 if reason == 'rate' else 2)
+    
+    def sample_stats(self):
+        """
+        Get the values recorded by the stats.
+        
+        Returns:
+            dict: The current currency and the income and click counters.
+        """
+        return {
+            'currency': self.player.currency,
+            'income': self.player.currency_earned,
+            'clicks': self.player.total_clicks,
+        }
+    
+    def add_upgrade_buttons(self, upgrade_ids):
+        """
+        Add shop buttons for upgrades, below the existing ones.
+        
+        The shop does not scroll, so upgrades past the bottom get no button.
+        
+        Args:
+            upgrade_ids (iterable): The IDs of the upgrades to add.
+        """
+        y_offset = 20 + 100 * len(self.upgrade_buttons)
+        for upgrade_id in upgrade_ids:
+            if y_offset + 80 > self.shop_panel.rect.height:
+                break
             
             # Create a button for each upgrade
             upgrade_button = Button(
                 pygame.Rect(10, y_offset, 180, 80),
-                button_text,
-                lambda id=upgrade_id: self.purchase_upgrade(id),
-                disabled=is_max_level,
-                max_level=is_max_level
+                self.upgrades[upgrade_id].name,
+                lambda id=upgrade_id: self.purchase_upgrade(id)
             )
             self.shop_panel.add_element(upgrade_button)
+            self.upgrade_buttons[upgrade_id] = upgrade_button
+            self.refresh_upgrade_button(upgrade_id)
             y_offset += 100
+    
+    def start_loading_content_packs(self):
+        """
+        Start finding, parsing and checking the content packs on a background thread.
         
-        self.ui_elements.append(self.shop_panel)
+        This is done once the first frame is shown, so packs never delay
+        startup or hold up a frame; run() adds the upgrades to the shop when
+        the thread is done.
+        """
+        if self.content_packs == [] or self.pack_loader is not None:
+            return
+        
+        from src.utils.content_packs import load_pack_upgrades  # Kept off the startup path
+        packs, self.content_packs = self.content_packs, []
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='content-packs')
+        self.pack_loader = executor.submit(load_pack_upgrades, self.upgrades, packs,
+                                           list(self.achievements.achievements))
+        executor.shutdown(wait=False)  # The thread exits once the packs are loaded
+    
+    def add_loaded_content_packs(self):
+        """
+        Add the upgrades of the background content pack load to the shop.
+        
+        Waits for the load if it has not finished yet.
+        """
+        loader, self.pack_loader = self.pack_loader, None
+        upgrades, unlocks = loader.result()
+        if unlocks is None:
+            return
+        
+        count = len(self.upgrades)
+        added = list(upgrades)[count:]
+        self.upgrades.update((upgrade_id, upgrades[upgrade_id]) for upgrade_id in added)
+        self.upgrade_codes.update((upgrade_id, count + index) for index, upgrade_id in enumerate(added))
+        
+        # Meet the prerequisites the player has already reached
+        self.unlocks = unlocks
+        self.unlocks.update_many(self.get_progress_stats())
+        self.add_upgrade_buttons(added)
+    
+    def load_content_packs(self):
+        """
+        Load the content packs now, e.g. when a purchase asks for an upgrade that is not loaded.
+        """
+        self.start_loading_content_packs()
+        if self.pack_loader is not None:
+            self.add_loaded_content_packs()
+    
+    def get_progress_stats(self):
+        """
+        Get every stat achievements and upgrade prerequisites are tracked by.
+        
+        Returns:
+            dict: A dictionary of stat -> current value.
+        """
+        stats = {
+            'total_clicks': self.player.total_clicks,
+            'currency_earned': self.player.currency_earned,
+        }
+        stats.update((upgrade_stat(upgrade_id), level) for upgrade_id, level in self.player.owned_upgrades.items())
+        stats.update((achievement_stat(achievement_id), 1) for achievement_id in self.achievements.unlocked)
+        return stats
+    
+    def autosave(self):
+        """Save the game in the background of play."""
+        self.save_manager.save_game(self.player, self.upgrades, self.achievements)
+        if self.analytics is not None:
+            self.analytics.flush()
+    
+    def update_progress(self, stats):
+        """
+        Unlock the achievements and upgrades reached by changed stats.
+        
+        Only the buttons of upgrades with a prerequisite that has just been
+        met are refreshed.
+        
+        Args:
+            stats (dict): A dictionary of stat -> current value.
+        """
+        changed = self.unlocks.update_many(stats)
+        unlocked = self.achievements.update_many(stats)
+        if unlocked:
+            changed.extend(self.unlocks.update_many(
+                {achievement_stat(achievement.id): 1 for achievement in unlocked}))
+        for upgrade_id in dict.fromkeys(changed):
+            self.refresh_upgrade_button(upgrade_id)
+        if not unlocked:
+            return
+        
+        names = ", ".join(achievement.name for achievement in unlocked)
+        self.show_toast(f"Achievement unlocked: {names}")
+        self.autosave()
+    
+    def describe_requirement(self, stat, value):
+        """
+        Describe an unmet upgrade prerequisite for a button.
+        
+        Args:
+            stat (str): The stat the prerequisite is on.
+            value (int): The value the stat has to reach.
+        
+        Returns:
+            str: A short description, e.g. "Click Power Lvl 2".
+        """
+        if stat.startswith('achievement:'):
+            return self.achievements.achievements[stat[len('achievement:'):]].name
+        if stat == 'currency_earned':
+            return f"{Currency.format(value)} earned"
+        if stat == 'total_clicks':
+            return f"{value} clicks"
+        return f"{self.upgrades[stat[:-len('_level')]].name} Lvl {value}"
+    
+    def refresh_upgrade_button(self, upgrade_id):
+        """
+        Update an upgrade button's label and state to the upgrade's level and prerequisites.
+        
+        Args:
+            upgrade_id (str): The ID of the upgrade.
+        """
+        upgrade = self.upgrades[upgrade_id]
+        element = self.upgrade_buttons.get(upgrade_id)
+        if element is None:
+            return
+        
+        level = self.player.get_upgrade_level(upgrade_id)
+        missing = self.unlocks.missing(upgrade_id)
+        
+        # Check if the upgrade is at max level
+        if upgrade.max_level is not None and level >= upgrade.max_level:
+            element.set_text(f"{upgrade.name} (Lvl {level})\nMAX LEVEL")
+            element.set_max_level(True)
+            element.set_disabled(True)
+        elif missing:
+            needs = ", ".join(self.describe_requirement(stat, value) for stat, value in missing.items())
+            element.set_text(f"{upgrade.name}\nNeeds {needs}")
+            element.set_disabled(True)
+        else:
+            element.set_text(f"{upgrade.name}{' (Lvl ' + str(level) + ')' if level > 0 else ''}\n"
+                             f"Cost: {upgrade.get_cost(level)}")
+            element.set_disabled(False)
+    
+    def show_toast(self, message):
+        """
+        Show a message under the stats for ACHIEVEMENT_TOAST_TIME seconds.
+        
+        Args:
+            message (str): The message to show.
+        """
+        if self.toast_timer is not None:
+            self.scheduler.cancel(self.toast_timer)
+        self.toast = Text(message, (SCREEN_WIDTH // 2, 180), COLORS['highlight'], 'medium', centered=True)
+        self.toast_timer = self.scheduler.schedule(ACHIEVEMENT_TOAST_TIME, self.hide_toast)
+    
+    def hide_toast(self):
+        """Remove the message shown by show_toast."""
+        self.toast = None
+        self.toast_timer = None
     
     def update(self, dt):
         """
@@ -122,21 +478,36 @@ class Game:
         Args:
             dt (float): The time elapsed since the last update in seconds.
         """
-        # Process auto clicks
-        if self.player.auto_click_power > 0:
-            self.player.auto_click(dt)
+        # Auto click income is evaluated lazily from the game time
+        self.game_time += dt
+        
+        # Move Levis, then run timed events that are due so new spawns start at the edge
+        self.levis.update(dt)
+        self.scheduler.update(dt)
+        
+        # Record the stats for every second that has passed
+        self.stats.update(self.game_time, self.sample_stats)
+        
+        # Auto income raises the earned total without any event
+        if self.player.auto_click_power:
+            self.update_progress({'currency_earned': self.player.currency_earned})
+        
+        # Check for the win condition
+        if not self.won and self.run_start_time is not None and self.player.currency >= WIN_AMOUNT:
+            self.handle_win()
         
         # Update UI elements
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.viewport.to_logical(pygame.mouse.get_pos())
         for element in self.ui_elements:
             if hasattr(element, 'update'):
                 if isinstance(element, DynamicText):
-                    element.update(dt)
+                    element.update(dt * 1000)  # DynamicText counts in milliseconds
                 else:
                     element.update(mouse_pos)
         
         # Update particles
-        self.particles = [p for p in self.particles if update_particle(p, dt)]
+        with self.profiler.section('particles_update'):
+            self.particles = [p for p in self.particles if update_particle(p, dt)]
     
     def render(self):
         """Render the game state."""
@@ -162,30 +533,90 @@ class Game:
             if hasattr(element, 'render'):
                 element.render(self.screen)
         
+        # Draw Levis from the texture atlas in one batch, or a placeholder until it has loaded
+        if self.levis.count:
+            atlas = self.assets.atlas
+            if atlas is not None and sprite_key('levi', LEVI_SIZE) in atlas:
+                if self.sprite_batch is None or self.sprite_batch.atlas is not atlas:
+                    self.sprite_batch = SpriteBatch(atlas)
+                self.sprite_batch.add_many('levi', LEVI_SIZE, self.levis.positions())
+                self.sprite_batch.draw(self.screen)
+            else:
+                self.levis.render(self.screen, self.assets.peek('image', 'levi', LEVI_SIZE), COLORS['levi'])
+        
         # Draw particles
-        for particle in self.particles:
-            render_particle(self.screen, particle)
+        with self.profiler.section('particles_render'):
+            for particle in self.particles:
+                render_particle(self.screen, particle)
+        
+        # Draw the achievement notice
+        if self.toast is not None:
+            self.toast.render(self.screen)
+        
+        # Draw the profiler overlay
+        self.profiler.render_overlay(self.screen)
         
-        # Update the display
-        pygame.display.flip()
+        # Scale the changed parts of the frame to the window
+        with self.profiler.section('flip'):
+            self.viewport.present()
     
     def handle_events(self):
-        """Handle pygame events."""
+        """
+        Handle pygame events.
+        
+        Clicks on the click area are collected and processed as one batch,
+        so a burst of clicks in a single frame costs one player update and
+        a capped number of particles. Pending clicks are flushed before any
+        other mouse button press so purchases see the up-to-date currency.
+        Mouse positions are mapped from the window to the logical screen first.
+        """
+        clicks = []
+        
         for event in pygame.event.get():
+            event = self.viewport.map_event(event)
+            
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                # Levis fly over everything else
+                slot = self.levis.hit_test(event.pos)
+                if slot >= 0:
+                    self.catch_levi(slot, event.pos)
+                    continue
+                
+                # Collect left clicks on the click area
+                if self.click_area.collidepoint(event.pos):
+                    clicks.append(event.pos)
+                    continue
+            
+            # Credit pending clicks before anything else is clicked, e.g. a shop button
+            if clicks and event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_clicks(clicks)
+                clicks = []
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
-            # Handle mouse clicks
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left mouse button
-                    # Check if the click area was clicked
-                    if self.click_area.collidepoint(event.pos):
-                        self.handle_click(event.pos)
+            # Follow window resizes
+            elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWEXPOSED):
+                self.viewport.handle_event(event)
+            
+            # Handle fullscreen and profiler hotkeys
+            elif event.type == pygame.KEYDOWN:
+                if event.key == self.fullscreen_key:
+                    self.viewport.toggle_fullscreen()
+                elif event.key == self.graph_key:
+                    self.graph_panel.cycle_range()
+                elif event.key == self.profiler_toggle_key:
+                    self.profiler.toggle_overlay()
+                elif event.key == self.profiler_dump_key:
+                    self.profiler.dump_csv(PROFILER_TRACE_FILE)
             
             # Pass events to UI elements
             for element in self.ui_elements:
                 if hasattr(element, 'handle_event'):
                     element.handle_event(event)
+        
+        if clicks:
+            self.handle_clicks(clicks)
     
     def handle_click(self, position):
         """
@@ -194,42 +625,86 @@ class Game:
         Args:
             position (tuple): The position (x, y) of the click.
         """
-        # Process the click
-        gained = self.player.click()
+        self.handle_clicks([position])
+    
+    def handle_clicks(self, positions):
+        """
+        Handle a batch of clicks on the click area.
         
-        # Create particles for visual feedback
-        for _ in range(5):
-            particle = create_particle(
-                position,
-                COLORS['highlight'],
-                size=random.randint(3, 8),
-                lifetime=random.uniform(0.5, 1.5)
-            )
-            self.particles.append(particle)
-        
-        # Create a text particle showing the gained amount
-        text_particle = {
-            'position': list(position),
-            'velocity': [0, -50],
-            'text': f"+{gained}",
-            'color': COLORS['positive'],
-            'size': 16,
-            'lifetime': 1.0,
-            'creation_time': time.time()
-        }
+        Args:
+            positions (list): The positions (x, y) of the clicks, oldest first.
+        """
+        # The speedrun timer starts with the first click
+        if self.run_start_time is None:
+            self.run_start_time = self.game_time
+        
+        # Process all clicks with a single player update
+        count = len(positions)
+        gained = self.player.click(count)
+        self.sounds.play('click')
+        if self.analytics is not None:
+            self.analytics.log(CLICKS, count=count, value=gained)
+        if self.click_rate.record(time.perf_counter(), count):
+            self.handle_macro()
+        self.update_progress({
+            'total_clicks': self.player.total_clicks,
+            'currency_earned': self.player.currency_earned,
+        })
+        
+        # Create particles for visual feedback, capped and spread across the clicks
+        particle_count = min(count * CLICK_PARTICLES, MAX_CLICK_PARTICLES_PER_FRAME)
+        self.particles.extend(create_particle_burst(
+            positions,
+            COLORS['highlight'],
+            particle_count,
+            self.rng.stream('particles')
+        ))
+        
+        # Create one text particle showing the total gained amount at the latest click
+        text_particle = create_text_particle(
+            positions[-1],
+            f"+{Currency.format(gained)}",
+            COLORS['positive']
+        )
         self.particles.append(text_particle)
     
+    def catch_levi(self, slot, position):
+        """
+        Handle a click on a Levi.
+        
+        Args:
+            slot (int): The Levi's slot in the target pool.
+            position (tuple): The position (x, y) of the click.
+        """
+        self.levis.remove(slot)
+        self.player.earn(LEVI_VALUE)
+        self.sounds.play('click')
+        if self.analytics is not None:
+            self.analytics.log(LEVI_CAUGHT, value=LEVI_VALUE)
+        self.update_progress({'currency_earned': self.player.currency_earned})
+        self.particles.append(create_text_particle(position, f"+{LEVI_VALUE}", COLORS['positive']))
+    
+    def spawn_levi(self):
+        """Spawn a Levi and schedule the next one."""
+        spawns = self.rng.stream('spawns')
+        self.levis.spawn(spawns)
+        delay = spawns.uniform(LEVI_SPAWN_MIN_TIME, LEVI_SPAWN_MAX_TIME)
+        self.levi_timer = self.scheduler.schedule(delay, self.spawn_levi)
+    
     def purchase_upgrade(self, upgrade_id):
         """
         Purchase an upgrade.
         
         Args:
             upgrade_id (str): The ID of the upgrade to purchase.
-            
+        
         Returns:
             bool: True if the purchase was successful, False otherwise.
         """
         upgrade = self.upgrades.get(upgrade_id)
+        if not upgrade and (self.content_packs != [] or self.pack_loader is not None):
+            self.load_content_packs()
+            upgrade = self.upgrades.get(upgrade_id)
         if not upgrade:
             return False
         
@@ -238,52 +713,90 @@ class Game:
             return False
         
         # Check if the upgrade is available
-        if not upgrade.is_available(self.player):
+        if not upgrade.is_available(self.player, self.unlocks):
             return False
         
         # Purchase the upgrade
+        cost = upgrade.get_cost()
         success = self.player.purchase_upgrade(upgrade)
         
         if success:
+            self.sounds.play('purchase')
+            if self.analytics is not None:
+                self.analytics.log(PURCHASE, code=self.upgrade_codes[upgrade_id],
+                                   count=self.player.get_upgrade_level(upgrade_id), value=cost)
+            
+            # Stage 2 releases the Levis
+            if upgrade.effect == 'stage_2_unlock' and self.levi_timer is None:
+                self.spawn_levi()
+            
             # Update the button text
-            for element in self.shop_panel.elements:
-                if isinstance(element, Button) and element.on_click.__name__ == f"<lambda>":
-                    # This is a bit of a hack to identify the button for this upgrade
-                    if element.on_click.__closure__[0].cell_contents == upgrade_id:
-                        level = self.player.get_upgrade_level(upgrade_id)
-                        
-                        # Check if the upgrade has reached its maximum level
-                        if upgrade.max_level is not None and level >= upgrade.max_level:
-                            element.set_text(f"{upgrade.name} (Lvl {level})\nMAX LEVEL")
-                            element.set_max_level(True)
-                            element.set_disabled(True)
-                        else:
-                            element.set_text(f"{upgrade.name} (Lvl {level})\nCost: {upgrade.get_cost(level)}")
+            self.refresh_upgrade_button(upgrade_id)
+            self.update_progress({upgrade_stat(upgrade_id): self.player.get_upgrade_level(upgrade_id)})
         
         return success
     
     def run(self):
         """Run the game loop."""
         last_time = time.time()
+        if self.analytics is None and ANALYTICS_ENABLED:
+            self.analytics = AnalyticsLog()
+        frame_count = 0
         
         while self.running:
             # Calculate delta time
             current_time = time.time()
             dt = current_time - last_time
             last_time = current_time
+            self.profiler.begin_frame()
             
             # Handle events
-            self.handle_events()
+            with self.profiler.section('handle_events'):
+                self.handle_events()
             
             # Update game state
-            self.update(dt)
+            with self.profiler.section('update'):
+                self.update(dt)
             
             # Render
-            self.render()
+            with self.profiler.section('render'):
+                self.render()
+            
+            self.profiler.end_frame()
+            
+            # Sample the time the frame took to handle, update and draw
+            frame_count += 1
+            if self.analytics is not None and frame_count % ANALYTICS_FRAME_SAMPLE_INTERVAL == 0:
+                self.analytics.log_frame(time.time() - current_time)
+            
+            # Report the startup time breakdown once the first frame is shown
+            if self.startup_timer is not None:
+                self.startup_timer.mark('first frame')
+                if STARTUP_REPORT:
+                    print(self.startup_timer.report())
+                self.startup_timer = None
+            
+            # Content pack upgrades are loaded in the background once the game is on screen
+            if self.content_packs != []:
+                self.start_loading_content_packs()
+            elif self.pack_loader is not None and self.pack_loader.done():
+                self.add_loaded_content_packs()
             
             # Cap the frame rate
             self.clock.tick(FPS)
+            
+            # Sleep while nothing is animating, until input or the next visible change
+            if IDLE_ENABLED and self.running:
+                timeout = self.get_idle_timeout()
+                if timeout is not None and timeout > 1 / FPS:
+                    self.wait_for_activity(timeout)
         
         # Clean up
+        self.autosave()
+        self.assets.shutdown()
+        if self.leaderboard is not None:
+            self.leaderboard.close()
+        if self.analytics is not None:
+            self.analytics.close()
         pygame.quit()
         sys.exit()
\ No newline at end of file
@@ -2,32 +2,46 @@
 Entry point for the clicker game.
 """
 
-import pygame
-import sys
 import os
-from src.game import Game
+from src.utils.startup import StartupTimer
 
 def main():
     """
     Main entry point for the game.
     
     This function initializes the game and starts the game loop.
+    pygame and the game are imported here rather than at module level so
+    that their cost shows up in the startup time breakdown; modules only
+    needed later, such as the leaderboard and content packs, are imported
+    by the game when first used.
     """
-    # Initialize pygame
-    pygame.init()
+    timer = StartupTimer()
     
     # Set up the environment
     setup_environment()
+    timer.mark('setup environment')
+    
+    # Import and initialize pygame; the mixer is started on first use by load_sound
+    from src.utils.helpers import init_subsystems
+    timer.mark('import pygame')
+    init_subsystems()
+    timer.mark('init pygame')
+    
+    # Import the game lazily
+    from src.game import Game
+    timer.mark('import game')
     
     # Create and run the game
-    game = Game()
+    game = Game(startup_timer=timer)
+    timer.mark('create game')
     game.run()
 
 def setup_environment():
     """
     Set up the environment for the game.
     
-    This function creates necessary directories and sets up the environment.
+    This function creates necessary directories and sets up the environment
+    pygame reads when the display is initialized.
     """
     # Get the base directory
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -38,12 +52,7 @@ def setup_environment():
         if not os.path.exists(dir_path):
             os.makedirs(dir_path)
     
-    # Set up pygame
-    pygame.display.init()
-    pygame.font.init()
-    pygame.mixer.init()
-    
-    # Set the window position (centered)
+    # Set the window position (centered); this must happen before the display is initialized
     os.environ['SDL_VIDEO_CENTERED'] = '1'
 
 if __name__ == "__main__":
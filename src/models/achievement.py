@@ -0,0 +1,192 @@
+"""
+Achievement system for the clicker game.
+"""
+
+import math
+from src.config import ACHIEVEMENTS
+
+def upgrade_stat(upgrade_id):
+    """
+    Get the stat name of an upgrade's level.
+    
+    Args:
+        upgrade_id (str): The ID of the upgrade.
+    
+    Returns:
+        str: The stat name, e.g. "click_power_level".
+    """
+    return f"{upgrade_id}_level"
+
+class Achievement:
+    """
+    Represents an achievement unlocked when a player stat reaches a threshold.
+    """
+    __slots__ = ('id', 'name', 'description', 'stat', 'threshold')
+    
+    def __init__(self, achievement_id, name, description, stat, threshold):
+        """
+        Initialize an achievement.
+        
+        Args:
+            achievement_id (str): The unique identifier for the achievement.
+            name (str): The display name of the achievement.
+            description (str): The description of how to unlock the achievement.
+            stat (str): The stat that unlocks the achievement.
+            threshold (int): The value the stat has to reach.
+        """
+        self.id = achievement_id
+        self.name = name
+        self.description = description
+        self.stat = stat
+        self.threshold = threshold
+    
+    def to_dict(self):
+        """
+        Convert the achievement to the dictionary format used in config.ACHIEVEMENTS.
+        
+        Returns:
+            dict: The achievement definition as a dictionary.
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'stat': self.stat,
+            'threshold': self.threshold
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create an achievement from a definition dictionary.
+        
+        Args:
+            data (dict): The achievement definition, as in config.ACHIEVEMENTS.
+        
+        Returns:
+            Achievement: A new achievement.
+        """
+        return cls(
+            achievement_id=data['id'],
+            name=data['name'],
+            description=data['description'],
+            stat=data['stat'],
+            threshold=data['threshold']
+        )
+
+class AchievementTracker:
+    """
+    Unlocks achievements as player stats change.
+    
+    The locked achievements of each stat are kept sorted by threshold with
+    a cursor at the next one, and the next threshold is cached per stat.
+    Stats only grow, so an update that does not reach the next threshold
+    is a single comparison however many achievements exist, and each
+    achievement is looked at once when it unlocks.
+    """
+    def __init__(self, achievements, unlocked=()):
+        """
+        Initialize the tracker.
+        
+        Args:
+            achievements (list): The Achievement objects to track.
+            unlocked (iterable, optional): The IDs of achievements unlocked earlier, e.g. from a save.
+        """
+        self.achievements = {achievement.id: achievement for achievement in achievements}
+        self.unlocked = set(unlocked) & self.achievements.keys()
+        self.pending = {}  # Dictionary of stat -> locked achievements sorted by threshold
+        self.cursors = {}  # Dictionary of stat -> index of the next locked achievement
+        self.next_thresholds = {}  # Dictionary of stat -> threshold of the next locked achievement
+        
+        for achievement in sorted(self.achievements.values(), key=lambda a: a.threshold):
+            if achievement.id not in self.unlocked:
+                self.pending.setdefault(achievement.stat, []).append(achievement)
+        for stat, pending in self.pending.items():
+            self.cursors[stat] = 0
+            self.next_thresholds[stat] = pending[0].threshold
+    
+    def update(self, stat, value):
+        """
+        Unlock the achievements a new stat value reaches.
+        
+        Args:
+            stat (str): The name of the stat.
+            value (int): The stat's current value.
+        
+        Returns:
+            list: The newly unlocked Achievement objects, lowest threshold first.
+        """
+        if value < self.next_thresholds.get(stat, math.inf):
+            return []
+        
+        pending = self.pending[stat]
+        cursor = self.cursors[stat]
+        unlocked = []
+        while cursor < len(pending) and pending[cursor].threshold <= value:
+            achievement = pending[cursor]
+            self.unlocked.add(achievement.id)
+            unlocked.append(achievement)
+            cursor += 1
+        
+        self.cursors[stat] = cursor
+        self.next_thresholds[stat] = pending[cursor].threshold if cursor < len(pending) else math.inf
+        return unlocked
+    
+    def update_many(self, stats):
+        """
+        Unlock the achievements reached by several stats.
+        
+        Args:
+            stats (dict): A dictionary of stat -> current value.
+        
+        Returns:
+            list: The newly unlocked Achievement objects.
+        """
+        unlocked = []
+        for stat, value in stats.items():
+            unlocked.extend(self.update(stat, value))
+        return unlocked
+    
+    def next_threshold(self, stat):
+        """
+        Get the value a stat has to reach to unlock its next achievement.
+        
+        Args:
+            stat (str): The name of the stat.
+        
+        Returns:
+            int: The threshold, or None if every achievement of the stat is unlocked.
+        """
+        threshold = self.next_thresholds.get(stat, math.inf)
+        return None if threshold == math.inf else threshold
+    
+    def is_unlocked(self, achievement_id):
+        """
+        Check if an achievement is unlocked.
+        
+        Args:
+            achievement_id (str): The ID of the achievement.
+        
+        Returns:
+            bool: True if the achievement is unlocked, False otherwise.
+        """
+        return achievement_id in self.unlocked
+    
+    def to_list(self):
+        """
+        Get the unlocked achievements for saving.
+        
+        Returns:
+            list: The sorted IDs of the unlocked achievements.
+        """
+        return sorted(self.unlocked)
+
+
+def create_achievements_from_config():
+    """
+    Create achievement objects from the configuration.
+    
+    Returns:
+        list: The Achievement objects, in configuration order.
+    """
+    return [Achievement.from_dict(achievement_config) for achievement_config in ACHIEVEMENTS]
\ No newline at end of file
@@ -6,46 +6,182 @@ class Player:
     """
     Represents the player in the clicker game.
     Manages currency, click power, and owned upgrades.
+    
+    If the player is given a clock, auto click income is evaluated lazily:
+    the player stores its balance at a point in time and its income rate,
+    and the current currency is computed from them when read. Nothing has
+    to tick an idle player. Without a clock, income is only credited by
+    calling auto_click(dt).
     """
-    def __init__(self):
-        """Initialize a new player."""
-        self.currency = 0
+    __slots__ = ('balance', 'balance_time', 'income_rate', 'clock', 'click_power', 'owned_upgrades',
+                 'total_clicks', 'earned')
+    
+    def __init__(self, clock=None):
+        """
+        Initialize a new player.
+        
+        Args:
+            clock (function, optional): Returns the current time in seconds,
+                used for lazy auto click income. None disables lazy income.
+        """
+        self.clock = clock
+        self.balance = 0  # Currency at balance_time
+        self.balance_time = clock() if clock else 0.0
+        self.income_rate = 0  # Power of automatic clicks per second
         self.click_power = 1
         self.owned_upgrades = {}  # Dictionary of upgrade_id -> level
-        self.auto_click_power = 0  # Power of automatic clicks per second
+        self.total_clicks = 0
+        self.earned = 0  # Currency earned up to balance_time, not counting spending
     
-    def click(self):
+    @property
+    def currency(self):
         """
-        Process a player click.
+        Get the player's current currency, including accrued auto income.
         
         Returns:
-            int: The amount of currency gained from the click.
+            int: The current currency.
+        """
+        if self.clock is None or self.income_rate <= 0:
+            return self.balance
+        return self.balance + int(self.income_rate * (self.clock() - self.balance_time))
+    
+    @currency.setter
+    def currency(self, value):
+        """
+        Set the player's current currency.
+        
+        Args:
+            value (int): The new currency.
+        """
+        self.settle()
+        self.balance = value
+    
+    @property
+    def currency_earned(self):
+        """
+        Get the total currency earned, including accrued auto income.
+        
+        Returns:
+            int: The currency earned from clicks, Levis and auto income.
+        """
+        if self.clock is None or self.income_rate <= 0:
+            return self.earned
+        return self.earned + int(self.income_rate * (self.clock() - self.balance_time))
+    
+    @property
+    def auto_click_power(self):
+        """
+        Get the power of automatic clicks per second.
+        
+        Returns:
+            int: The auto click power.
+        """
+        return self.income_rate
+    
+    @auto_click_power.setter
+    def auto_click_power(self, value):
+        """
+        Set the power of automatic clicks per second.
+        
+        Income earned at the old rate is credited first, so the new rate
+        only applies from now on.
+        
+        Args:
+            value (int): The new auto click power.
+        """
+        self.settle()
+        self.income_rate = value
+    
+    def settle(self):
         """
-        gained = self.click_power
-        self.currency += gained
+        Credit the auto income accrued since balance_time to the balance.
+        
+        Only whole Mullet Bucks are credited; balance_time moves forward by
+        the time they took to earn, so fractions are kept for later.
+        
+        Returns:
+            int: The amount of currency credited.
+        """
+        clock = self.clock
+        if clock is None:
+            return 0
+        
+        now = clock()
+        if self.income_rate <= 0:
+            self.balance_time = now
+            return 0
+        
+        gained = int(self.income_rate * (now - self.balance_time))
+        if gained:
+            self.balance += gained
+            self.earned += gained
+            self.balance_time += gained / self.income_rate
+        return gained
+    
+    def time_to_next_unit(self):
+        """
+        Get the time until lazy auto income next raises the currency.
+        
+        Returns:
+            float: The time in seconds, or None if the currency will not change on its own.
+        """
+        if self.clock is None or self.income_rate <= 0:
+            return None
+        
+        progress = self.income_rate * (self.clock() - self.balance_time)
+        return (1 - (progress - int(progress))) / self.income_rate
+    
+    def click(self, count=1):
+        """
+        Process one or more player clicks.
+        
+        Args:
+            count (int, optional): The number of clicks to process at once.
+            
+        Returns:
+            int: The amount of currency gained from the clicks.
+        """
+        gained = self.click_power * count
+        self.balance += gained
+        self.earned += gained
+        self.total_clicks += count
         return gained
     
+    def earn(self, amount):
+        """
+        Credit currency earned outside of clicks, e.g. from catching a Levi.
+        
+        Args:
+            amount (int): The amount of currency earned.
+        """
+        self.balance += amount
+        self.earned += amount
+    
     def auto_click(self, dt):
         """
         Process automatic clicks based on time elapsed.
         
+        Only needed for players without a clock; players with a clock
+        accrue auto income lazily and gain nothing here.
+        
         Args:
             dt (float): Time elapsed in seconds since the last update.
             
         Returns:
             int: The amount of currency gained from auto clicks.
         """
-        if self.auto_click_power <= 0:
+        if self.income_rate <= 0 or self.clock is not None:
             return 0
         
         # Calculate currency gained from auto clicks
-        gained = int(self.auto_click_power * dt)
+        gained = int(self.income_rate * dt)
         
         # Ensure at least 1 currency is gained if auto_click_power > 0
-        if self.auto_click_power > 0 and gained == 0:
+        if gained == 0:
             gained = 1
         
-        self.currency += gained
+        self.balance += gained
+        self.earned += gained
         return gained
     
     def purchase_upgrade(self, upgrade):
@@ -62,7 +198,8 @@ class Player:
             return False
         
         # Deduct the cost
-        self.currency -= upgrade.get_cost()
+        self.settle()
+        self.balance -= upgrade.get_cost()
         
         # Update owned upgrades
         upgrade_id = upgrade.id
@@ -111,23 +248,28 @@ class Player:
             'currency': self.currency,
             'click_power': self.click_power,
             'auto_click_power': self.auto_click_power,
-            'owned_upgrades': self.owned_upgrades
+            'owned_upgrades': self.owned_upgrades,
+            'total_clicks': self.total_clicks,
+            'earned': self.currency_earned
         }
     
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, clock=None):
         """
         Create a player from saved data.
         
         Args:
             data (dict): The saved player data.
+            clock (function, optional): The clock for lazy auto click income.
             
         Returns:
             Player: A new player with the saved data.
         """
-        player = cls()
+        player = cls(clock)
         player.currency = data.get('currency', 0)
         player.click_power = data.get('click_power', 1)
         player.auto_click_power = data.get('auto_click_power', 0)
         player.owned_upgrades = data.get('owned_upgrades', {})
+        player.total_clicks = data.get('total_clicks', 0)
+        player.earned = data.get('earned', 0)
         return player
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""
+Upgrade prerequisites for the clicker game.
+"""
+
+import math
+from src.models.achievement import upgrade_stat
+
+def achievement_stat(achievement_id):
+    """
+    Get the stat name of an achievement, which is 1 once it is unlocked.
+    
+    Args:
+        achievement_id (str): The ID of the achievement.
+    
+    Returns:
+        str: The stat name, e.g. "achievement:first_click".
+    """
+    return f"achievement:{achievement_id}"
+
+def compile_requirements(requires):
+    """
+    Flatten an upgrade's 'requires' definition into stat thresholds.
+    
+    Args:
+        requires (dict): The definition, e.g. {'upgrades': {'click_power': 2},
+            'currency_earned': 500, 'achievements': ['clicks_100']}, or None.
+    
+    Returns:
+        dict: A dictionary of stat -> value the stat has to reach.
+    """
+    thresholds = {}
+    if not requires:
+        return thresholds
+    
+    for upgrade_id, level in requires.get('upgrades', {}).items():
+        thresholds[upgrade_stat(upgrade_id)] = level
+    for stat in ('currency_earned', 'total_clicks'):
+        if stat in requires:
+            thresholds[stat] = requires[stat]
+    for achievement_id in requires.get('achievements', []):
+        thresholds[achievement_stat(achievement_id)] = 1
+    
+    unknown = set(requires) - {'upgrades', 'currency_earned', 'total_clicks', 'achievements'}
+    if unknown:
+        raise ValueError(f"Unknown requirements: {', '.join(sorted(unknown))}")
+    return thresholds
+
+def check_requirements(upgrades, known_ids=(), achievement_ids=None):
+    """
+    Compile and check the prerequisites of a set of upgrades.
+    
+    Upgrades may require each other and the upgrades in known_ids. The
+    known upgrades have been checked before and never require the new
+    ones, so a cycle can only run through the new upgrades and only they
+    are searched; adding upgrades in batches costs the size of each batch.
+    
+    Args:
+        upgrades (dict): A dictionary of upgrade_id -> Upgrade to check.
+        known_ids (container, optional): The IDs of checked upgrades they may also require.
+        achievement_ids (iterable, optional): The known achievement IDs, to validate against.
+    
+    Returns:
+        dict: A dictionary of upgrade_id -> {stat: value} with the compiled prerequisites.
+    
+    Raises:
+        ValueError: If a prerequisite names an unknown upgrade or achievement,
+            or upgrades require each other in a cycle.
+    """
+    known_achievements = None if achievement_ids is None else {achievement_stat(a) for a in achievement_ids}
+    requirements = {}
+    required = {}  # Dictionary of upgrade_id -> the IDs of new upgrades it requires
+    for upgrade_id, upgrade in upgrades.items():
+        compiled = compile_requirements(upgrade.requires)
+        required[upgrade_id] = []
+        for stat in compiled:
+            if stat.startswith('achievement:'):
+                if known_achievements is not None and stat not in known_achievements:
+                    raise ValueError(f"Upgrade {upgrade_id} requires unknown achievement {stat[len('achievement:'):]}")
+            elif stat.endswith('_level'):
+                required_id = stat[:-len('_level')]
+                if required_id in upgrades:
+                    required[upgrade_id].append(required_id)
+                elif required_id not in known_ids:
+                    raise ValueError(f"Upgrade {upgrade_id} requires unknown upgrade {required_id}")
+        requirements[upgrade_id] = compiled
+    
+    check_cycles(required)
+    return requirements
+
+def check_cycles(required):
+    """
+    Make sure no upgrades require each other, directly or through others.
+    
+    Args:
+        required (dict): A dictionary of upgrade_id -> the IDs of the upgrades it requires.
+    
+    Raises:
+        ValueError: If there is a cycle.
+    """
+    done = set()
+    for root in required:
+        if root in done:
+            continue
+        
+        # Depth-first search without recursion, so deep unlock trees are fine
+        path = [root]
+        on_path = {root}
+        stack = [iter(required[root])]
+        while stack:
+            upgrade_id = next(stack[-1], None)
+            if upgrade_id is None:
+                stack.pop()
+                finished = path.pop()
+                on_path.discard(finished)
+                done.add(finished)
+            elif upgrade_id in on_path:
+                cycle = path[path.index(upgrade_id):] + [upgrade_id]
+                raise ValueError(f"Upgrade requirements form a cycle: {' -> '.join(cycle)}")
+            elif upgrade_id not in done:
+                path.append(upgrade_id)
+                on_path.add(upgrade_id)
+                stack.append(iter(required[upgrade_id]))
+
+class UnlockGraph:
+    """
+    Tracks which upgrades have their prerequisites met.
+    
+    Every prerequisite is compiled into a condition "stat reaches value",
+    where the stats are upgrade levels, currency earned, total clicks and
+    unlocked achievements. The conditions on each stat are kept sorted by
+    value with a cursor at the first unmet one, and each upgrade counts
+    its unmet conditions. All of these stats only grow, so a change to a
+    stat only visits the conditions it has just met, and only their
+    upgrades are looked at again; an update that meets nothing is a single
+    comparison however many upgrades exist.
+    """
+    def __init__(self, upgrades, achievement_ids=None):
+        """
+        Compile the prerequisites of a set of upgrades.
+        
+        Args:
+            upgrades (dict): A dictionary of upgrade_id -> Upgrade.
+            achievement_ids (iterable, optional): The known achievement IDs, to validate against.
+        
+        Raises:
+            ValueError: If a prerequisite names an unknown upgrade or achievement,
+                or upgrades require each other in a cycle.
+        """
+        self.requirements = check_requirements(upgrades, achievement_ids=achievement_ids)  # upgrade_id -> {stat: value}
+        self.unmet = {}  # Dictionary of upgrade_id -> number of unmet conditions
+        self.conditions = {}  # Dictionary of stat -> [(value, upgrade_id)] sorted by value
+        self.cursors = {}  # Dictionary of stat -> index of the first unmet condition
+        self.next_values = {}  # Dictionary of stat -> value of the first unmet condition
+        
+        for upgrade_id, requirements in self.requirements.items():
+            self.unmet[upgrade_id] = len(requirements)
+            for stat, value in requirements.items():
+                self.conditions.setdefault(stat, []).append((value, upgrade_id))
+        
+        for stat, conditions in self.conditions.items():
+            conditions.sort()
+            self.cursors[stat] = 0
+            self.next_values[stat] = conditions[0][0]
+    
+    def update(self, stat, value):
+        """
+        Meet the conditions a new stat value reaches.
+        
+        Args:
+            stat (str): The name of the stat, e.g. "click_power_level".
+            value (int): The stat's current value.
+        
+        Returns:
+            list: The IDs of upgrades with a prerequisite that has just been met.
+        """
+        if value < self.next_values.get(stat, math.inf):
+            return []
+        
+        conditions = self.conditions[stat]
+        cursor = self.cursors[stat]
+        changed = []
+        while cursor < len(conditions) and conditions[cursor][0] <= value:
+            upgrade_id = conditions[cursor][1]
+            self.unmet[upgrade_id] -= 1
+            changed.append(upgrade_id)
+            cursor += 1
+        
+        self.cursors[stat] = cursor
+        self.next_values[stat] = conditions[cursor][0] if cursor < len(conditions) else math.inf
+        return changed
+    
+    def update_many(self, stats):
+        """
+        Meet the conditions reached by several stats.
+        
+        Args:
+            stats (dict): A dictionary of stat -> current value.
+        
+        Returns:
+            list: The IDs of upgrades with a prerequisite that has just been met.
+        """
+        changed = []
+        for stat, value in stats.items():
+            changed.extend(self.update(stat, value))
+        return changed
+    
+    def is_unlocked(self, upgrade_id):
+        """
+        Check if an upgrade's prerequisites are all met.
+        
+        Args:
+            upgrade_id (str): The ID of the upgrade.
+        
+        Returns:
+            bool: True if nothing is missing, False otherwise.
+        """
+        return not self.unmet.get(upgrade_id, 0)
+    
+    def missing(self, upgrade_id):
+        """
+        Get the prerequisites of an upgrade that are not met yet.
+        
+        Args:
+            upgrade_id (str): The ID of the upgrade.
+        
+        Returns:
+            dict: A dictionary of stat -> value the stat still has to reach.
+        """
+        if not self.unmet.get(upgrade_id, 0):
+            return {}
+        
+        missing = {}
+        for stat, value in self.requirements[upgrade_id].items():
+            if value >= self.next_values[stat]:
+                missing[stat] = value
+        return missing
\ No newline at end of file
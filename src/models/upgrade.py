@@ -3,13 +3,21 @@ Upgrade system for the clicker game.
 """
 
 import math
-from src.config import UPGRADES
+from src.config import UPGRADES, LEVI_VALUE
+from src.models.unlocks import compile_requirements, achievement_stat
+
+# The effects an upgrade can apply
+EFFECTS = ('click_power', 'auto_clicker', 'click_multiplier', 'stage_2_unlock')
 
 class Upgrade:
     """
     Represents an upgrade that can be purchased to improve gameplay.
     """
-    def __init__(self, upgrade_id, name, description, base_cost, cost_multiplier, effect_value, max_level=None):
+    __slots__ = ('id', 'name', 'description', 'base_cost', 'cost_multiplier', 'effect_value', 'max_level',
+                 'requires', 'effect')
+    
+    def __init__(self, upgrade_id, name, description, base_cost, cost_multiplier, effect_value, max_level=None,
+                 requires=None, effect=None):
         """
         Initialize an upgrade.
         
@@ -21,6 +29,10 @@ class Upgrade:
             cost_multiplier (float): The multiplier for the cost as the level increases.
             effect_value (float): The value of the effect applied by the upgrade.
             max_level (int, optional): The maximum level of the upgrade, or None for unlimited.
+            requires (dict, optional): The prerequisites, e.g. {'upgrades': {'click_power': 2},
+                'currency_earned': 500, 'achievements': ['clicks_100']}, or None for none.
+            effect (str, optional): The built-in effect the upgrade applies, one of EFFECTS.
+                Defaults to the upgrade's ID, so the base upgrades name their own effect.
         """
         self.id = upgrade_id
         self.name = name
@@ -29,6 +41,8 @@ class Upgrade:
         self.cost_multiplier = cost_multiplier
         self.effect_value = effect_value
         self.max_level = max_level
+        self.requires = requires
+        self.effect = effect or upgrade_id
     
     def get_cost(self, level=None):
         """
@@ -56,24 +70,28 @@ class Upgrade:
         """
         level = player.get_upgrade_level(self.id)
         
-        if self.id == 'click_power':
+        if self.effect == 'click_power':
             # Increase click power
             player.click_power += self.effect_value
-        elif self.id == 'auto_clicker':
+        elif self.effect == 'auto_clicker':
             # Increase auto click power
             player.auto_click_power += self.effect_value
-        elif self.id == 'click_multiplier':
+        elif self.effect == 'click_multiplier':
             # Multiply click power
             # Only apply the multiplier once, not cumulatively
             if level == 1:
                 player.click_power *= self.effect_value
     
-    def is_available(self, player):
+    def is_available(self, player, unlocks=None, achievements=()):
         """
         Check if the upgrade is available to the player.
         
         Args:
             player (Player): The player to check availability for.
+            unlocks (UnlockGraph, optional): The player's unlock graph. If None, the
+                prerequisites are checked against the player directly.
+            achievements (iterable, optional): The IDs of the player's unlocked achievements,
+                used when no unlock graph is given.
             
         Returns:
             bool: True if the upgrade is available, False otherwise.
@@ -84,8 +102,37 @@ class Upgrade:
         if self.max_level is not None and level >= self.max_level:
             return False
         
-        # Additional availability checks can be added here
+        # Check the prerequisites
+        if unlocks is not None:
+            return unlocks.is_unlocked(self.id)
+        return self.requirements_met(player, achievements)
+    
+    def requirements_met(self, player, achievements=()):
+        """
+        Check the upgrade's prerequisites against a player.
+        
+        Args:
+            player (Player): The player to check.
+            achievements (iterable, optional): The IDs of the player's unlocked achievements.
+            
+        Returns:
+            bool: True if every prerequisite is met, False otherwise.
+        """
+        if not self.requires:
+            return True
         
+        stats = {
+            'currency_earned': player.currency_earned,
+            'total_clicks': player.total_clicks,
+        }
+        stats.update((achievement_stat(achievement_id), 1) for achievement_id in achievements)
+        for stat, value in compile_requirements(self.requires).items():
+            if stat.endswith('_level'):
+                current = player.get_upgrade_level(stat[:-len('_level')])
+            else:
+                current = stats.get(stat, 0)
+            if current < value:
+                return False
         return True
     
     def get_next_level_description(self, player):
@@ -100,17 +147,64 @@ class Upgrade:
         """
         level = player.get_upgrade_level(self.id)
         
-        if self.id == 'click_power':
+        if self.effect == 'click_power':
             return f"Increases click power by {self.effect_value}"
-        elif self.id == 'auto_clicker':
+        elif self.effect == 'auto_clicker':
             return f"Generates {self.effect_value} Mullet Bucks per second"
-        elif self.id == 'click_multiplier':
+        elif self.effect == 'click_multiplier':
             if level == 0:
                 return f"Multiplies click power by {self.effect_value}"
             else:
                 return f"Already at maximum effectiveness"
+        elif self.effect == 'stage_2_unlock':
+            return f"Unleash Levi worth {LEVI_VALUE} Mullet Bucks each when clicked"
         
         return "Unknown effect"
+    
+    def to_dict(self):
+        """
+        Convert the upgrade to the dictionary format used in config.UPGRADES.
+        
+        Returns:
+            dict: The upgrade definition as a dictionary.
+        """
+        data = {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'base_cost': self.base_cost,
+            'cost_multiplier': self.cost_multiplier,
+            'effect_value': self.effect_value,
+            'max_level': self.max_level
+        }
+        if self.requires:
+            data['requires'] = self.requires
+        if self.effect != self.id:
+            data['effect'] = self.effect
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create an upgrade from a definition dictionary.
+        
+        Args:
+            data (dict): The upgrade definition, as in config.UPGRADES.
+            
+        Returns:
+            Upgrade: A new upgrade.
+        """
+        return cls(
+            upgrade_id=data['id'],
+            name=data['name'],
+            description=data['description'],
+            base_cost=data['base_cost'],
+            cost_multiplier=data['cost_multiplier'],
+            effect_value=data['effect_value'],
+            max_level=data.get('max_level'),
+            requires=data.get('requires'),
+            effect=data.get('effect')
+        )
 
 
 def create_upgrades_from_config():
@@ -123,15 +217,7 @@ def create_upgrades_from_config():
     upgrades = {}
     
     for upgrade_config in UPGRADES:
-        upgrade = Upgrade(
-            upgrade_id=upgrade_config['id'],
-            name=upgrade_config['name'],
-            description=upgrade_config['description'],
-            base_cost=upgrade_config['base_cost'],
-            cost_multiplier=upgrade_config['cost_multiplier'],
-            effect_value=upgrade_config['effect_value'],
-            max_level=upgrade_config.get('max_level')
-        )
+        upgrade = Upgrade.from_dict(upgrade_config)
         upgrades[upgrade.id] = upgrade
     
     return upgrades
\ No newline at end of file
@@ -0,0 +1 @@
+# Headless game server package
\ No newline at end of file
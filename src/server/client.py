@@ -0,0 +1,120 @@
+"""
+Asyncio client for the headless game server.
+"""
+
+import asyncio
+import json
+from src.config import SERVER_HOST, SERVER_PORT
+from src.server.game_server import encode_message
+
+class GameClient:
+    """
+    A minimal client that speaks the server's JSON line protocol.
+    """
+    def __init__(self):
+        """Initialize a disconnected client."""
+        self.reader = None
+        self.writer = None
+        self.session_id = None
+        self.state = {}  # The client's copy of the session state, kept up to date by diffs
+    
+    async def connect(self, host=SERVER_HOST, port=SERVER_PORT):
+        """
+        Connect to a server.
+        
+        Args:
+            host (str, optional): The server host.
+            port (int, optional): The server port.
+        """
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+    
+    async def send(self, message):
+        """
+        Send a message to the server.
+        
+        Args:
+            message (dict): The message to send.
+        """
+        self.writer.write(encode_message(message))
+        await self.writer.drain()
+    
+    async def receive(self):
+        """
+        Receive the next message and apply any state it carries.
+        
+        Returns:
+            dict: The message, or None if the connection closed.
+        """
+        line = await self.reader.readline()
+        if not line:
+            return None
+        
+        message = json.loads(line)
+        if message['type'] in ('welcome', 'state'):
+            self.state = message['state']
+        elif message['type'] == 'diff':
+            self.state.update(message['diff'])
+        return message
+    
+    async def wait_for(self, message_type):
+        """
+        Receive messages until one of the given type arrives.
+        
+        Args:
+            message_type (str): The type of message to wait for.
+        
+        Returns:
+            dict: The message, or None if the connection closed.
+        """
+        while True:
+            message = await self.receive()
+            if message is None or message['type'] == message_type:
+                return message
+    
+    async def hello(self, session_id=None):
+        """
+        Start or resume a session.
+        
+        Args:
+            session_id (str, optional): The session to resume.
+        
+        Returns:
+            dict: The welcome message.
+        """
+        await self.send({'type': 'hello', 'session_id': session_id})
+        welcome = await self.wait_for('welcome')
+        self.session_id = welcome['session_id']
+        return welcome
+    
+    async def click(self, count=1):
+        """
+        Send clicks to the server.
+        
+        Args:
+            count (int, optional): The number of clicks.
+        """
+        await self.send({'type': 'click', 'count': count})
+    
+    async def purchase(self, upgrade_id):
+        """
+        Purchase an upgrade.
+        
+        Args:
+            upgrade_id (str): The ID of the upgrade to purchase.
+        
+        Returns:
+            bool: True if the purchase was successful, False otherwise.
+        """
+        await self.send({'type': 'purchase', 'upgrade_id': upgrade_id})
+        result = await self.wait_for('purchase_result')
+        return bool(result and result['success'])
+    
+    async def close(self):
+        """Close the connection."""
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.writer = None
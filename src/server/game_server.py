@@ -0,0 +1,394 @@
+"""
+Asyncio headless game server.
+
+Clients talk to the server over TCP with newline-delimited JSON messages:
+    
+    client -> server
+        {"type": "hello", "session_id": "..."}     start or resume a session
+        {"type": "click", "count": 1}              click one or more times
+        {"type": "purchase", "upgrade_id": "..."}  buy an upgrade
+        {"type": "state"}                          request the full state
+    
+    server -> client
+        {"type": "welcome", "session_id": "...", "state": {...}}
+        {"type": "state", "state": {...}}
+        {"type": "diff", "tick": 12, "diff": {...}}
+        {"type": "purchase_result", "upgrade_id": "...", "success": true}
+        {"type": "error", "message": "..."}
+
+A single scheduler task ticks every SERVER_TICK_INTERVAL seconds. Auto
+income is evaluated lazily by each Player from the server clock, so a tick
+does no work for idle or disconnected sessions; it only sends every
+connected session that changed one diff with all its changes.
+
+Disconnected sessions are kept for SERVER_SESSION_TTL seconds so clients
+can resume them, and at most SERVER_MAX_SESSIONS sessions are kept. A
+hello that resumes a session held by another connection moves it to the
+new connection, and the old one is told with an error.
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import time
+from src.config import (SERVER_HOST, SERVER_PORT, SERVER_TICK_INTERVAL, SERVER_MAX_WRITE_BUFFER, SERVER_SESSION_TTL,
+                        SERVER_MAX_SESSIONS, CONTENT_PACKS_ENABLED)
+from src.models.player import Player
+from src.models.upgrade import create_upgrades_from_config
+from src.models.achievement import AchievementTracker, create_achievements_from_config
+from src.utils.content_packs import discover_packs, add_pack_upgrades
+from src.server.session import Session
+
+def encode_message(message):
+    """
+    Encode a message for the wire.
+    
+    Args:
+        message (dict): The message to encode.
+    
+    Returns:
+        bytes: The JSON message followed by a newline.
+    """
+    return (json.dumps(message, separators=(',', ':')) + '\n').encode()
+
+class GameServer:
+    """
+    Hosts many independent game sessions in one process.
+    """
+    def __init__(self, host=SERVER_HOST, port=SERVER_PORT, tick_interval=SERVER_TICK_INTERVAL, clock=time.monotonic,
+                 session_ttl=SERVER_SESSION_TTL, max_sessions=SERVER_MAX_SESSIONS):
+        """
+        Initialize the server.
+        
+        Args:
+            host (str, optional): The host to listen on.
+            port (int, optional): The port to listen on, or 0 to pick a free one.
+            tick_interval (float, optional): The time between scheduler ticks in seconds.
+            clock (function, optional): Returns the current time in seconds, used for income.
+            session_ttl (float, optional): Seconds a disconnected session is kept.
+            max_sessions (int, optional): The number of sessions kept at once.
+        """
+        self.host = host
+        self.port = port
+        self.tick_interval = tick_interval
+        self.clock = clock
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.upgrades = create_upgrades_from_config()  # Shared by every session
+        self.achievements = create_achievements_from_config()  # Shared definitions; each session tracks its own
+        self.content_packs = discover_packs() if CONTENT_PACKS_ENABLED else []  # Parsed by load_content_packs
+        self.sessions = {}  # Dictionary of session_id -> Session
+        self.idle_since = {}  # Dictionary of session_id -> time it was left without a client, oldest first
+        self.income_sessions = set()  # Connected sessions that earn currency on their own
+        self.dirty = set()  # Sessions changed since the last flush
+        self.connections = set()
+        self.tick_count = 0
+        self.server = None
+        self.scheduler = None
+    
+    def create_session(self, session_id=None, player=None):
+        """
+        Create a new session.
+        
+        Args:
+            session_id (str, optional): The ID to use, or None to generate one.
+            player (Player, optional): The player, or None to start a new game.
+        
+        Returns:
+            Session: The new session, or None if the server is full of connected sessions.
+        """
+        if len(self.sessions) >= self.max_sessions and not self.drop_idle_session():
+            return None
+        
+        session_id = session_id or secrets.token_hex(8)
+        if player is None:
+            player = Player(clock=self.clock)
+        session = Session(session_id, self.upgrades, player, AchievementTracker(self.achievements))
+        self.sessions[session_id] = session
+        self.idle_since[session_id] = self.clock()
+        return session
+    
+    def remove_session(self, session_id):
+        """
+        Remove a session.
+        
+        Args:
+            session_id (str): The ID of the session to remove.
+        """
+        session = self.sessions.pop(session_id, None)
+        self.idle_since.pop(session_id, None)
+        if session is not None:
+            self.income_sessions.discard(session)
+            self.dirty.discard(session)
+    
+    def drop_idle_session(self, cutoff=None):
+        """
+        Remove the session that has been without a client the longest.
+        
+        Args:
+            cutoff (float, optional): Only remove it if it was left before this time.
+        
+        Returns:
+            bool: True if a session was removed, False otherwise.
+        """
+        idle_since = self.idle_since
+        while idle_since:
+            session_id, since = next(iter(idle_since.items()))
+            if cutoff is not None and since > cutoff:
+                return False
+            
+            del idle_since[session_id]
+            session = self.sessions.get(session_id)
+            if session is not None and session.writer is None:
+                self.remove_session(session_id)
+                return True
+        return False
+    
+    def expire_sessions(self):
+        """
+        Remove the sessions that have been without a client for longer than the TTL.
+        
+        Sessions are kept in the order they were left, so only the expired
+        ones are looked at.
+        """
+        cutoff = self.clock() - self.session_ttl
+        while self.drop_idle_session(cutoff):
+            pass
+    
+    def load_content_packs(self):
+        """
+        Parse the content packs and add their upgrades for every session.
+        
+        This is done the first time a client asks for an upgrade that is not
+        in the config, so servers whose clients never do skip the parsing.
+        """
+        packs, self.content_packs = self.content_packs, []
+        add_pack_upgrades(self.upgrades, packs, [achievement.id for achievement in self.achievements])
+    
+    def update_income(self, session):
+        """
+        Add or remove a session from the set whose clients get income updates.
+        
+        Args:
+            session (Session): The session to check.
+        """
+        if session.has_income and session.writer is not None:
+            self.income_sessions.add(session)
+        else:
+            self.income_sessions.discard(session)
+    
+    def detach_session(self, session):
+        """
+        Leave a session without a client, to be resumed or expired later.
+        
+        Args:
+            session (Session): The session whose connection closed or moved on.
+        """
+        session.writer = None
+        self.idle_since.pop(session.id, None)  # Re-added at the end to keep the oldest first
+        self.idle_since[session.id] = self.clock()
+        self.update_income(session)
+    
+    def tick(self):
+        """
+        Mark connected sessions with auto income as changed.
+        
+        Their currency is computed from the clock when the diff is built, so
+        no session is advanced here.
+        """
+        self.tick_count += 1
+        self.dirty.update(self.income_sessions)
+    
+    def flush(self):
+        """
+        Send one diff to each connected session that changed.
+        
+        Sessions whose client is not keeping up stay dirty and are sent a
+        combined diff on a later flush.
+        """
+        held_back = set()
+        for session in self.dirty:
+            writer = session.writer
+            if writer is None:
+                continue
+            
+            if writer.transport.get_write_buffer_size() > SERVER_MAX_WRITE_BUFFER:
+                held_back.add(session)
+                continue
+            
+            diff = session.take_diff()
+            if diff:
+                writer.write(encode_message({'type': 'diff', 'tick': self.tick_count, 'diff': diff}))
+        self.dirty = held_back
+    
+    def handle_message(self, session, writer, message):
+        """
+        Handle one message from a client.
+        
+        Args:
+            session (Session): The connection's session, or None before hello.
+            writer (asyncio.StreamWriter): The connection to reply on.
+            message (dict): The decoded message.
+        
+        Returns:
+            Session: The connection's session after handling the message.
+        """
+        message_type = message.get('type') if isinstance(message, dict) else None
+        
+        if message_type == 'hello':
+            session_id = message.get('session_id')
+            if session_id is not None and not isinstance(session_id, str):
+                writer.write(encode_message({'type': 'error', 'message': "invalid session id"}))
+                return session
+            
+            resumed = self.sessions.get(session_id)
+            if resumed is not None and resumed.writer is not None and resumed.writer is not writer:
+                # The newest connection wins, e.g. a client reconnecting before its old socket timed out
+                resumed.writer.write(encode_message({'type': 'error', 'message': "session resumed elsewhere"}))
+            if resumed is None:
+                resumed = self.create_session()
+                if resumed is None:
+                    writer.write(encode_message({'type': 'error', 'message': "server full"}))
+                    return session
+            if session is not None and session is not resumed and session.writer is writer:
+                self.detach_session(session)
+            session = resumed
+            self.idle_since.pop(session.id, None)
+            session.writer = writer
+            self.update_income(session)
+            writer.write(encode_message({
+                'type': 'welcome',
+                'session_id': session.id,
+                'state': session.take_state()
+            }))
+            return session
+        
+        if session is None:
+            writer.write(encode_message({'type': 'error', 'message': "send hello first"}))
+            return None
+        if session.writer is not writer:
+            writer.write(encode_message({'type': 'error', 'message': "session resumed elsewhere"}))
+            return None
+        
+        if message_type == 'click':
+            count = message.get('count', 1)
+            if not isinstance(count, int) or count < 1:
+                writer.write(encode_message({'type': 'error', 'message': "invalid click count"}))
+            elif session.click(count):
+                self.dirty.add(session)
+        elif message_type == 'purchase':
+            upgrade_id = message.get('upgrade_id')
+            if not isinstance(upgrade_id, str):
+                writer.write(encode_message({'type': 'error', 'message': "invalid upgrade id"}))
+                return session
+            if upgrade_id not in self.upgrades and self.content_packs:
+                self.load_content_packs()
+            success = session.purchase_upgrade(upgrade_id)
+            if success:
+                self.update_income(session)
+                self.dirty.add(session)
+            writer.write(encode_message({'type': 'purchase_result', 'upgrade_id': upgrade_id, 'success': success}))
+        elif message_type == 'state':
+            writer.write(encode_message({'type': 'state', 'state': session.take_state()}))
+        else:
+            writer.write(encode_message({'type': 'error', 'message': f"unknown message type {message_type!r}"}))
+        
+        return session
+    
+    async def handle_connection(self, reader, writer):
+        """
+        Serve one client connection.
+        
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        self.connections.add(writer)
+        session = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    writer.write(encode_message({'type': 'error', 'message': "invalid JSON"}))
+                    continue
+                
+                session = self.handle_message(session, writer, message)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            # The session stays on the server so the client can resume it
+            if session is not None and session.writer is writer:
+                self.detach_session(session)
+            writer.close()
+    
+    async def run_scheduler(self):
+        """Tick all sessions at a fixed rate until cancelled."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.tick_interval
+        
+        while True:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            now = loop.time()
+            self.tick()
+            self.flush()
+            self.expire_sessions()
+            
+            next_tick += self.tick_interval
+            if next_tick < now:
+                # Fell behind; skip the missed ticks instead of bursting
+                next_tick = now + self.tick_interval
+    
+    async def start(self):
+        """Start listening and start the tick scheduler."""
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.scheduler = asyncio.create_task(self.run_scheduler())
+    
+    async def stop(self):
+        """Stop the scheduler and close every connection."""
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+            try:
+                await self.scheduler
+            except asyncio.CancelledError:
+                pass
+            self.scheduler = None
+        
+        if self.server is not None:
+            self.server.close()
+            for writer in list(self.connections):
+                writer.close()
+            await self.server.wait_closed()
+            self.server = None
+    
+    async def serve_forever(self):
+        """Run the server until cancelled."""
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+def main(argv=None):
+    """
+    Run the headless game server from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Run the LiamClickerV2 headless game server.")
+    parser.add_argument('--host', default=SERVER_HOST, help="The host to listen on.")
+    parser.add_argument('--port', type=int, default=SERVER_PORT, help="The port to listen on.")
+    parser.add_argument('--tick', type=float, default=SERVER_TICK_INTERVAL, help="Seconds between ticks.")
+    args = parser.parse_args(argv)
+    
+    server = GameServer(args.host, args.port, args.tick)
+    print(f"Serving on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,128 @@
+"""
+Per-session state for the headless game server.
+"""
+
+from src.models.achievement import upgrade_stat
+
+class Session:
+    """
+    One player's game on the server.
+    
+    Sessions share the upgrade definitions and only hold their own Player,
+    achievements, the state last sent to the client and the connection, if any.
+    """
+    __slots__ = ('id', 'player', 'upgrades', 'achievements', 'last_sent', 'writer')
+    
+    def __init__(self, session_id, upgrades, player, achievements):
+        """
+        Initialize a session.
+        
+        Args:
+            session_id (str): The unique identifier of the session.
+            upgrades (dict): The shared dictionary of upgrade_id -> Upgrade objects.
+            player (Player): The session's player, with a clock for lazy income.
+            achievements (AchievementTracker): The player's achievements, for upgrade prerequisites.
+        """
+        self.id = session_id
+        self.player = player
+        self.upgrades = upgrades
+        self.achievements = achievements
+        self.last_sent = {}
+        self.writer = None
+    
+    @property
+    def has_income(self):
+        """
+        Check if the session earns currency on its own.
+        
+        Returns:
+            bool: True if the player has auto click power, False otherwise.
+        """
+        return self.player.auto_click_power > 0
+    
+    def click(self, count=1):
+        """
+        Process clicks from the client.
+        
+        Args:
+            count (int, optional): The number of clicks.
+        
+        Returns:
+            int: The amount of currency gained.
+        """
+        return self.player.click(count)
+    
+    def update_achievements(self):
+        """
+        Unlock the achievements the player's stats have reached.
+        
+        Clicks and auto income change the stats without telling the session,
+        so this is done when an upgrade needs to know, not on every click.
+        
+        Returns:
+            list: The newly unlocked Achievement objects.
+        """
+        player = self.player
+        stats = {
+            'total_clicks': player.total_clicks,
+            'currency_earned': player.currency_earned,
+        }
+        stats.update((upgrade_stat(upgrade_id), level) for upgrade_id, level in player.owned_upgrades.items())
+        return self.achievements.update_many(stats)
+    
+    def purchase_upgrade(self, upgrade_id):
+        """
+        Purchase an upgrade for the session's player.
+        
+        Args:
+            upgrade_id (str): The ID of the upgrade to purchase.
+        
+        Returns:
+            bool: True if the purchase was successful, False otherwise.
+        """
+        upgrade = self.upgrades.get(upgrade_id)
+        if not upgrade:
+            return False
+        
+        if not self.player.can_afford(upgrade):
+            return False
+        
+        self.update_achievements()
+        if not upgrade.is_available(self.player, achievements=self.achievements.unlocked):
+            return False
+        
+        return self.player.purchase_upgrade(upgrade)
+    
+    def get_state(self):
+        """
+        Get the full state of the session.
+        
+        Returns:
+            dict: The player data as a dictionary.
+        """
+        state = self.player.to_dict()
+        state['owned_upgrades'] = dict(state['owned_upgrades'])
+        return state
+    
+    def take_diff(self):
+        """
+        Get the state fields that changed since the last diff or full state.
+        
+        Returns:
+            dict: The changed fields, empty if nothing changed.
+        """
+        state = self.get_state()
+        last_sent = self.last_sent
+        diff = {key: value for key, value in state.items() if last_sent.get(key) != value}
+        self.last_sent = state
+        return diff
+    
+    def take_state(self):
+        """
+        Get the full state and remember it as sent.
+        
+        Returns:
+            dict: The player data as a dictionary.
+        """
+        self.last_sent = self.get_state()
+        return dict(self.last_sent)
@@ -4,11 +4,15 @@ Button class for UI elements.
 
 import pygame
 from src.config import COLORS, FONT_SIZES
+from src.ui.text_layout import TextLayout
 
 class Button:
     """
     A clickable button UI element.
     """
+    __slots__ = ('rect', 'text', 'on_click', 'font_size', 'bg_color', 'hover_color', 'text_color',
+                 'disabled', 'max_level', 'hovered', 'font', 'layout', 'faces')
+    
     def __init__(self, rect, text, on_click=None, font_size='medium',
                  bg_color=COLORS['button'], hover_color=COLORS['button_hover'],
                  text_color=COLORS['text'], disabled=False, max_level=False):
@@ -36,15 +40,56 @@ class Button:
         self.max_level = max_level
         self.hovered = False
         self.font = None
-        self.text_surface = None
-        self.text_rect = None
+        self.layout = None  # Multi-line layout of the label
+        self.faces = {}  # Dictionary of visual state -> pre-rendered button surface
         self._initialize_font()
     
     def _initialize_font(self):
-        """Initialize the font and text surface."""
+        """Initialize the font and text layout, then build the cached faces."""
         self.font = pygame.font.SysFont('Arial', self.font_size)
-        self.text_surface = self.font.render(self.text, True, self.text_color)
-        self.text_rect = self.text_surface.get_rect(center=self.rect.center)
+        self.layout = TextLayout(self.font, self.text_color, max_width=self.rect.width - 10)
+        self.layout.set_text(self.text)
+        self._build_faces()
+    
+    def _build_faces(self):
+        """
+        Pre-render the button for every visual state.
+        
+        Each face holds the background, border and text, so rendering the
+        button is a single blit.
+        """
+        disabled_color = tuple(max(0, c - 50) for c in self.bg_color)
+        states = {
+            'normal': (self.bg_color, COLORS['text']),
+            'hover': (self.hover_color, COLORS['text']),
+            'disabled': (disabled_color, COLORS['text']),
+            # Use red colors for max level buttons
+            'max_level': ((255, 150, 150), COLORS['negative']),
+            'max_level_hover': ((255, 200, 200), COLORS['negative']),
+        }
+        
+        face_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        
+        self.faces = {}
+        for state, (color, border_color) in states.items():
+            face = pygame.Surface(face_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(face, color, face_rect, border_radius=5)
+            pygame.draw.rect(face, border_color, face_rect, width=2, border_radius=5)
+            self.layout.render(face, face_rect)
+            self.faces[state] = face
+    
+    def get_state(self):
+        """
+        Get the visual state of the button.
+        
+        Returns:
+            str: The key of the face to draw.
+        """
+        if self.max_level:
+            return 'max_level_hover' if self.hovered else 'max_level'
+        if self.disabled:
+            return 'disabled'
+        return 'hover' if self.hovered else 'normal'
     
     def update(self, mouse_pos):
         """
@@ -63,24 +108,7 @@ class Button:
         Args:
             surface (pygame.Surface): The surface to render the button on.
         """
-        # Draw button background
-        if self.max_level:
-            # Use red colors for max level buttons
-            color = (255, 200, 200) if self.hovered else (255, 150, 150)
-            border_color = COLORS['negative']
-        else:
-            color = self.hover_color if self.hovered else self.bg_color
-            border_color = COLORS['text']
-            
-        if self.disabled and not self.max_level:
-            # Use a darker color for disabled buttons
-            color = tuple(max(0, c - 50) for c in self.bg_color)
-        
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, border_color, self.rect, width=2, border_radius=5)
-        
-        # Draw button text
-        surface.blit(self.text_surface, self.text_rect)
+        surface.blit(self.faces[self.get_state()], self.rect)
     
     def handle_event(self, event):
         """
@@ -106,7 +134,8 @@ class Button:
             text (str): The new text for the button.
         """
         self.text = text
-        self._initialize_font()
+        if self.layout.set_text(text):
+            self._build_faces()
     
     def set_disabled(self, disabled):
         """
@@ -0,0 +1,135 @@
+"""
+Graph panel for time series statistics.
+"""
+
+import math
+import pygame
+from src.config import COLORS, FONT_SIZES
+from src.models.currency import Currency
+from src.ui.panel import Panel
+from src.utils.stats import downsample
+
+class GraphPanel(Panel):
+    """
+    A panel that plots one of several time series over a chosen time range.
+    
+    The plot is drawn from the finest resolution of the series that covers
+    the time range, reduced to one min/max pair per pixel column, so
+    drawing costs the same however long the history is. The plot is cached
+    and only drawn again when the series gets a new point or the view
+    changes. Clicking the panel shows the next series.
+    """
+    __slots__ = ('series', 'ranges', 'series_index', 'range_index', 'line_color', 'font', 'plot', 'plot_key')
+    
+    def __init__(self, rect, series, ranges, line_color=COLORS['highlight'], bg_color=COLORS['panel'], **kwargs):
+        """
+        Initialize a graph panel.
+        
+        Args:
+            rect (pygame.Rect): The rectangle defining the panel's position and size.
+            series (list): (title, TimeSeries) pairs that can be shown.
+            ranges (list): (label, seconds) pairs of the time ranges that can be shown.
+            line_color (tuple, optional): The color of the plot.
+            bg_color (tuple, optional): The background color of the panel.
+            **kwargs: Other Panel options.
+        """
+        super().__init__(rect, bg_color, **kwargs)
+        self.series = series
+        self.ranges = ranges
+        self.series_index = 0
+        self.range_index = 0
+        self.line_color = line_color
+        self.font = pygame.font.SysFont('Arial', FONT_SIZES['small'])
+        self.plot = None  # Cached plot surface
+        self.plot_key = None  # (series, range, revision) the plot was drawn for
+    
+    def cycle_series(self):
+        """Show the next series."""
+        self.series_index = (self.series_index + 1) % len(self.series)
+    
+    def cycle_range(self):
+        """Show the next time range."""
+        self.range_index = (self.range_index + 1) % len(self.ranges)
+    
+    def handle_event(self, event):
+        """
+        Handle pygame events for the panel.
+        
+        Args:
+            event (pygame.event.Event): The event to handle.
+        
+        Returns:
+            bool: True if the panel handled the event, False otherwise.
+        """
+        if (self.visible and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                and self.rect.collidepoint(event.pos)):
+            self.cycle_series()
+            return True
+        return super().handle_event(event)
+    
+    def render(self, surface):
+        """
+        Render the panel and its plot on the given surface.
+        
+        Args:
+            surface (pygame.Surface): The surface to render the panel on.
+        """
+        if not self.visible:
+            return
+        
+        super().render(surface)
+        title, series = self.series[self.series_index]
+        key = (self.series_index, self.range_index, series.revision)
+        if key != self.plot_key:
+            self.plot = self._draw_plot(title, series)
+            self.plot_key = key
+        surface.blit(self.plot, self.rect)
+    
+    def _draw_plot(self, title, series):
+        """
+        Draw the title, scale and plot of a series.
+        
+        Args:
+            title (str): The name of the series.
+            series (TimeSeries): The series to plot.
+        
+        Returns:
+            pygame.Surface: The plot, the size of the panel.
+        """
+        plot = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        range_label, duration = self.ranges[self.range_index]
+        header = self.font.render(f"{title} ({range_label})", True, COLORS['text'])
+        plot.blit(header, (8, 4))
+        
+        area = pygame.Rect(8, header.get_height() + 8, self.rect.width - 16,
+                           self.rect.height - header.get_height() - 16)
+        level = series.level_for(duration)
+        slots = max(1, math.ceil(duration / level.step))  # Points the range covers at this level
+        mins, maxs, _ = level.latest(slots)
+        if not mins:
+            return plot
+        
+        # Only the part of the range with history gets pixel columns
+        width = max(1, round(area.width * len(mins) / slots))
+        columns = downsample(mins, maxs, width)
+        low = min(column[0] for column in columns)
+        high = max(column[1] for column in columns)
+        if high <= low:
+            high = low + 1
+        
+        label = self.font.render(Currency.format(int(high)), True, COLORS['text'])
+        plot.blit(label, (self.rect.width - label.get_width() - 8, 4))
+        
+        scale = (area.height - 1) / (high - low)
+        step = width / len(columns)
+        left = area.right - width
+        points = []
+        for index, (column_low, column_high) in enumerate(columns):
+            x = left + int(index * step)
+            top = area.bottom - 1 - int((column_high - low) * scale)
+            bottom = area.bottom - 1 - int((column_low - low) * scale)
+            pygame.draw.line(plot, self.line_color, (x, top), (x, bottom))
+            points.append((x, top))
+        if len(points) > 1:
+            pygame.draw.lines(plot, self.line_color, False, points)
+        return plot
\ No newline at end of file
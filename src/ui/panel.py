@@ -9,6 +9,9 @@ class Panel:
     """
     A container for UI elements.
     """
+    __slots__ = ('rect', 'bg_color', 'border_color', 'border_width', 'border_radius', 'visible',
+                 'elements', 'background', 'content_surface', 'content_parent')
+    
     def __init__(self, rect, bg_color=COLORS['panel'], border_color=COLORS['text'], 
                  border_width=2, border_radius=5, visible=True):
         """
@@ -29,6 +32,9 @@ class Panel:
         self.border_radius = border_radius
         self.visible = visible
         self.elements = []
+        self.background = None  # Cached background and border surface
+        self.content_surface = None  # Cached subsurface of the last render target
+        self.content_parent = None
     
     def add_element(self, element):
         """
@@ -72,23 +78,43 @@ class Panel:
         if not self.visible:
             return
         
-        # Draw panel background
-        pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=self.border_radius)
-        
-        # Draw panel border
-        if self.border_width > 0:
-            pygame.draw.rect(surface, self.border_color, self.rect, 
-                            width=self.border_width, border_radius=self.border_radius)
+        # Draw the cached panel background and border
+        if self.background is None:
+            self._build_background()
+        surface.blit(self.background, self.rect)
         
-        # Create a subsurface for the panel content
+        # Reuse the subsurface for the panel content while the target surface stays the same
         # We need to ensure the subsurface is within the bounds of the main surface
-        panel_surface = surface.subsurface(self.rect)
+        if self.content_parent is not surface:
+            self.content_surface = surface.subsurface(self.rect)
+            self.content_parent = surface
+        panel_surface = self.content_surface
         
         # Render all elements on the panel surface
         for element in self.elements:
             if hasattr(element, 'render'):
                 element.render(panel_surface)
     
+    def _build_background(self):
+        """Pre-render the panel background and border."""
+        local_rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        self.background = pygame.Surface(local_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self.background, self.bg_color, local_rect, border_radius=self.border_radius)
+        
+        if self.border_width > 0:
+            pygame.draw.rect(self.background, self.border_color, local_rect,
+                            width=self.border_width, border_radius=self.border_radius)
+    
+    def invalidate(self):
+        """
+        Drop the cached background and subsurface.
+        
+        Call this after changing the panel's rect or colors.
+        """
+        self.background = None
+        self.content_surface = None
+        self.content_parent = None
+    
     def handle_event(self, event):
         """
         Handle pygame events for the panel and its elements.
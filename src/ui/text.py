@@ -9,6 +9,9 @@ class Text:
     """
     A text UI element.
     """
+    __slots__ = ('text', 'position', 'color', 'font_size', 'font_name', 'centered', 'background',
+                 'padding', 'font', 'surface', 'rect')
+    
     def __init__(self, text, position, color=COLORS['text'], font_size='medium', 
                  font_name='Arial', centered=False, background=None, padding=0):
         """
@@ -76,6 +79,8 @@ class DynamicText(Text):
     """
     A text element that can be updated dynamically.
     """
+    __slots__ = ('text_func', 'last_update', 'update_interval')
+    
     def __init__(self, text_func, position, color=COLORS['text'], font_size='medium', 
                  font_name='Arial', centered=False, background=None, padding=0, 
                  update_interval=1000):
@@ -102,9 +107,14 @@ class DynamicText(Text):
         """
         Update the text content based on the update interval.
         
+        The text is only rendered again when it has changed.
+        
         Args:
             dt_or_mouse_pos: Either the time elapsed since the last update in milliseconds,
                             or the mouse position (which we ignore for DynamicText).
+            
+        Returns:
+            bool: True if the text changed, False otherwise.
         """
         # If dt_or_mouse_pos is a tuple, it's mouse position, which we ignore
         # If it's a number, it's the time delta
@@ -112,8 +122,124 @@ class DynamicText(Text):
             dt = dt_or_mouse_pos
             self.last_update += dt
             if self.last_update >= self.update_interval:
-                self.update_text(self.text_func())
                 self.last_update = 0
+                text = str(self.text_func())
+                if text != self.text:
+                    self.update_text(text)
+                    return True
+        return False
+
+# Characters pre-rendered into every glyph atlas: digits, signs and currency suffixes
+GLYPH_CHARACTERS = "0123456789+-.,KMBTQaiSxpOcNoD"
+
+class GlyphAtlas:
+    """
+    Pre-rendered glyphs for one font, size and color.
+    
+    Text is composed by blitting one cached surface per character, which
+    avoids a font.render call for every number drawn. Characters that are
+    not in the atlas yet are rendered on first use and kept.
+    """
+    def __init__(self, font_size, color, font_name='Arial', characters=GLYPH_CHARACTERS):
+        """
+        Initialize a glyph atlas.
+        
+        Args:
+            font_size (int): The size of the font.
+            color (tuple): The color of the glyphs.
+            font_name (str, optional): The name of the font.
+            characters (str, optional): The characters to pre-render.
+        """
+        self.font = pygame.font.SysFont(font_name, font_size)
+        self.color = color
+        self.height = self.font.get_height()
+        self.glyphs = {}
+        for char in characters:
+            self._add_glyph(char)
+    
+    def _add_glyph(self, char):
+        """Render a single character and add it to the atlas."""
+        glyph = self.font.render(char, True, self.color)
+        self.glyphs[char] = glyph
+        return glyph
+    
+    def measure(self, text):
+        """
+        Get the width of a string drawn with this atlas.
+        
+        Args:
+            text (str): The text to measure.
+            
+        Returns:
+            int: The width in pixels.
+        """
+        glyphs = self.glyphs
+        return sum((glyphs.get(char) or self._add_glyph(char)).get_width() for char in text)
+    
+    def render(self, surface, text, position, alpha=255, centered=False):
+        """
+        Draw text by blitting cached glyphs.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            text (str): The text to draw.
+            position (tuple): The position (x, y) to draw at.
+            alpha (int, optional): The opacity of the text (0 to 255).
+            centered (bool, optional): Whether to center the text at the position.
+            
+        Returns:
+            pygame.Rect: The rectangle containing the drawn text.
+        """
+        glyphs = [self.glyphs.get(char) or self._add_glyph(char) for char in text]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        
+        x, y = int(position[0]), int(position[1])
+        if centered:
+            x -= width // 2
+            y -= self.height // 2
+        
+        rect = pygame.Rect(x, y, width, self.height)
+        if alpha < 255:
+            # Fade a copy of the text, never the glyphs that every caller shares
+            target = pygame.Surface(rect.size, pygame.SRCALPHA)
+            x, y = 0, 0
+        else:
+            target = surface
+        
+        blits = []
+        for glyph in glyphs:
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        target.blits(blits, doreturn=False)
+        
+        if target is not surface:
+            target.set_alpha(alpha)
+            surface.blit(target, rect)
+        return rect
+
+_glyph_atlases = {}
+
+def get_glyph_atlas(font_size, color, font_name='Arial'):
+    """
+    Get the shared glyph atlas for a font, size and color.
+    
+    Args:
+        font_size (str or int): The size of the font ('small', 'medium', 'large' or direct size).
+        color (tuple): The color of the glyphs.
+        font_name (str, optional): The name of the font.
+        
+    Returns:
+        GlyphAtlas: The glyph atlas, created on first use.
+    """
+    if isinstance(font_size, str):
+        font_size = FONT_SIZES.get(font_size, FONT_SIZES['medium'])
+    
+    key = (font_name, font_size, tuple(color))
+    atlas = _glyph_atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font_size, color, font_name)
+        _glyph_atlases[key] = atlas
+    return atlas
 
 def draw_text(surface, text, position, color=COLORS['text'], font_size='medium', 
               font_name='Arial', centered=False, background=None, padding=0):
@@ -0,0 +1,143 @@
+"""
+Multi-line text layout for UI elements.
+"""
+
+WORD_CACHE_SIZE = 256  # Word widths kept per layout; numbers in changing labels would grow it forever
+
+class TextLayout:
+    """
+    Lays out and draws multi-line text with one font and color.
+    
+    Text is split at newlines and wrapped at word boundaries to a maximum
+    width. The widths of recent words and the rendered lines are cached, so
+    changing one line of a label (usually the cost) only renders that line
+    again.
+    """
+    __slots__ = ('font', 'color', 'max_width', 'align', 'line_spacing', 'text', 'lines',
+                 'line_surfaces', 'word_widths', 'space_width', 'width', 'height')
+    
+    def __init__(self, font, color, max_width=None, align='center', line_spacing=0):
+        """
+        Initialize a text layout.
+        
+        Args:
+            font (pygame.font.Font): The font to draw with.
+            color (tuple): The color of the text.
+            max_width (int, optional): The width to wrap lines at, or None to never wrap.
+            align (str, optional): The horizontal alignment ('left', 'center' or 'right').
+            line_spacing (int, optional): Extra pixels between lines.
+        """
+        self.font = font
+        self.color = color
+        self.max_width = max_width
+        self.align = align
+        self.line_spacing = line_spacing
+        self.text = None
+        self.lines = []
+        self.line_surfaces = {}  # Dictionary of line text -> rendered surface
+        self.word_widths = {}  # Dictionary of word -> width in pixels
+        self.space_width = font.size(' ')[0]
+        self.width = 0
+        self.height = 0
+    
+    def measure(self, word):
+        """
+        Get the width of a word, using the cache.
+        
+        Args:
+            word (str): The word to measure.
+        
+        Returns:
+            int: The width in pixels.
+        """
+        word_widths = self.word_widths
+        width = word_widths.get(word)
+        if width is None:
+            width = self.font.size(word)[0]
+            if len(word_widths) >= WORD_CACHE_SIZE:
+                del word_widths[next(iter(word_widths))]  # Forget the oldest word
+            word_widths[word] = width
+        return width
+    
+    def wrap(self, paragraph):
+        """
+        Split one paragraph into lines no wider than max_width.
+        
+        A single word wider than max_width gets a line of its own.
+        
+        Args:
+            paragraph (str): Text without newlines.
+        
+        Returns:
+            list: The lines of the paragraph.
+        """
+        if self.max_width is None:
+            return [paragraph]
+        
+        lines = []
+        line = []
+        line_width = 0
+        for word in paragraph.split(' '):
+            word_width = self.measure(word)
+            if line and line_width + self.space_width + word_width > self.max_width:
+                lines.append(' '.join(line))
+                line = []
+                line_width = 0
+            line_width += word_width + (self.space_width if line else 0)
+            line.append(word)
+        lines.append(' '.join(line))
+        return lines
+    
+    def set_text(self, text):
+        """
+        Lay out new text, rendering only lines that are not cached.
+        
+        Args:
+            text (str): The text, with newlines between lines.
+        
+        Returns:
+            bool: True if the text changed, False otherwise.
+        """
+        if text == self.text:
+            return False
+        
+        self.text = text
+        self.lines = [line for paragraph in text.split('\n') for line in self.wrap(paragraph)]
+        
+        # Keep only the surfaces of the current lines
+        old_surfaces = self.line_surfaces
+        self.line_surfaces = {}
+        for line in self.lines:
+            if line not in self.line_surfaces:
+                surface = old_surfaces.get(line)
+                if surface is None:
+                    surface = self.font.render(line, True, self.color)
+                self.line_surfaces[line] = surface
+        
+        line_height = self.font.get_linesize()
+        self.width = max((self.line_surfaces[line].get_width() for line in self.lines), default=0)
+        self.height = line_height * len(self.lines) + self.line_spacing * max(0, len(self.lines) - 1)
+        return True
+    
+    def render(self, surface, rect):
+        """
+        Draw the text centered vertically in a rectangle.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            rect (pygame.Rect): The rectangle to align the text in.
+        """
+        step = self.font.get_linesize() + self.line_spacing
+        y = rect.centery - self.height // 2
+        blits = []
+        for line in self.lines:
+            line_surface = self.line_surfaces[line]
+            if self.align == 'left':
+                x = rect.left
+            elif self.align == 'right':
+                x = rect.right - line_surface.get_width()
+            else:
+                x = rect.centerx - line_surface.get_width() // 2
+            blits.append((line_surface, (x, y)))
+            y += step
+        surface.blits(blits, doreturn=False)
\ No newline at end of file
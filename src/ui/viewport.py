@@ -0,0 +1,204 @@
+"""
+Scaled presentation of the fixed-size game screen.
+"""
+
+import pygame
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, VIEWPORT_BAND_HEIGHT, VIEWPORT_SMOOTH
+
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+class Viewport:
+    """
+    Shows the logical game screen scaled to fit a resizable or fullscreen window.
+    
+    The game draws to an offscreen surface of the logical size with the
+    same absolute coordinates as before. present() scales it to fit the
+    window, keeping its aspect ratio with black bars around it. Mouse
+    events are mapped back to logical coordinates with map_event().
+    
+    The window keeps the last scaled frame. Each frame is compared with
+    the previous one in horizontal bands of logical pixels, and only the
+    bands that changed are scaled again and sent to the display, so the
+    static parts of the screen are scaled once per resize instead of
+    every frame.
+    """
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), fullscreen=False,
+                 band_height=VIEWPORT_BAND_HEIGHT, smooth=VIEWPORT_SMOOTH):
+        """
+        Initialize the viewport and open the window.
+        
+        Args:
+            size (tuple, optional): The logical size (width, height) the game draws at.
+            fullscreen (bool, optional): Whether to open a fullscreen window.
+            band_height (int, optional): The height of the bands compared between frames.
+            smooth (bool, optional): Whether to scale with filtering instead of nearest pixels.
+        """
+        self.size = size
+        self.band_height = band_height
+        self.smooth = smooth
+        self.surface = pygame.Surface(size, 0, 32)  # 32 bit so it can be smoothscaled
+        self.previous = None  # Pixel bytes of the last presented frame, None to redraw everything
+        self.fullscreen = fullscreen
+        self.window = None
+        self.rect = pygame.Rect((0, 0), size)  # Where the logical screen lands in the window
+        self.scale = 1.0
+        self.set_mode(fullscreen)
+    
+    def set_mode(self, fullscreen):
+        """
+        Open the window in windowed or fullscreen mode.
+        
+        Args:
+            fullscreen (bool): Whether to fill the screen.
+        """
+        self.fullscreen = fullscreen
+        if fullscreen:
+            window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            window = pygame.display.set_mode(self.size, pygame.RESIZABLE)
+        self.resize(window)
+    
+    def toggle_fullscreen(self):
+        """Switch between windowed and fullscreen mode."""
+        self.set_mode(not self.fullscreen)
+    
+    def resize(self, window):
+        """
+        Fit the logical screen to a new window surface.
+        
+        Args:
+            window (pygame.Surface): The window's display surface.
+        """
+        self.window = window
+        window_width, window_height = window.get_size()
+        width, height = self.size
+        self.scale = min(window_width / width, window_height / height)
+        scaled_size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        self.rect = pygame.Rect(((window_width - scaled_size[0]) // 2, (window_height - scaled_size[1]) // 2),
+                                scaled_size)
+        self.previous = None
+    
+    @property
+    def identity(self):
+        """
+        Check if the window shows the logical screen without scaling.
+        
+        Returns:
+            bool: True if logical and window coordinates are the same, False otherwise.
+        """
+        return self.rect.topleft == (0, 0) and self.rect.size == self.size
+    
+    def to_logical(self, position):
+        """
+        Map a window position to logical coordinates.
+        
+        Positions on the bars around the screen map outside the logical screen.
+        
+        Args:
+            position (tuple): The window position (x, y).
+        
+        Returns:
+            tuple: The logical position (x, y).
+        """
+        x, y = position
+        return (int((x - self.rect.x) // self.scale), int((y - self.rect.y) // self.scale))
+    
+    def map_event(self, event):
+        """
+        Map a mouse event's position to logical coordinates.
+        
+        Args:
+            event (pygame.event.Event): The event from the window.
+        
+        Returns:
+            pygame.event.Event: The event with a logical position, or the same event if it has none.
+        """
+        if event.type not in MOUSE_EVENTS or self.identity:
+            return event
+        
+        attributes = dict(event.dict)
+        attributes['pos'] = self.to_logical(event.pos)
+        return pygame.event.Event(event.type, attributes)
+    
+    def handle_event(self, event):
+        """
+        Follow window size changes.
+        
+        Args:
+            event (pygame.event.Event): The event to handle.
+        """
+        if event.type == pygame.VIDEORESIZE:
+            self.resize(pygame.display.get_surface())
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.previous = None  # The window may have lost its contents
+    
+    def present(self):
+        """
+        Show the logical screen in the window.
+        
+        Returns:
+            list: The window rectangles that were scaled and updated.
+        """
+        if self.identity:
+            self.window.blit(self.surface, (0, 0))
+            pygame.display.flip()
+            return [self.rect]
+        
+        # Compare the frame with the last one band by band
+        frame = self.surface.get_buffer().raw
+        previous = self.previous
+        pitch = self.surface.get_pitch()
+        height = self.size[1]
+        redraw = previous is None
+        if redraw:
+            self.window.fill((0, 0, 0))
+        
+        updated = []
+        start = None  # First row of the current run of changed bands
+        for top in range(0, height, self.band_height):
+            bottom = min(top + self.band_height, height)
+            changed = redraw or frame[top * pitch:bottom * pitch] != previous[top * pitch:bottom * pitch]
+            if changed and start is None:
+                start = top
+            elif not changed and start is not None:
+                updated.append(self._scale_rows(start, top))
+                start = None
+        if start is not None:
+            updated.append(self._scale_rows(start, height))
+        self.previous = frame
+        
+        if redraw:
+            pygame.display.flip()
+        elif updated:
+            pygame.display.update(updated)
+        return updated
+    
+    def _scale_rows(self, top, bottom):
+        """
+        Scale a range of logical rows into the window.
+        
+        One extra row is scaled on each side, so filtering blends across
+        the edges of the range like it would for a full frame.
+        
+        Args:
+            top (int): The first logical row.
+            bottom (int): The logical row after the last.
+        
+        Returns:
+            pygame.Rect: The window rectangle that was drawn.
+        """
+        width, height = self.size
+        scale = self.rect.height / height
+        source_top = max(0, top - 1)
+        source_bottom = min(height, bottom + 1)
+        scaled_top = round(source_top * scale)
+        scaled_height = max(1, round(source_bottom * scale) - scaled_top)
+        
+        source = self.surface.subsurface((0, source_top, width, source_bottom - source_top))
+        transform = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+        scaled = transform(source, (self.rect.width, scaled_height))
+        
+        dest_top = round(top * scale)
+        dest = pygame.Rect(self.rect.x, self.rect.y + dest_top, self.rect.width, round(bottom * scale) - dest_top)
+        self.window.blit(scaled, dest, pygame.Rect(0, dest_top - scaled_top, dest.width, dest.height))
+        return dest
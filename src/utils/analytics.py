@@ -0,0 +1,123 @@
+"""
+Session analytics log for the clicker game.
+
+Events are written as fixed-size binary records into a memory-mapped file
+laid out as a ring buffer:
+    
+    header  (64 bytes)  magic, version, record size, capacity, records written, sessions
+    records (capacity * RECORD.size bytes)
+
+Record i of all time lives in slot i % capacity, so the file never grows
+and the newest `capacity` events are always kept. Read it with
+`python -m src.utils.analytics_report`.
+"""
+
+import mmap
+import os
+import struct
+import time
+from src.config import ANALYTICS_FILE, ANALYTICS_CAPACITY
+
+MAGIC = b'LCLOG\x00\x00\x01'
+VERSION = 1
+
+HEADER = struct.Struct('<8sIIQQQ')  # magic, version, record size, capacity, records written, sessions
+HEADER_SIZE = 64
+WRITTEN = struct.Struct('<Q')
+WRITTEN_OFFSET = 24  # Offset of the records written count in the header
+
+RECORD = struct.Struct('<dHHIq')  # wall clock time, kind, code, count, value
+COUNT_MAX = 2 ** 32 - 1
+VALUE_MIN = -2 ** 63
+VALUE_MAX = 2 ** 63 - 1
+
+# Event kinds
+SESSION_START = 1  # value: log format version
+CLICKS = 2  # count: clicks in the batch, value: currency gained
+PURCHASE = 3  # code: index of the upgrade in config.UPGRADES, count: new level, value: cost
+FRAME = 4  # value: frame time in microseconds
+LEVI_CAUGHT = 5  # value: currency gained
+MACRO = 6  # code: 1 if clicks were too fast, 2 if they were too regular
+
+class AnalyticsLog:
+    """
+    Appends fixed-size event records to a memory-mapped ring buffer file.
+    
+    Each write packs one record straight into the mapping and then
+    publishes it by bumping the records written count in the header, so no
+    buffers are built per event and a reader never sees a half-written
+    record. The mapping is backed by the file, so everything written
+    survives the game crashing; flush() also makes it survive the machine
+    crashing.
+    """
+    def __init__(self, log_file=ANALYTICS_FILE, capacity=ANALYTICS_CAPACITY):
+        """
+        Open the log, creating or replacing the file if it has another layout.
+        
+        Args:
+            log_file (str, optional): The log file name, relative to the project directory.
+            capacity (int, optional): The number of records kept.
+        """
+        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.path = os.path.join(base_path, log_file)
+        self.capacity = capacity
+        size = HEADER_SIZE + capacity * RECORD.size
+        
+        self.file = os.fdopen(os.open(self.path, os.O_RDWR | os.O_CREAT), 'r+b')
+        header = self.file.read(HEADER.size)
+        if (len(header) < HEADER.size or os.fstat(self.file.fileno()).st_size != size
+                or HEADER.unpack(header)[:4] != (MAGIC, VERSION, RECORD.size, capacity)):
+            # A new file, or one written with another layout
+            self.file.truncate(0)
+            self.file.truncate(size)
+            self.file.seek(0)
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, capacity, 0, 0))
+            self.file.flush()
+        
+        self.map = mmap.mmap(self.file.fileno(), size)
+        _, _, _, _, self.written, sessions = HEADER.unpack_from(self.map, 0)
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, RECORD.size, capacity, self.written, sessions + 1)
+        self.log(SESSION_START, value=VERSION)
+    
+    def log(self, kind, code=0, count=0, value=0):
+        """
+        Append one event.
+        
+        Args:
+            kind (int): The event kind, e.g. CLICKS.
+            code (int, optional): A small kind-specific code, e.g. an upgrade index.
+            count (int, optional): A kind-specific count, clamped to the range of a 32-bit unsigned integer.
+            value (float, optional): A kind-specific value, truncated and clamped to the range of a 64-bit integer.
+        """
+        # Late-game currency outgrows the record fields, so it is clamped rather than failing the write
+        if not 0 <= count <= COUNT_MAX:
+            count = COUNT_MAX if count > 0 else 0
+        if not VALUE_MIN <= value <= VALUE_MAX:
+            value = VALUE_MAX if value > 0 else VALUE_MIN
+        elif value.__class__ is not int:
+            value = int(value)  # Multiplied click power makes currency a float
+        
+        written = self.written
+        RECORD.pack_into(self.map, HEADER_SIZE + (written % self.capacity) * RECORD.size,
+                         time.time(), kind, code, count, value)
+        self.written = written + 1
+        WRITTEN.pack_into(self.map, WRITTEN_OFFSET, self.written)
+    
+    def log_frame(self, frame_time):
+        """
+        Append a frame time sample.
+        
+        Args:
+            frame_time (float): The time the frame took in seconds.
+        """
+        self.log(FRAME, value=int(frame_time * 1000000))
+    
+    def flush(self):
+        """Write the mapped pages to disk."""
+        self.map.flush()
+    
+    def close(self):
+        """Flush and close the log."""
+        self.map.flush()
+        self.map.close()
+        self.file.close()
\ No newline at end of file
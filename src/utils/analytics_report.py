@@ -0,0 +1,151 @@
+"""
+Summarize a session analytics log with NumPy.
+
+Usage: python -m src.utils.analytics_report [log file]
+
+The records are mapped straight into a NumPy structured array, so even a
+full log is aggregated without creating a Python object per event.
+"""
+
+import argparse
+import os
+import sys
+import numpy as np
+from src.config import ANALYTICS_FILE, UPGRADES
+from src.utils.analytics import (MAGIC, VERSION, HEADER, HEADER_SIZE, RECORD,
+                                 SESSION_START, CLICKS, PURCHASE, FRAME, LEVI_CAUGHT, MACRO)
+
+RECORD_DTYPE = np.dtype([('time', '<f8'), ('kind', '<u2'), ('code', '<u2'), ('count', '<u4'), ('value', '<i8')])
+
+def load_records(path):
+    """
+    Map the records of a log in the order they were written.
+    
+    Args:
+        path (str): The path of the log file.
+    
+    Returns:
+        numpy.ndarray: The records, oldest first, as a RECORD_DTYPE array.
+    """
+    with open(path, 'rb') as f:
+        magic, version, record_size, capacity, written, _ = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path} is not an analytics log of version {VERSION}")
+    
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(capacity,))
+    if written <= capacity:
+        return records[:written]
+    
+    # The ring has wrapped; the oldest record is in the slot after the newest
+    start = written % capacity
+    return np.concatenate((records[start:], records[:start]))
+
+def summarize(records):
+    """
+    Aggregate the records of a log.
+    
+    Args:
+        records (numpy.ndarray): The records, oldest first.
+    
+    Returns:
+        dict: Totals for the whole log and a list of per-session summaries.
+    """
+    kinds = records['kind']
+    counts = records['count'].astype(np.int64)
+    values = records['value']
+    is_clicks = kinds == CLICKS
+    is_purchase = kinds == PURCHASE
+    is_frame = kinds == FRAME
+    
+    # Number the sessions; records before the first start kept belong to session 0
+    session_ids = np.cumsum(kinds == SESSION_START)
+    session_count = int(session_ids[-1]) + 1 if len(records) else 0
+    clicks = np.bincount(session_ids, weights=counts * is_clicks, minlength=session_count)
+    earned = np.bincount(session_ids, weights=values * (is_clicks | (kinds == LEVI_CAUGHT)),
+                         minlength=session_count)
+    purchases = np.bincount(session_ids, weights=is_purchase, minlength=session_count)
+    first = np.full(session_count, np.inf)
+    last = np.full(session_count, -np.inf)
+    np.minimum.at(first, session_ids, records['time'])
+    np.maximum.at(last, session_ids, records['time'])
+    
+    sessions = []
+    for index in range(session_count):
+        if np.isfinite(first[index]):
+            sessions.append({
+                'session': index,
+                'start': float(first[index]),
+                'duration': float(last[index] - first[index]),
+                'clicks': int(clicks[index]),
+                'earned': int(earned[index]),
+                'purchases': int(purchases[index]),
+            })
+    
+    upgrade_counts = np.bincount(records['code'][is_purchase], minlength=len(UPGRADES))
+    frame_ms = values[is_frame] / 1000
+    return {
+        'records': len(records),
+        'sessions': sessions,
+        'clicks': int(counts[is_clicks].sum()),
+        'macros': int((kinds == MACRO).sum()),
+        'purchases': {UPGRADES[code]['id'] if code < len(UPGRADES) else str(code): int(count)
+                      for code, count in enumerate(upgrade_counts) if count},
+        'frame_ms': {pct: float(np.percentile(frame_ms, pct)) for pct in (50, 95, 99)} if len(frame_ms) else {},
+    }
+
+def format_report(summary):
+    """
+    Format a log summary for the terminal.
+    
+    Args:
+        summary (dict): The summary from summarize().
+    
+    Returns:
+        str: The report.
+    """
+    lines = [
+        f"Records:  {summary['records']}",
+        f"Sessions: {len(summary['sessions'])}",
+        f"Clicks:   {summary['clicks']}",
+        f"Macros:   {summary['macros']}",
+    ]
+    if summary['purchases']:
+        lines.append("Purchases: " + ", ".join(f"{upgrade_id} x{count}"
+                                               for upgrade_id, count in summary['purchases'].items()))
+    if summary['frame_ms']:
+        lines.append("Frame ms: " + "  ".join(f"p{pct} {ms:.2f}" for pct, ms in summary['frame_ms'].items()))
+    
+    lines.append("")
+    lines.append(f"{'session':>8} {'minutes':>8} {'clicks':>8} {'earned':>10} {'purchases':>10}")
+    for session in summary['sessions']:
+        lines.append(f"{session['session']:>8} {session['duration'] / 60:>8.1f} {session['clicks']:>8} "
+                     f"{session['earned']:>10} {session['purchases']:>10}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """
+    Print a summary of an analytics log.
+    
+    Args:
+        argv (list, optional): The command line arguments.
+    
+    Returns:
+        int: The process exit code.
+    """
+    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser = argparse.ArgumentParser(description="Summarize a session analytics log.")
+    parser.add_argument('path', nargs='?', default=os.path.join(base_path, ANALYTICS_FILE),
+                        help="The log file (default: %(default)s)")
+    args = parser.parse_args(argv)
+    
+    try:
+        records = load_records(args.path)
+    except (OSError, ValueError) as e:
+        print(f"Error reading analytics log: {e}")
+        return 1
+    
+    print(format_report(summarize(records)))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""
+Asset manager for the clicker game.
+Caches images, sounds and fonts and preloads them on a background thread.
+"""
+
+import os
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import pygame
+from src.config import ASSET_MANIFEST, ATLAS_ENABLED
+from src.utils.helpers import ASSETS_DIR, load_image, load_sound, load_font
+from src.utils.texture_atlas import TextureAtlas
+
+class AssetManager:
+    """
+    Loads assets listed in a manifest and caches them by (kind, name, scale).
+    
+    The manifest is a JSON file of the form:
+    
+        {
+            "images": {"levi": {"file": "levi.png", "scales": [[90, 90]]}},
+            "sounds": {"click": {"file": "click.wav", "volume": 0.5}},
+            "fonts": {"main": {"file": "main.ttf", "sizes": [16, 24]}}
+        }
+    
+    Every image is loaded from disk once and each listed scale is produced
+    from it up front, so drawing never has to scale. With the texture atlas
+    enabled, preloading reads every listed image variant from one atlas
+    image instead. Requests for an asset that is already being loaded wait
+    for that load instead of starting another one.
+    """
+    def __init__(self, manifest_path=None, assets_dir=ASSETS_DIR, use_atlas=ATLAS_ENABLED):
+        """
+        Initialize the asset manager.
+        
+        Args:
+            manifest_path (str, optional): The path of the manifest file.
+                                          Defaults to ASSET_MANIFEST in the assets directory.
+            assets_dir (str, optional): The base directory for assets.
+            use_atlas (bool, optional): Whether to preload images from the texture atlas.
+        """
+        self.assets_dir = assets_dir
+        self.use_atlas = use_atlas
+        self.atlas = None  # The TextureAtlas, once preloaded
+        self.manifest_path = manifest_path or os.path.join(assets_dir, ASSET_MANIFEST)
+        self.manifest = self.load_manifest()
+        self.cache = {}  # Dictionary of (kind, name, scale) -> asset
+        self.pending = {}  # Dictionary of (kind, name, scale) -> Future
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='assets')
+        self.preload_keys = set()
+        self.loaded_count = 0
+        self.total_count = 0
+    
+    def load_manifest(self):
+        """
+        Read the asset manifest.
+        
+        Returns:
+            dict: The manifest, or an empty manifest if it could not be read.
+        """
+        manifest = {'images': {}, 'sounds': {}, 'fonts': {}}
+        
+        if not os.path.exists(self.manifest_path):
+            return manifest
+        
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error loading asset manifest: {e}")
+        
+        return manifest
+    
+    @property
+    def progress(self):
+        """
+        Get the fraction of preloaded assets that have finished loading.
+        
+        Returns:
+            float: The progress from 0.0 to 1.0.
+        """
+        if self.total_count == 0:
+            return 1.0
+        return self.loaded_count / self.total_count
+    
+    def preload(self, on_progress=None):
+        """
+        Load every asset in the manifest on the background thread.
+        
+        Args:
+            on_progress (function, optional): Called as on_progress(loaded, total, name)
+                                             after each asset finishes. It runs on the
+                                             loader thread, so it must not draw.
+        
+        Returns:
+            list: The futures of the scheduled loads.
+        """
+        requests = []
+        for name, entry in self.manifest['images'].items():
+            # The original size is only preloaded when no scaled variants are listed
+            scales = [tuple(s) for s in entry.get('scales', [])] or [None]
+            for scale in scales:
+                requests.append(('image', name, scale))
+        for name in self.manifest['sounds']:
+            requests.append(('sound', name, None))
+        for name, entry in self.manifest['fonts'].items():
+            for size in entry.get('sizes', []):
+                requests.append(('font', name, size))
+        
+        with self.lock:
+            new_keys = [key for key in requests if key not in self.preload_keys]
+            self.preload_keys.update(new_keys)
+            self.loaded_count += sum(1 for key in new_keys if key in self.cache)
+            self.total_count += len(new_keys)
+            
+            # One atlas load provides every image variant in the manifest
+            if self.use_atlas and self.atlas is None:
+                image_keys = [key for key in requests
+                              if key[0] == 'image' and key not in self.cache and key not in self.pending]
+                if image_keys:
+                    future = self.executor.submit(self._load_atlas, image_keys)
+                    for key in image_keys:
+                        self.pending[key] = future
+        
+        futures = []
+        for key in requests:
+            future = self._request(key)
+            if on_progress is not None:
+                future.add_done_callback(
+                    lambda _, name=key[1]: on_progress(self.loaded_count, self.total_count, name)
+                )
+            futures.append(future)
+        return futures
+    
+    def wait(self):
+        """Block until every scheduled load has finished."""
+        with self.lock:
+            futures = list(self.pending.values())
+        for future in futures:
+            future.result()
+    
+    def get_image(self, name, scale=None):
+        """
+        Get an image, loading it if it is not cached yet.
+        
+        Args:
+            name (str): The manifest name or filename of the image.
+            scale (tuple, optional): The size (width, height) of the image.
+        
+        Returns:
+            pygame.Surface: The image.
+        """
+        return self._get(('image', name, tuple(scale) if scale else None))
+    
+    def get_sound(self, name):
+        """
+        Get a sound, loading it if it is not cached yet.
+        
+        Args:
+            name (str): The manifest name or filename of the sound.
+        
+        Returns:
+            pygame.mixer.Sound: The sound, or None if it could not be loaded.
+        """
+        return self._get(('sound', name, None))
+    
+    def get_font(self, name, size):
+        """
+        Get a font, loading it if it is not cached yet.
+        
+        A font that fails to load falls back to SysFont once and the
+        fallback is cached like any other font.
+        
+        Args:
+            name (str): The manifest name or filename of the font.
+            size (int): The size of the font.
+        
+        Returns:
+            pygame.font.Font: The font.
+        """
+        return self._get(('font', name, size))
+    
+    def peek(self, kind, name, scale=None):
+        """
+        Get an asset without ever blocking.
+        
+        If the asset is not cached yet its load is scheduled on the
+        background thread and None is returned.
+        
+        Args:
+            kind (str): The asset kind ('image', 'sound' or 'font').
+            name (str): The name of the asset.
+            scale (tuple or int, optional): The image size or font size.
+        
+        Returns:
+            The asset, or None if it is not loaded yet.
+        """
+        key = (kind, name, scale)
+        asset = self.cache.get(key)
+        if asset is None and key not in self.cache:
+            self._request(key)
+        return asset
+    
+    def is_cached(self, kind, name, scale=None):
+        """
+        Check if an asset is already loaded.
+        
+        Args:
+            kind (str): The asset kind ('image', 'sound' or 'font').
+            name (str): The name of the asset.
+            scale (tuple or int, optional): The image size or font size.
+        
+        Returns:
+            bool: True if the asset is cached, False otherwise.
+        """
+        return (kind, name, scale) in self.cache
+    
+    def clear(self):
+        """Drop every cached asset and reset preload progress."""
+        with self.lock:
+            self.cache.clear()
+            self.preload_keys.clear()
+            self.loaded_count = 0
+            self.total_count = 0
+    
+    def shutdown(self):
+        """Stop the loader thread after pending loads finish."""
+        self.executor.shutdown(wait=True)
+    
+    def _get(self, key):
+        """Return a cached asset, waiting for or starting its load if needed."""
+        asset = self.cache.get(key)
+        if asset is not None or key in self.cache:
+            return asset
+        
+        self._request(key).result()
+        return self.cache.get(key)
+    
+    def _request(self, key):
+        """Schedule a load for a key unless it is cached or already pending."""
+        with self.lock:
+            if key in self.cache:
+                future = Future()
+                future.set_result(self.cache[key])
+                return future
+            
+            future = self.pending.get(key)
+            if future is None:
+                future = self.executor.submit(self._load, key)
+                self.pending[key] = future
+            return future
+    
+    def _load(self, key):
+        """Load a single asset on the loader thread and store it in the cache."""
+        if key in self.cache:
+            asset = self.cache[key]
+        else:
+            kind, name, scale = key
+            if kind == 'image':
+                asset = self._load_image(name, scale)
+            elif kind == 'sound':
+                entry = self.manifest['sounds'].get(name, {})
+                asset = load_sound(entry.get('file', name), entry.get('volume', 1.0))
+            else:
+                entry = self.manifest['fonts'].get(name, {})
+                asset = load_font(entry.get('file', name), scale)
+        
+        with self.lock:
+            self.cache[key] = asset
+            self.pending.pop(key, None)
+            if key in self.preload_keys:
+                self.loaded_count += 1
+        return asset
+    
+    def _load_atlas(self, keys):
+        """
+        Load the texture atlas on the loader thread and cache its sprites.
+        
+        Keys the atlas does not hold are loaded one by one instead.
+        
+        Args:
+            keys (list): The image keys waiting on the atlas.
+        """
+        try:
+            self.atlas = TextureAtlas.load_or_build(self.manifest['images'], self.assets_dir)
+        except (pygame.error, OSError, ValueError) as e:
+            print(f"Error loading texture atlas: {e}")
+        
+        for key in keys:
+            _, name, scale = key
+            sprite = self.atlas.get(name, scale) if self.atlas is not None else None
+            if sprite is None:
+                self._load(key)
+                continue
+            
+            with self.lock:
+                self.cache[key] = sprite
+                self.pending.pop(key, None)
+                if key in self.preload_keys:
+                    self.loaded_count += 1
+    
+    def _load_image(self, name, scale):
+        """Load an image from disk once and produce a scaled copy if requested."""
+        base = self.cache.get(('image', name, None))
+        if base is None:
+            entry = self.manifest['images'].get(name, {})
+            base = load_image(entry.get('file', name))
+            with self.lock:
+                self.cache[('image', name, None)] = base
+        
+        if scale is None:
+            return base
+        
+        try:
+            return pygame.transform.smoothscale(base, scale)
+        except ValueError:
+            # smoothscale only supports 24 and 32 bit surfaces
+            return pygame.transform.scale(base, scale)
@@ -0,0 +1,231 @@
+"""
+Click rate tracking and macro detection for the clicker game.
+"""
+
+import math
+from array import array
+from src.config import (CLICK_RATE_WINDOWS, CLICK_RATE_BUCKETS, MACRO_SAMPLES, MACRO_MAX_CV,
+                        MACRO_MAX_RATE, MACRO_RESET_GAP)
+
+class SlidingWindowCounter:
+    """
+    Counts events over the last `window` seconds.
+    
+    The window is split into a ring of time buckets and a running total is
+    kept. Adding an event only touches the current bucket; buckets that
+    slide out of the window are subtracted as time moves on, so the cost
+    per event does not depend on how many events are in the window.
+    """
+    __slots__ = ('window', 'bucket_width', 'counts', 'total', 'current')
+    
+    def __init__(self, window, buckets=CLICK_RATE_BUCKETS):
+        """
+        Initialize a sliding window counter.
+        
+        Args:
+            window (float): The length of the window in seconds.
+            buckets (int, optional): The number of buckets the window is split into.
+        """
+        self.window = window
+        self.bucket_width = window / buckets
+        self.counts = [0] * buckets
+        self.total = 0
+        self.current = None  # Absolute index of the newest bucket
+    
+    def advance(self, now):
+        """
+        Drop the buckets that have left the window.
+        
+        Args:
+            now (float): The current time in seconds.
+        """
+        index = int(now // self.bucket_width)
+        current = self.current
+        if current is None or index - current >= len(self.counts):
+            # Everything has left the window
+            if self.total:
+                self.counts[:] = [0] * len(self.counts)
+                self.total = 0
+        else:
+            counts = self.counts
+            for stale in range(current + 1, index + 1):
+                slot = stale % len(counts)
+                self.total -= counts[slot]
+                counts[slot] = 0
+        if current is None or index > current:
+            self.current = index
+    
+    def add(self, now, count=1):
+        """
+        Count events.
+        
+        Args:
+            now (float): The time of the events in seconds.
+            count (int, optional): The number of events.
+        """
+        self.advance(now)
+        self.counts[self.current % len(self.counts)] += count
+        self.total += count
+    
+    def rate(self, now):
+        """
+        Get the events per second over the window.
+        
+        Args:
+            now (float): The current time in seconds.
+        
+        Returns:
+            float: The average rate over the window.
+        """
+        self.advance(now)
+        return self.total / self.window
+
+class MacroDetector:
+    """
+    Flags click streams that are too fast or too regular to be human.
+    
+    The last MACRO_SAMPLES click intervals are kept in a ring together with
+    their running sum and sum of squares, so the mean and variance of the
+    intervals are updated in constant time per click. The sums are
+    recomputed from the ring each time it wraps, so rounding errors do not
+    build up. A pause longer than MACRO_RESET_GAP starts a new streak.
+    
+    Clicks handled in the same frame arrive together; each batch adds one
+    interval, the average gap of its clicks.
+    """
+    __slots__ = ('samples', 'max_cv', 'max_rate', 'reset_gap', 'intervals', 'head', 'count',
+                 'total', 'total_sq', 'last_time', 'flagged', 'reason')
+    
+    def __init__(self, samples=MACRO_SAMPLES, max_cv=MACRO_MAX_CV, max_rate=MACRO_MAX_RATE,
+                 reset_gap=MACRO_RESET_GAP):
+        """
+        Initialize a macro detector.
+        
+        Args:
+            samples (int, optional): The number of click intervals each check looks at.
+            max_cv (float, optional): Interval standard deviation over mean below which clicks
+                are too regular.
+            max_rate (float, optional): The clicks per second above which clicks are too fast.
+            reset_gap (float, optional): The pause in seconds that starts a new streak.
+        """
+        self.samples = samples
+        self.max_cv = max_cv
+        self.max_rate = max_rate
+        self.reset_gap = reset_gap
+        self.intervals = array('d', bytes(8 * samples))
+        self.head = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.last_time = None
+        self.flagged = False
+        self.reason = None  # 'rate' or 'regular' while flagged
+    
+    def reset(self):
+        """Forget the current streak."""
+        self.head = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.flagged = False
+        self.reason = None
+    
+    def record(self, now, count=1):
+        """
+        Record a batch of clicks and check the streak.
+        
+        Args:
+            now (float): The time of the clicks in seconds.
+            count (int, optional): The number of clicks in the batch.
+        
+        Returns:
+            bool: True if the streak has just been flagged, False otherwise.
+        """
+        last_time = self.last_time
+        self.last_time = now
+        if last_time is None:
+            return False
+        
+        elapsed = now - last_time
+        if elapsed > self.reset_gap:
+            self.reset()
+            return False
+        
+        # Replace the oldest interval in the running sums
+        interval = elapsed / count
+        head = self.head
+        if self.count == self.samples:
+            old = self.intervals[head]
+            self.total -= old
+            self.total_sq -= old * old
+        else:
+            self.count += 1
+        self.intervals[head] = interval
+        self.total += interval
+        self.total_sq += interval * interval
+        self.head = (head + 1) % self.samples
+        if self.head == 0:
+            self.total = math.fsum(self.intervals)
+            self.total_sq = math.fsum(value * value for value in self.intervals)
+        
+        if self.count < self.samples:
+            return False
+        
+        mean = self.total / self.samples
+        variance = max(0.0, self.total_sq / self.samples - mean * mean)
+        if mean * self.max_rate < 1:
+            reason = 'rate'
+        elif math.sqrt(variance) < self.max_cv * mean:
+            reason = 'regular'
+        else:
+            reason = None
+        
+        newly_flagged = reason is not None and not self.flagged
+        self.flagged = reason is not None
+        self.reason = reason
+        return newly_flagged
+
+class ClickRateTracker:
+    """
+    Tracks click rates over several sliding windows and watches for macros.
+    """
+    __slots__ = ('counters', 'detector')
+    
+    def __init__(self, windows=CLICK_RATE_WINDOWS, detector=None):
+        """
+        Initialize the tracker.
+        
+        Args:
+            windows (tuple, optional): The window lengths in seconds.
+            detector (MacroDetector, optional): The macro detector to feed, or None to not detect macros.
+        """
+        self.counters = {window: SlidingWindowCounter(window) for window in windows}
+        self.detector = detector
+    
+    def record(self, now, count=1):
+        """
+        Record a batch of clicks.
+        
+        Args:
+            now (float): The time of the clicks in seconds.
+            count (int, optional): The number of clicks.
+        
+        Returns:
+            bool: True if the clicks were just flagged as a macro, False otherwise.
+        """
+        for counter in self.counters.values():
+            counter.add(now, count)
+        return self.detector is not None and self.detector.record(now, count)
+    
+    def rate(self, window, now):
+        """
+        Get the clicks per second over a window.
+        
+        Args:
+            window (float): One of the tracked window lengths in seconds.
+            now (float): The current time in seconds.
+        
+        Returns:
+            float: The average clicks per second over the window.
+        """
+        return self.counters[window].rate(now)
\ No newline at end of file
@@ -0,0 +1,328 @@
+"""
+Upgrade content packs for the clicker game.
+
+A content pack is a directory of upgrade definitions in CONTENT_PACKS_DIR:
+
+    content_packs/
+        space/
+            rockets.json    {"upgrades": [{"id": "rocket", "name": "Rocket", ...}]}
+            stations.toml   [[upgrades]] tables with the same fields
+
+Packs are found at startup, but a pack's files are only parsed the first
+time its upgrades are asked for. Each file is validated and compiled into
+a marshal cache entry keyed by the hash of its contents, so later startups
+read the compiled definitions instead of parsing and validating again, and
+an edited file is compiled afresh.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+from src.config import CONTENT_PACKS_DIR, CONTENT_CACHE_DIR
+from src.models.upgrade import Upgrade, EFFECTS
+from src.models.unlocks import UnlockGraph, check_requirements, compile_requirements
+
+try:
+    import tomllib
+except ImportError:  # Python before 3.11 has no TOML parser
+    tomllib = None
+
+CACHE_VERSION = 1
+PACK_EXTENSIONS = ('.json', '.toml')
+
+# Fields an upgrade definition needs, with their types
+REQUIRED_FIELDS = {
+    'id': str,
+    'name': str,
+    'base_cost': (int, float),
+    'cost_multiplier': (int, float),
+    'effect_value': (int, float),
+    'effect': str,
+}
+OPTIONAL_FIELDS = ('description', 'max_level', 'requires')
+
+def validate_upgrade(data, source):
+    """
+    Check an upgrade definition and compile it into Upgrade arguments.
+    
+    Args:
+        data (dict): The upgrade definition.
+        source (str): Where the definition came from, for error messages.
+    
+    Returns:
+        tuple: The positional arguments of Upgrade.
+    
+    Raises:
+        ValueError: If the definition is invalid.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: upgrades must be tables, not {type(data).__name__}")
+    
+    where = f"{source}: upgrade {data.get('id')!r}"
+    for field, types in REQUIRED_FIELDS.items():
+        value = data.get(field)
+        if not isinstance(value, types) or isinstance(value, bool):
+            raise ValueError(f"{where} needs '{field}'")
+    unknown = set(data) - set(REQUIRED_FIELDS) - set(OPTIONAL_FIELDS)
+    if unknown:
+        raise ValueError(f"{where} has unknown fields: {', '.join(sorted(unknown))}")
+    if data['effect'] not in EFFECTS:
+        raise ValueError(f"{where} has unknown effect {data['effect']!r}")
+    if data['base_cost'] < 0 or data['cost_multiplier'] <= 0:
+        raise ValueError(f"{where} needs a base_cost of 0 or more and a positive cost_multiplier")
+    
+    max_level = data.get('max_level')
+    if max_level is not None and (not isinstance(max_level, int) or isinstance(max_level, bool) or max_level < 1):
+        raise ValueError(f"{where} needs a max_level of 1 or more")
+    
+    requires = data.get('requires')
+    if requires is not None:
+        if not isinstance(requires, dict):
+            raise ValueError(f"{where} needs 'requires' to be a table")
+        try:
+            compile_requirements(requires)
+        except ValueError as e:
+            raise ValueError(f"{where}: {e}") from None
+    
+    return (data['id'], data['name'], data.get('description', ''), data['base_cost'], data['cost_multiplier'],
+            data['effect_value'], max_level, requires, data['effect'])
+
+def compile_file(path, raw):
+    """
+    Parse and validate a pack file.
+    
+    Args:
+        path (str): The path of the file.
+        raw (bytes): The contents of the file.
+    
+    Returns:
+        list: The Upgrade arguments of each upgrade in the file.
+    
+    Raises:
+        ValueError: If the file cannot be parsed or an upgrade is invalid.
+    """
+    try:
+        if path.endswith('.toml'):
+            if tomllib is None:
+                raise ValueError("TOML packs need Python 3.11 or newer")
+            data = tomllib.loads(raw.decode('utf-8'))
+        else:
+            data = json.loads(raw)
+    except ValueError as e:  # Including JSON, TOML and UTF-8 decoding errors
+        raise ValueError(f"{path}: {e}") from None
+    
+    if not isinstance(data, dict) or not isinstance(data.get('upgrades'), list):
+        raise ValueError(f"{path}: expected a list of 'upgrades'")
+    return [validate_upgrade(upgrade, path) for upgrade in data['upgrades']]
+
+def read_cache(cache_path, digest):
+    """
+    Read a compiled file from the cache.
+    
+    Args:
+        cache_path (str): The path of the cache entry.
+        digest (str): The hash of the file the entry has to be compiled from.
+    
+    Returns:
+        list: The Upgrade arguments, or None if the entry is missing or stale.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            version, cached_digest, rows = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION or cached_digest != digest:
+        return None
+    return rows
+
+def write_cache(cache_path, digest, rows):
+    """
+    Write a compiled file to the cache.
+    
+    The entry is written to a temporary file that then replaces the old
+    one, so an interrupted write never leaves a broken entry.
+    
+    Args:
+        cache_path (str): The path of the cache entry.
+        digest (str): The hash of the file the rows were compiled from.
+        rows (list): The Upgrade arguments.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(marshal.dumps((CACHE_VERSION, digest, rows)))
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Error caching content pack file: {e}")
+
+def load_file(path, cache_path):
+    """
+    Load a pack file, from the cache if it was compiled before.
+    
+    Args:
+        path (str): The path of the file.
+        cache_path (str): The path of its cache entry.
+    
+    Returns:
+        list: The Upgrade arguments of each upgrade in the file.
+    
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is invalid.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    rows = read_cache(cache_path, digest)
+    if rows is None:
+        rows = compile_file(path, raw)
+        write_cache(cache_path, digest, rows)
+    return rows
+
+class ContentPack:
+    """
+    A directory of upgrade definitions, parsed the first time they are needed.
+    """
+    __slots__ = ('name', 'path', 'files', 'cache_dir', '_upgrades')
+    
+    def __init__(self, path, cache_dir):
+        """
+        Find the files of a pack without reading them.
+        
+        Args:
+            path (str): The pack directory.
+            cache_dir (str): The directory compiled packs are cached in.
+        """
+        self.name = os.path.basename(path)
+        self.path = path
+        self.files = sorted(entry.name for entry in os.scandir(path)
+                            if entry.is_file() and entry.name.endswith(PACK_EXTENSIONS))
+        self.cache_dir = os.path.join(cache_dir, self.name)
+        self._upgrades = None
+    
+    @property
+    def loaded(self):
+        """
+        Check if the pack's files have been read.
+        
+        Returns:
+            bool: True if the upgrades are loaded, False otherwise.
+        """
+        return self._upgrades is not None
+    
+    @property
+    def upgrades(self):
+        """
+        Get the pack's upgrades, loading them on first use.
+        
+        Returns:
+            list: The Upgrade objects of every file, in file name order.
+        
+        Raises:
+            OSError: If a file cannot be read.
+            ValueError: If a file is invalid or an upgrade ID is used twice.
+        """
+        if self._upgrades is None:
+            upgrades = []
+            seen = set()
+            for file_name in self.files:
+                rows = load_file(os.path.join(self.path, file_name),
+                                 os.path.join(self.cache_dir, file_name + '.bin'))
+                for row in rows:
+                    if row[0] in seen:
+                        raise ValueError(f"{self.name}/{file_name}: upgrade {row[0]!r} is defined twice")
+                    seen.add(row[0])
+                    upgrades.append(Upgrade(*row))
+            self._upgrades = upgrades
+        return self._upgrades
+
+def discover_packs(packs_dir=CONTENT_PACKS_DIR, cache_dir=CONTENT_CACHE_DIR):
+    """
+    Find the content packs without parsing them.
+    
+    Args:
+        packs_dir (str, optional): The packs directory, relative to the project directory.
+        cache_dir (str, optional): The cache directory, relative to the project directory.
+    
+    Returns:
+        list: The ContentPack objects, in name order.
+    """
+    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    packs_path = os.path.join(base_path, packs_dir)
+    cache_path = os.path.join(base_path, cache_dir)
+    if not os.path.isdir(packs_path):
+        return []
+    
+    return [ContentPack(entry.path, cache_path)
+            for entry in sorted(os.scandir(packs_path), key=lambda entry: entry.name)
+            if entry.is_dir() and not entry.name.startswith('.')]
+
+def add_pack_upgrades(upgrades, packs, achievement_ids=None):
+    """
+    Load content packs and add their upgrades.
+    
+    A pack that cannot be loaded, reuses an upgrade ID or has prerequisites
+    that name unknown upgrades or achievements or form a cycle is skipped
+    as a whole, so its upgrades never refer to ones that are missing. The
+    other packs are still added. Each pack is only checked against the
+    upgrades added before it, so the work grows with the pack sizes, not
+    with the number of packs times the upgrades so far.
+    
+    Args:
+        upgrades (dict): A dictionary of upgrade_id -> Upgrade to add to.
+        packs (list): The ContentPack objects to load.
+        achievement_ids (iterable, optional): The known achievement IDs, to check prerequisites against.
+    
+    Returns:
+        dict: The same upgrades dictionary.
+    """
+    if achievement_ids is not None:
+        achievement_ids = list(achievement_ids)
+    
+    for pack in packs:
+        try:
+            pack_upgrades = pack.upgrades
+        except (OSError, ValueError) as e:
+            print(f"Error loading content pack {pack.name}: {e}")
+            continue
+        
+        clashes = [upgrade.id for upgrade in pack_upgrades if upgrade.id in upgrades]
+        if clashes:
+            print(f"Error loading content pack {pack.name}: upgrade IDs already in use: {', '.join(clashes)}")
+            continue
+        
+        try:
+            check_requirements({upgrade.id: upgrade for upgrade in pack_upgrades}, upgrades, achievement_ids)
+        except ValueError as e:
+            print(f"Error loading content pack {pack.name}: {e}")
+            continue
+        upgrades.update((upgrade.id, upgrade) for upgrade in pack_upgrades)
+    return upgrades
+
+def load_pack_upgrades(upgrades, packs=None, achievement_ids=None):
+    """
+    Load content packs into a copy of the upgrades and compile their prerequisites.
+    
+    Nothing passed in is changed, so this can run on a background thread
+    while the game keeps using the upgrades.
+    
+    Args:
+        upgrades (dict): The current dictionary of upgrade_id -> Upgrade.
+        packs (list, optional): The ContentPack objects, or None for the packs in CONTENT_PACKS_DIR.
+        achievement_ids (list, optional): The known achievement IDs, to check prerequisites against.
+    
+    Returns:
+        tuple: The upgrades with the packs' added after them, and the UnlockGraph of all of
+            them, or None if no pack added anything.
+    """
+    if packs is None:
+        packs = discover_packs()
+    upgrades = dict(upgrades)
+    count = len(upgrades)
+    add_pack_upgrades(upgrades, packs, achievement_ids)
+    if len(upgrades) == count:
+        return upgrades, None
+    return upgrades, UnlockGraph(upgrades, achievement_ids)
\ No newline at end of file
@@ -7,11 +7,52 @@ import pygame
 import random
 import time
 import math
+from src.config import SOUND_ENABLED, SOUND_BUFFER_SIZE
+from src.ui.text import get_glyph_atlas
+
+# Base directory for game assets, computed once at import time
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'assets')
+
+def init_subsystems():
+    """
+    Initialize the pygame subsystems the game needs.
+    
+    Only the display and font modules are started; unlike pygame.init(),
+    this skips joystick, camera and audio. The mixer is started on first
+    use by init_mixer. Calling this more than once is cheap.
+    """
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+def init_mixer():
+    """
+    Initialize the mixer on first use.
+    
+    Returns:
+        bool: True if the mixer is available, False otherwise.
+    """
+    if pygame.mixer.get_init():
+        return True
+    
+    if not SOUND_ENABLED:
+        return False
+    
+    try:
+        # A small buffer keeps the delay between play() and audible output low
+        pygame.mixer.init(buffer=SOUND_BUFFER_SIZE)
+        return True
+    except pygame.error as e:
+        print(f"Error initializing mixer: {e}")
+        return False
 
 def load_image(filename, scale=None, convert_alpha=True):
     """
     Load an image from the assets directory.
     
+    This always reads from disk; use AssetManager for cached access.
+    
     Args:
         filename (str): The filename of the image.
         scale (tuple, optional): The scale to resize the image to (width, height).
@@ -20,20 +61,20 @@ def load_image(filename, scale=None, convert_alpha=True):
     Returns:
         pygame.Surface: The loaded image.
     """
-    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    image_path = os.path.join(base_path, 'assets', 'images', filename)
+    image_path = os.path.join(ASSETS_DIR, 'images', filename)
     
     try:
-        if convert_alpha:
-            image = pygame.image.load(image_path).convert_alpha()
-        else:
-            image = pygame.image.load(image_path).convert()
+        image = pygame.image.load(image_path)
+        
+        # Converting needs a display mode, which may not be set yet when preloading
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if convert_alpha else image.convert()
         
         if scale:
             image = pygame.transform.scale(image, scale)
         
         return image
-    except pygame.error as e:
+    except (pygame.error, OSError) as e:
         print(f"Error loading image {filename}: {e}")
         # Create a placeholder surface
         surface = pygame.Surface((50, 50))
@@ -49,16 +90,18 @@ def load_sound(filename, volume=1.0):
         volume (float, optional): The volume of the sound (0.0 to 1.0).
         
     Returns:
-        pygame.mixer.Sound: The loaded sound.
+        pygame.mixer.Sound: The loaded sound, or None if it could not be loaded.
     """
-    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    sound_path = os.path.join(base_path, 'assets', 'sounds', filename)
+    sound_path = os.path.join(ASSETS_DIR, 'sounds', filename)
+    
+    if not init_mixer():
+        return None
     
     try:
         sound = pygame.mixer.Sound(sound_path)
         sound.set_volume(volume)
         return sound
-    except pygame.error as e:
+    except (pygame.error, OSError) as e:
         print(f"Error loading sound {filename}: {e}")
         return None
 
@@ -73,16 +116,86 @@ def load_font(filename, size):
     Returns:
         pygame.font.Font: The loaded font.
     """
-    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    font_path = os.path.join(base_path, 'assets', 'fonts', filename)
+    font_path = os.path.join(ASSETS_DIR, 'fonts', filename)
     
     try:
         return pygame.font.Font(font_path, size)
-    except pygame.error as e:
+    except (pygame.error, OSError) as e:
         print(f"Error loading font {filename}: {e}")
         return pygame.font.SysFont('Arial', size)
 
-def create_particle(position, color, velocity=None, size=5, lifetime=1.0):
+class Particle:
+    """
+    A visual effect particle.
+    
+    Uses __slots__ because hundreds of particles can be alive at once.
+    Circle particles have text set to None; text particles draw their text
+    with size as the font size.
+    """
+    __slots__ = ('position', 'velocity', 'color', 'size', 'lifetime', 'creation_time', 'text')
+    
+    def __init__(self, position, velocity, color, size, lifetime, creation_time=None, text=None):
+        """
+        Initialize a particle.
+        
+        Args:
+            position (list): The position [x, y] of the particle.
+            velocity (list): The velocity [dx, dy] of the particle.
+            color (tuple): The color of the particle.
+            size (int): The radius of the particle, or the font size for text.
+            lifetime (float): The lifetime of the particle in seconds.
+            creation_time (float, optional): The time the particle was created.
+            text (str, optional): The text to show instead of a circle.
+        """
+        self.position = position
+        self.velocity = velocity
+        self.color = color
+        self.size = size
+        self.lifetime = lifetime
+        self.creation_time = time.time() if creation_time is None else creation_time
+        self.text = text
+    
+    def to_dict(self):
+        """
+        Convert the particle to the dictionary format used before particles were objects.
+        
+        Returns:
+            dict: The particle data as a dictionary.
+        """
+        data = {
+            'position': self.position,
+            'velocity': self.velocity,
+            'color': self.color,
+            'size': self.size,
+            'lifetime': self.lifetime,
+            'creation_time': self.creation_time
+        }
+        if self.text is not None:
+            data['text'] = self.text
+        return data
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a particle from a particle dictionary.
+        
+        Args:
+            data (dict): The particle data.
+            
+        Returns:
+            Particle: A new particle with the given data.
+        """
+        return cls(
+            list(data['position']),
+            list(data['velocity']),
+            data['color'],
+            data['size'],
+            data['lifetime'],
+            data.get('creation_time'),
+            data.get('text')
+        )
+
+def create_particle(position, color, velocity=None, size=5, lifetime=1.0, rng=random):
     """
     Create a particle for visual effects.
     
@@ -92,54 +205,97 @@ def create_particle(position, color, velocity=None, size=5, lifetime=1.0):
         velocity (tuple, optional): The velocity (dx, dy) of the particle.
         size (int, optional): The size of the particle.
         lifetime (float, optional): The lifetime of the particle in seconds.
+        rng (random.Random, optional): The random generator used for the velocity.
         
     Returns:
-        dict: A particle object.
+        Particle: A particle object.
     """
     if velocity is None:
-        angle = random.uniform(0, 360)
-        speed = random.uniform(50, 150)
+        angle = rng.uniform(0, 360)
+        speed = rng.uniform(50, 150)
         velocity = (
             speed * math.cos(math.radians(angle)),
             speed * math.sin(math.radians(angle))
         )
     
-    return {
-        'position': list(position),
-        'velocity': list(velocity),
-        'color': color,
-        'size': size,
-        'lifetime': lifetime,
-        'creation_time': time.time()
-    }
+    return Particle(list(position), list(velocity), color, size, lifetime)
+
+def create_particle_burst(positions, color, count, rng):
+    """
+    Create many particles at once using batched random draws.
+    
+    Args:
+        positions (list): The positions (x, y) to spread the particles across.
+        color (tuple): The color of the particles.
+        count (int): The number of particles to create.
+        rng (RandomStream): The random stream to draw from.
+        
+    Returns:
+        list: The new particles.
+    """
+    if count <= 0 or not positions:
+        return []
+    
+    velocities = rng.velocity_batch(50, 150, count)
+    sizes = rng.randint_batch(3, 8, count)
+    lifetimes = rng.uniform_batch(0.5, 1.5, count)
+    step = len(positions) / count
+    now = time.time()
+    
+    return [
+        Particle(list(positions[int(i * step)]), velocities[i], color, sizes[i], lifetimes[i], now)
+        for i in range(count)
+    ]
+
+def create_text_particle(position, text, color, size=16, lifetime=1.0, rise_speed=50):
+    """
+    Create a floating text particle that rises and fades out.
+    
+    Args:
+        position (tuple): The position (x, y) of the text center.
+        text (str): The text to show, e.g. "+15".
+        color (tuple): The color of the text.
+        size (int, optional): The font size of the text.
+        lifetime (float, optional): The lifetime of the particle in seconds.
+        rise_speed (float, optional): The upward speed in pixels per second.
+        
+    Returns:
+        Particle: A particle object.
+    """
+    return Particle(list(position), [0, -rise_speed], color, size, lifetime, text=text)
 
 def update_particle(particle, dt):
     """
     Update a particle's position and lifetime.
     
     Args:
-        particle (dict): The particle to update.
+        particle (Particle): The particle to update.
         dt (float): The time elapsed since the last update in seconds.
         
     Returns:
         bool: True if the particle is still alive, False otherwise.
     """
     # Update position
-    particle['position'][0] += particle['velocity'][0] * dt
-    particle['position'][1] += particle['velocity'][1] * dt
+    position = particle.position
+    velocity = particle.velocity
+    position[0] += velocity[0] * dt
+    position[1] += velocity[1] * dt
     
-    # Apply gravity
-    particle['velocity'][1] += 200 * dt  # Gravity
-    
-    # Reduce size over time
-    elapsed = time.time() - particle['creation_time']
-    remaining = 1.0 - (elapsed / particle['lifetime'])
+    elapsed = time.time() - particle.creation_time
+    remaining = 1.0 - (elapsed / particle.lifetime)
     
     if remaining <= 0:
         return False
     
-    # Fade out
-    particle['size'] = max(1, int(particle['size'] * remaining))
+    # Text keeps its size and rises at a steady speed
+    if particle.text is not None:
+        return True
+    
+    # Apply gravity
+    velocity[1] += 200 * dt  # Gravity
+    
+    # Reduce size over time
+    particle.size = max(1, int(particle.size * remaining))
     
     return True
 
@@ -149,26 +305,34 @@ def render_particle(surface, particle):
     
     Args:
         surface (pygame.Surface): The surface to render on.
-        particle (dict): The particle to render.
+        particle (Particle): The particle to render.
     """
     # Calculate alpha based on remaining lifetime
-    elapsed = time.time() - particle['creation_time']
-    remaining = 1.0 - (elapsed / particle['lifetime'])
-    alpha = int(255 * remaining)
+    elapsed = time.time() - particle.creation_time
+    remaining = 1.0 - (elapsed / particle.lifetime)
+    alpha = max(0, int(255 * remaining))
+    
+    # Text particles are composed from the cached glyph atlas
+    if particle.text is not None:
+        atlas = get_glyph_atlas(particle.size, particle.color)
+        atlas.render(surface, particle.text, particle.position, alpha, centered=True)
+        return
+    
+    size = particle.size
     
     # Create a surface for the particle
-    particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
+    particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
     
     # Draw the particle
     pygame.draw.circle(
         particle_surface,
-        (*particle['color'], alpha),
-        (particle['size'], particle['size']),
-        particle['size']
+        (*particle.color, alpha),
+        (size, size),
+        size
     )
     
     # Blit the particle surface onto the main surface
     surface.blit(
         particle_surface,
-        (particle['position'][0] - particle['size'], particle['position'][1] - particle['size'])
+        (particle.position[0] - size, particle.position[1] - size)
     )
\ No newline at end of file
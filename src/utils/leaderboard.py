@@ -0,0 +1,222 @@
+"""
+Speedrun leaderboard for the clicker game.
+"""
+
+import os
+import sqlite3
+import time
+from src.config import LEADERBOARD_FILE, LEADERBOARD_SIZE
+
+def format_time(seconds):
+    """
+    Format a run time the way the leaderboard shows it.
+    
+    Args:
+        seconds (float): The run time in seconds.
+    
+    Returns:
+        str: The time as minutes:seconds, e.g. "2:05".
+    """
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+class Leaderboard:
+    """
+    Stores win times to WIN_AMOUNT in an SQLite database.
+    
+    Every run is kept in a table indexed by time, so inserts are O(log n)
+    and the top K are read straight off the index. A second table keeps
+    each profile's personal best, so per-profile rankings never scan all
+    runs. The database uses write-ahead logging, so a crash never loses a
+    committed score and readers do not block the game while it writes.
+    
+    Triggers keep a count of runs per whole second of run time for both
+    tables, so a rank sums the few hundred buckets before the run's second
+    and only counts rows inside that one second, however far down the
+    table the run lands.
+    """
+    def __init__(self, db_file=LEADERBOARD_FILE):
+        """
+        Initialize the leaderboard, creating the database if needed.
+        
+        Args:
+            db_file (str, optional): The database file name, relative to the
+                project directory, or ':memory:' for a temporary leaderboard.
+        """
+        if db_file == ':memory:':
+            self.db_path = db_file
+        else:
+            base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            self.db_path = os.path.join(base_path, db_file)
+        
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        has_buckets = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'score_buckets'"
+        ).fetchone() is not None
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "id INTEGER PRIMARY KEY, profile TEXT NOT NULL, name TEXT NOT NULL, "
+                "time REAL NOT NULL, timestamp REAL NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS scores_by_time ON scores (time, id)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS bests ("
+                "profile TEXT PRIMARY KEY, name TEXT NOT NULL, "
+                "time REAL NOT NULL, timestamp REAL NOT NULL)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS bests_by_time ON bests (time)")
+            self.create_buckets(has_buckets)
+    
+    def create_buckets(self, has_buckets):
+        """
+        Create the per-second run counts and the triggers that keep them up to date.
+        
+        Args:
+            has_buckets (bool): Whether the database already has the counts; if not,
+                they are counted from the runs already recorded.
+        """
+        for buckets, table in (('score_buckets', 'scores'), ('best_buckets', 'bests')):
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {buckets} (bucket INTEGER PRIMARY KEY, count INTEGER NOT NULL)"
+            )
+            if not has_buckets:
+                self.connection.execute(
+                    f"INSERT INTO {buckets} (bucket, count) "
+                    f"SELECT CAST(time AS INTEGER), COUNT(*) FROM {table} GROUP BY 1"
+                )
+            self.connection.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_count_insert AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {buckets} (bucket, count) VALUES (CAST(NEW.time AS INTEGER), 1) "
+                f"ON CONFLICT (bucket) DO UPDATE SET count = count + 1; END"
+            )
+        self.connection.execute(
+            "CREATE TRIGGER IF NOT EXISTS bests_count_update AFTER UPDATE OF time ON bests BEGIN "
+            "UPDATE best_buckets SET count = count - 1 WHERE bucket = CAST(OLD.time AS INTEGER); "
+            "INSERT INTO best_buckets (bucket, count) VALUES (CAST(NEW.time AS INTEGER), 1) "
+            "ON CONFLICT (bucket) DO UPDATE SET count = count + 1; END"
+        )
+    
+    def add_score(self, run_time, name="Anonymous", profile=None):
+        """
+        Record a win.
+        
+        Args:
+            run_time (float): The time taken to reach WIN_AMOUNT in seconds.
+            name (str, optional): The name shown on the leaderboard.
+            profile (str, optional): The player profile, defaults to the name.
+        
+        Returns:
+            bool: True if the run is a new personal best for the profile.
+        """
+        profile = profile or name
+        timestamp = time.time()
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO scores (profile, name, time, timestamp) VALUES (?, ?, ?, ?)",
+                (profile, name, run_time, timestamp)
+            )
+            cursor = self.connection.execute(
+                "INSERT INTO bests (profile, name, time, timestamp) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (profile) DO UPDATE SET name = excluded.name, time = excluded.time, "
+                "timestamp = excluded.timestamp WHERE excluded.time < bests.time",
+                (profile, name, run_time, timestamp)
+            )
+        return cursor.rowcount > 0
+    
+    def add_scores(self, scores):
+        """
+        Record many wins in one transaction, e.g. when importing.
+        
+        Args:
+            scores (list): (run_time, name, profile) tuples; profile may be None.
+        """
+        timestamp = time.time()
+        rows = [(profile or name, name, run_time, timestamp) for run_time, name, profile in scores]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO scores (profile, name, time, timestamp) VALUES (?, ?, ?, ?)", rows
+            )
+            self.connection.executemany(
+                "INSERT INTO bests (profile, name, time, timestamp) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (profile) DO UPDATE SET name = excluded.name, time = excluded.time, "
+                "timestamp = excluded.timestamp WHERE excluded.time < bests.time",
+                rows
+            )
+    
+    def get_top(self, count=LEADERBOARD_SIZE, per_profile=False):
+        """
+        Get the fastest runs.
+        
+        Args:
+            count (int, optional): The number of runs to return.
+            per_profile (bool, optional): Whether to only include each profile's best run.
+        
+        Returns:
+            list: Dictionaries with 'name', 'profile', 'time' and 'timestamp', fastest first.
+        """
+        table = "bests" if per_profile else "scores"
+        order = "time" if per_profile else "time, id"
+        rows = self.connection.execute(
+            f"SELECT name, profile, time, timestamp FROM {table} ORDER BY {order} LIMIT ?", (count,)
+        )
+        return [{'name': name, 'profile': profile, 'time': run_time, 'timestamp': timestamp}
+                for name, profile, run_time, timestamp in rows]
+    
+    def get_rank(self, run_time, per_profile=False):
+        """
+        Get the rank a run time would have.
+        
+        Args:
+            run_time (float): The run time in seconds.
+            per_profile (bool, optional): Whether to rank against personal bests only.
+        
+        Returns:
+            int: The 1-based rank; ties share the better rank.
+        """
+        table, buckets = ("bests", "best_buckets") if per_profile else ("scores", "score_buckets")
+        bucket = int(run_time)  # The same whole second CAST(time AS INTEGER) gives
+        (faster,) = self.connection.execute(
+            f"SELECT (SELECT COALESCE(SUM(count), 0) FROM {buckets} WHERE bucket < ?) + "
+            f"(SELECT COUNT(*) FROM {table} WHERE time >= ? AND time < ?)",
+            (bucket, bucket, run_time)
+        ).fetchone()
+        return faster + 1
+    
+    def get_personal_best(self, profile):
+        """
+        Get a profile's fastest run.
+        
+        Args:
+            profile (str): The player profile.
+        
+        Returns:
+            float: The best run time in seconds, or None if the profile has no runs.
+        """
+        row = self.connection.execute("SELECT time FROM bests WHERE profile = ?", (profile,)).fetchone()
+        return row[0] if row else None
+    
+    def get_profile_rank(self, profile):
+        """
+        Get a profile's rank among every profile's personal best.
+        
+        Args:
+            profile (str): The player profile.
+        
+        Returns:
+            int: The 1-based rank, or None if the profile has no runs.
+        """
+        best = self.get_personal_best(profile)
+        if best is None:
+            return None
+        return self.get_rank(best, per_profile=True)
+    
+    def __len__(self):
+        """Get the number of recorded runs."""
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+    
+    def close(self):
+        """Close the database."""
+        self.connection.close()
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+Frame-time profiler for the clicker game.
+"""
+
+import csv
+import math
+import time
+from collections import deque
+import pygame
+from src.config import COLORS, PROFILER_WINDOW, PROFILER_TRACE_LENGTH, PROFILER_OVERLAY_REFRESH
+
+class _Section:
+    """
+    Context manager that records the duration of one profiled section.
+    """
+    __slots__ = ('profiler', 'name', 'start')
+    
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NullSection:
+    """
+    Context manager used when profiling is disabled.
+    """
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SECTION = _NullSection()
+
+def percentile(sorted_values, pct):
+    """
+    Get a percentile from an already sorted list using nearest-rank.
+    
+    The result is the smallest value with at least pct percent of the
+    values at or below it, so it is always one of the recorded values.
+    
+    Args:
+        sorted_values (list): The values, sorted ascending.
+        pct (float): The percentile to get (0 to 100).
+    
+    Returns:
+        float: The percentile value, or 0.0 if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    
+    rank = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+class FrameProfiler:
+    """
+    Records per-phase frame timings, keeps rolling percentiles and
+    draws an optional on-screen overlay.
+    """
+    def __init__(self, window=PROFILER_WINDOW, trace_length=PROFILER_TRACE_LENGTH, enabled=True):
+        """
+        Initialize the profiler.
+        
+        Args:
+            window (int, optional): The number of frames used for rolling percentiles.
+            trace_length (int, optional): The number of frames kept for CSV dumps.
+            enabled (bool, optional): Whether timings are recorded.
+        """
+        self.window = window
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.sections = []  # Section names in first-seen order
+        self.samples = {}  # Dictionary of section name -> deque of seconds
+        self.trace = deque(maxlen=trace_length)
+        self.frame_index = 0
+        self.frame_start = 0.0
+        self.current = {}
+        self.font = None
+        self.overlay_lines = []
+        self.overlay_surfaces = []
+        self.last_overlay_update = 0.0
+    
+    def begin_frame(self):
+        """Mark the start of a new frame."""
+        if not self.enabled:
+            return
+        self.current = {}
+        self.frame_start = time.perf_counter()
+    
+    def section(self, name):
+        """
+        Time a section of the frame.
+        
+        Args:
+            name (str): The name of the section.
+        
+        Returns:
+            A context manager that records the section duration on exit.
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+    
+    def record(self, name, duration):
+        """
+        Record a duration for a section in the current frame.
+        
+        Args:
+            name (str): The name of the section.
+            duration (float): The duration in seconds.
+        """
+        if name not in self.samples:
+            self.sections.append(name)
+            self.samples[name] = deque(maxlen=self.window)
+        self.current[name] = self.current.get(name, 0.0) + duration
+    
+    def end_frame(self):
+        """Mark the end of the current frame and store its timings."""
+        if not self.enabled:
+            return
+        
+        self.record('frame', time.perf_counter() - self.frame_start)
+        for name, duration in self.current.items():
+            self.samples[name].append(duration)
+        
+        self.trace.append((self.frame_index, self.frame_start, self.current))
+        self.frame_index += 1
+    
+    def get_percentiles(self, name, percentiles=(50, 95, 99)):
+        """
+        Get rolling percentiles for a section.
+        
+        Args:
+            name (str): The name of the section.
+            percentiles (tuple, optional): The percentiles to compute.
+        
+        Returns:
+            dict: A dictionary of percentile -> duration in milliseconds.
+        """
+        values = sorted(self.samples.get(name, ()))
+        return {pct: percentile(values, pct) * 1000 for pct in percentiles}
+    
+    def get_summary(self):
+        """
+        Get p50/p95/p99 for every recorded section.
+        
+        Returns:
+            dict: A dictionary of section name -> percentile dictionary.
+        """
+        return {name: self.get_percentiles(name) for name in self.sections}
+    
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.overlay_visible = not self.overlay_visible
+        self.last_overlay_update = 0.0
+    
+    def render_overlay(self, surface):
+        """
+        Render the profiler overlay on the given surface.
+        
+        The text is only re-rendered every PROFILER_OVERLAY_REFRESH seconds.
+        
+        Args:
+            surface (pygame.Surface): The surface to render on.
+        """
+        if not self.overlay_visible:
+            return
+        
+        now = time.perf_counter()
+        if now - self.last_overlay_update >= PROFILER_OVERLAY_REFRESH:
+            self.last_overlay_update = now
+            self._build_overlay()
+        
+        y = 5
+        for text_surface in self.overlay_surfaces:
+            surface.blit(text_surface, (5, y))
+            y += text_surface.get_height()
+    
+    def _build_overlay(self):
+        """Render the overlay text lines into cached surfaces."""
+        if self.font is None:
+            self.font = pygame.font.SysFont('Consolas', 14)
+        
+        self.overlay_lines = [f"{'section':<16}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for name, pcts in self.get_summary().items():
+            self.overlay_lines.append(f"{name:<16}{pcts[50]:>8.2f}{pcts[95]:>8.2f}{pcts[99]:>8.2f}")
+        
+        self.overlay_surfaces = [
+            self.font.render(line, True, COLORS['text'], COLORS['background'])
+            for line in self.overlay_lines
+        ]
+    
+    def dump_csv(self, path):
+        """
+        Write the recorded frame trace to a CSV file.
+        
+        Args:
+            path (str): The path of the CSV file.
+        
+        Returns:
+            bool: True if the trace was written, False otherwise.
+        """
+        try:
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['frame', 'timestamp'] + [f"{name}_ms" for name in self.sections])
+                for frame_index, timestamp, timings in self.trace:
+                    writer.writerow(
+                        [frame_index, f"{timestamp:.6f}"] +
+                        [f"{timings.get(name, 0.0) * 1000:.4f}" for name in self.sections]
+                    )
+            return True
+        except OSError as e:
+            print(f"Error writing profiler trace: {e}")
+            return False
@@ -0,0 +1,122 @@
+"""
+Seeded random number streams for the clicker game.
+"""
+
+import math
+import os
+import random
+from src.config import RNG_SEED
+
+class RandomStream(random.Random):
+    """
+    A random number generator for one subsystem, with batch helpers.
+    
+    The batch methods draw many values in one call using random() directly,
+    which avoids the per-call overhead of uniform() and randint().
+    """
+    
+    def uniform_batch(self, a, b, count):
+        """
+        Draw many floats uniformly from [a, b).
+        
+        Args:
+            a (float): The lower bound.
+            b (float): The upper bound.
+            count (int): The number of values to draw.
+        
+        Returns:
+            list: The drawn values.
+        """
+        rnd = self.random
+        span = b - a
+        return [a + span * rnd() for _ in range(count)]
+    
+    def randint_batch(self, a, b, count):
+        """
+        Draw many integers uniformly from [a, b], both inclusive.
+        
+        Args:
+            a (int): The lower bound.
+            b (int): The upper bound.
+            count (int): The number of values to draw.
+        
+        Returns:
+            list: The drawn values.
+        """
+        rnd = self.random
+        span = b - a + 1
+        return [a + int(span * rnd()) for _ in range(count)]
+    
+    def velocity_batch(self, min_speed, max_speed, count):
+        """
+        Draw many velocities with a random direction and speed.
+        
+        Args:
+            min_speed (float): The minimum speed.
+            max_speed (float): The maximum speed.
+            count (int): The number of velocities to draw.
+        
+        Returns:
+            list: The velocities as [dx, dy] lists.
+        """
+        rnd = self.random
+        cos = math.cos
+        sin = math.sin
+        tau = math.tau
+        span = max_speed - min_speed
+        velocities = []
+        for _ in range(count):
+            angle = tau * rnd()
+            speed = min_speed + span * rnd()
+            velocities.append([speed * cos(angle), speed * sin(angle)])
+        return velocities
+
+class RandomService:
+    """
+    Provides independent, reproducible random streams per subsystem.
+    
+    Each named stream (e.g. 'particles', 'spawns', 'simulation') is seeded
+    from the master seed and its name, so drawing from one stream never
+    changes the values another stream produces, and the same seed always
+    replays the same sequences.
+    """
+    def __init__(self, seed=RNG_SEED):
+        """
+        Initialize the random service.
+        
+        Args:
+            seed (int, optional): The master seed, or None to pick one at random.
+        """
+        self.streams = {}  # Dictionary of stream name -> RandomStream
+        self.seed = None
+        self.reseed(seed)
+    
+    def reseed(self, seed=None):
+        """
+        Reset every stream from a new master seed.
+        
+        Args:
+            seed (int, optional): The master seed, or None to pick one at random.
+        """
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), 'little')
+        self.seed = seed
+        
+        for name, stream in self.streams.items():
+            stream.seed(f"{seed}:{name}")
+    
+    def stream(self, name):
+        """
+        Get the random stream for a subsystem.
+        
+        Args:
+            name (str): The name of the subsystem.
+        
+        Returns:
+            RandomStream: The stream, created on first use.
+        """
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = RandomStream(f"{self.seed}:{name}")
+            self.streams[name] = stream
+        return stream
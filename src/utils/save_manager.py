@@ -1,6 +1,5 @@
 """
 Save manager for the clicker game.
-Designed for future implementation of save/load functionality.
 """
 
 import os
@@ -22,30 +21,33 @@ class SaveManager:
         self.base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.save_path = os.path.join(self.base_path, save_file)
     
-    def save_game(self, player, upgrades):
+    def save_game(self, player, upgrades, achievements=None):
         """
         Save the game state.
         
+        The data is written to a temporary file that then replaces the
+        save file, so a crash while saving never leaves a broken save.
+        
         Args:
             player (Player): The player object to save.
             upgrades (dict): The upgrades dictionary.
+            achievements (AchievementTracker, optional): The achievements to save as unlocked.
             
         Returns:
             bool: True if the save was successful, False otherwise.
         """
-        # This is a placeholder for future implementation
-        # In a real implementation, this would save the game state to a file
-        
         try:
             save_data = {
                 'player': player.to_dict(),
+                'achievements': achievements.to_list() if achievements is not None else [],
                 'timestamp': time.time(),
                 'version': '1.0.0'
             }
             
-            # Uncomment to actually save the data
-            # with open(self.save_path, 'w') as f:
-            #     json.dump(save_data, f, indent=2)
+            temp_path = self.save_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(save_data, f, indent=2)
+            os.replace(temp_path, self.save_path)
             
             return True
         except Exception as e:
@@ -59,20 +61,14 @@ class SaveManager:
         Returns:
             dict: The loaded game data, or None if loading failed.
         """
-        # This is a placeholder for future implementation
-        # In a real implementation, this would load the game state from a file
-        
         try:
             if not self.has_save():
                 return None
             
-            # Uncomment to actually load the data
-            # with open(self.save_path, 'r') as f:
-            #     save_data = json.load(f)
+            with open(self.save_path, 'r') as f:
+                save_data = json.load(f)
             
-            # return save_data
-            
-            return None
+            return save_data
         except Exception as e:
             print(f"Error loading game: {e}")
             return None
@@ -112,13 +108,10 @@ class SaveManager:
             if not self.has_save():
                 return None
             
-            # Uncomment to actually get the timestamp
-            # with open(self.save_path, 'r') as f:
-            #     save_data = json.load(f)
-            # 
-            # return save_data.get('timestamp')
+            with open(self.save_path, 'r') as f:
+                save_data = json.load(f)
             
-            return None
+            return save_data.get('timestamp')
         except Exception as e:
             print(f"Error getting save timestamp: {e}")
             return None
\ No newline at end of file
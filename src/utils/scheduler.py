@@ -0,0 +1,207 @@
+"""
+Timed event scheduler for the clicker game.
+"""
+
+import heapq
+
+class Timer:
+    """
+    A handle for one scheduled event.
+    """
+    __slots__ = ('due', 'interval', 'callback', 'args', 'cancelled', 'remaining', 'entry')
+    
+    def __init__(self, due, interval, callback, args):
+        """
+        Initialize a timer.
+        
+        Args:
+            due (float): The scheduler time at which the timer fires.
+            interval (float): The time between repeats, or None to fire once.
+            callback (function): The function to call when the timer fires.
+            args (tuple): The arguments to pass to the callback.
+        """
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.remaining = None  # Time left while the timer is paused
+        self.entry = 0  # Sequence number of the timer's live heap entry
+    
+    @property
+    def paused(self):
+        """
+        Check if the timer is paused.
+        
+        Returns:
+            bool: True if the timer is paused, False otherwise.
+        """
+        return self.remaining is not None
+
+class Scheduler:
+    """
+    Runs callbacks at given times on the game clock.
+    
+    Pending timers are kept in a heap ordered by due time, so each update
+    only looks at the timers that are due; the per-frame cost does not grow
+    with the number of pending timers. Cancelled and paused timers are left
+    in the heap and skipped when they reach the top.
+    """
+    def __init__(self):
+        """Initialize the scheduler."""
+        self.time = 0.0  # Scheduler time in seconds, advanced by update()
+        self.heap = []  # Heap of (due, sequence, Timer)
+        self.sequence = 0  # Keeps timers with the same due time in scheduling order
+        self.stale = 0  # Heap entries left behind by cancelled or paused timers
+        self.paused = False
+    
+    def schedule(self, delay, callback, *args, repeat=False):
+        """
+        Schedule a callback.
+        
+        Args:
+            delay (float): The time from now until the callback runs, in seconds.
+            callback (function): The function to call.
+            *args: The arguments to pass to the callback.
+            repeat (bool, optional): Whether to run the callback every delay seconds.
+        
+        Returns:
+            Timer: A handle that can be cancelled or paused.
+        """
+        timer = Timer(self.time + delay, delay if repeat else None, callback, args)
+        self._push(timer)
+        return timer
+    
+    def cancel(self, timer):
+        """
+        Cancel a timer so it never fires again.
+        
+        Args:
+            timer (Timer): The timer to cancel.
+        """
+        live = not timer.cancelled and timer.remaining is None
+        timer.cancelled = True
+        timer.remaining = None
+        if live:
+            self._discard()
+    
+    def pause_timer(self, timer):
+        """
+        Pause one timer, keeping the time it has left.
+        
+        Args:
+            timer (Timer): The timer to pause.
+        """
+        if not timer.cancelled and timer.remaining is None:
+            timer.remaining = max(0.0, timer.due - self.time)
+            self._discard()
+    
+    def resume_timer(self, timer):
+        """
+        Resume a paused timer.
+        
+        Args:
+            timer (Timer): The timer to resume.
+        """
+        if timer.cancelled or timer.remaining is None:
+            return
+        
+        timer.due = self.time + timer.remaining
+        timer.remaining = None
+        self._push(timer)
+    
+    def pause(self):
+        """Pause the scheduler; no time passes and no timers fire until resumed."""
+        self.paused = True
+    
+    def resume(self):
+        """Resume the scheduler."""
+        self.paused = False
+    
+    def update(self, dt):
+        """
+        Advance the scheduler time and run every timer that is due.
+        
+        Args:
+            dt (float): The time elapsed since the last update in seconds.
+        
+        Returns:
+            int: The number of callbacks run.
+        """
+        if self.paused:
+            return 0
+        
+        self.time += dt
+        now = self.time
+        heap = self.heap
+        fired = 0
+        
+        while heap and heap[0][0] <= now:
+            due, entry, timer = heapq.heappop(heap)
+            
+            # Skip entries left behind by cancelled, paused or resumed timers
+            if entry != timer.entry or timer.cancelled or timer.remaining is not None:
+                self.stale -= 1
+                continue
+            
+            if timer.interval is not None:
+                # Reschedule from the due time so repeats do not drift
+                timer.due = due + timer.interval
+                if timer.due <= now:
+                    timer.due = now + timer.interval
+                self._push(timer)
+            else:
+                timer.cancelled = True
+            
+            timer.callback(*timer.args)
+            fired += 1
+        
+        return fired
+    
+    def time_until_next(self):
+        """
+        Get the time until the next timer fires.
+        
+        Returns:
+            float: The time in seconds, or None if no timer is waiting or the scheduler is paused.
+        """
+        heap = self.heap
+        while heap:
+            due, entry, timer = heap[0]
+            if entry == timer.entry and not timer.cancelled and timer.remaining is None:
+                return None if self.paused else max(0.0, due - self.time)
+            heapq.heappop(heap)
+            self.stale -= 1
+        return None
+    
+    def pending(self):
+        """
+        Get the number of timers that are waiting to fire.
+        
+        Returns:
+            int: The number of active, unpaused timers.
+        """
+        return len(self.heap) - self.stale
+    
+    def _push(self, timer):
+        """
+        Add a timer to the heap.
+        
+        Args:
+            timer (Timer): The timer to add.
+        """
+        self.sequence += 1
+        timer.entry = self.sequence
+        heapq.heappush(self.heap, (timer.due, self.sequence, timer))
+    
+    def _discard(self):
+        """
+        Count a heap entry that will be skipped, and compact the heap once
+        most of it is stale so cancelled timers do not build up.
+        """
+        self.stale += 1
+        if self.stale > 64 and self.stale * 2 > len(self.heap):
+            self.heap = [item for item in self.heap
+                         if item[1] == item[2].entry and not item[2].cancelled and item[2].remaining is None]
+            heapq.heapify(self.heap)
+            self.stale = 0
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Sound playback for the clicker game.
+"""
+
+import time
+import pygame
+from src.config import (SOUND_ENABLED, SOUND_VOLUME, SOUND_CHANNELS, SOUND_RESERVED_CHANNELS,
+                        SOUND_DEFAULT_LIMITS, SOUND_LIMITS)
+
+class SoundManager:
+    """
+    Plays sound effects from a reserved pool of mixer channels.
+    
+    Each sound has a voice limit (how many copies may play at once) and a
+    minimum interval between plays, so rapid clicking cannot exhaust the
+    mixer. Playing never waits on disk or on the audio device: if a sound
+    or the mixer is not ready yet, the request is dropped.
+    """
+    def __init__(self, assets, limits=None, enabled=SOUND_ENABLED, volume=SOUND_VOLUME):
+        """
+        Initialize the sound manager.
+        
+        Args:
+            assets (AssetManager): The asset manager that provides the sounds.
+            limits (dict, optional): Dictionary of sound name -> {'max_voices', 'min_interval'}.
+            enabled (bool, optional): Whether sounds are played.
+            volume (float, optional): The master volume (0.0 to 1.0).
+        """
+        self.assets = assets
+        self.limits = SOUND_LIMITS if limits is None else limits
+        self.enabled = enabled
+        self.volume = volume
+        self.channels = []  # The reserved channel pool
+        self.next_channel = 0
+        self.voices = {}  # Dictionary of sound name -> list of channels playing it
+        self.last_played = {}  # Dictionary of sound name -> time of the last play
+        
+        # Decode the sounds in the background so the first play has a buffer ready
+        if self.enabled:
+            for name in self.assets.manifest['sounds']:
+                self.assets.peek('sound', name)
+    
+    def play(self, name):
+        """
+        Play a sound effect if its limits allow it.
+        
+        Args:
+            name (str): The manifest name of the sound.
+        
+        Returns:
+            bool: True if the sound was started, False otherwise.
+        """
+        if not self.enabled or name not in self.assets.manifest['sounds']:
+            return False
+        
+        # Rate limit rapid-fire plays of the same sound
+        limits = self.limits.get(name, SOUND_DEFAULT_LIMITS)
+        now = time.perf_counter()
+        last = self.last_played.get(name)
+        if last is not None and now - last < limits['min_interval']:
+            return False
+        
+        sound = self.assets.peek('sound', name)
+        if sound is None or not self._ensure_channels():
+            return False
+        
+        # Forget voices that finished or were taken over by another sound
+        voices = [c for c in self.voices.get(name, ()) if c.get_busy() and c.get_sound() is sound]
+        
+        if len(voices) >= limits['max_voices']:
+            # Restart the oldest voice rather than opening another one
+            channel = voices.pop(0)
+        else:
+            channel = self._free_channel()
+        
+        channel.play(sound)
+        voices.append(channel)
+        self.voices[name] = voices
+        self.last_played[name] = now
+        return True
+    
+    def set_volume(self, volume):
+        """
+        Set the master volume.
+        
+        Args:
+            volume (float): The volume (0.0 to 1.0).
+        """
+        self.volume = volume
+        for channel in self.channels:
+            channel.set_volume(volume)
+    
+    def stop_all(self):
+        """Stop every sound in the pool."""
+        for channel in self.channels:
+            channel.stop()
+        self.voices.clear()
+    
+    def _ensure_channels(self):
+        """Reserve the channel pool once the mixer is running."""
+        if self.channels:
+            return True
+        
+        if not pygame.mixer.get_init():
+            return False
+        
+        pygame.mixer.set_num_channels(max(SOUND_CHANNELS, SOUND_RESERVED_CHANNELS))
+        pygame.mixer.set_reserved(SOUND_RESERVED_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(SOUND_RESERVED_CHANNELS)]
+        for channel in self.channels:
+            channel.set_volume(self.volume)
+        return True
+    
+    def _free_channel(self):
+        """Get an idle channel from the pool, or the next one round-robin if all are busy."""
+        count = len(self.channels)
+        for offset in range(count):
+            index = (self.next_channel + offset) % count
+            if not self.channels[index].get_busy():
+                self.next_channel = (index + 1) % count
+                return self.channels[index]
+        
+        channel = self.channels[self.next_channel]
+        self.next_channel = (self.next_channel + 1) % count
+        return channel
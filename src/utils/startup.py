@@ -0,0 +1,51 @@
+"""
+Startup timing for the clicker game.
+
+This module deliberately avoids importing pygame so it can time the
+pygame import itself.
+"""
+
+import time
+
+class StartupTimer:
+    """
+    Records how long each startup phase takes until the first frame is shown.
+    """
+    def __init__(self):
+        """Initialize the timer and start timing."""
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []  # List of (phase name, seconds)
+    
+    def mark(self, phase):
+        """
+        Mark the end of a startup phase.
+        
+        Args:
+            phase (str): The name of the phase that just finished.
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+    
+    def total(self):
+        """
+        Get the total time of all marked phases.
+        
+        Returns:
+            float: The total startup time in seconds.
+        """
+        return self.last - self.start
+    
+    def report(self):
+        """
+        Build a human-readable startup breakdown.
+        
+        Returns:
+            str: One line per phase followed by the total.
+        """
+        lines = ["Startup time breakdown:"]
+        for phase, duration in self.phases:
+            lines.append(f"  {phase:<24}{duration * 1000:>9.1f} ms")
+        lines.append(f"  {'total':<24}{self.total() * 1000:>9.1f} ms")
+        return "\n".join(lines)
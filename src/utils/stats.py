@@ -0,0 +1,218 @@
+"""
+Time series statistics for the clicker game.
+"""
+
+from array import array
+from src.config import STATS_LEVELS, STATS_INTERVAL
+
+class SeriesLevel:
+    """
+    One resolution of a time series: a ring buffer of (min, max, mean) points.
+    """
+    __slots__ = ('step', 'capacity', 'mins', 'maxs', 'means', 'head', 'count')
+    
+    def __init__(self, step, capacity):
+        """
+        Initialize a series level.
+        
+        Args:
+            step (float): The seconds covered by each point.
+            capacity (int): The number of points kept; older points are overwritten.
+        """
+        self.step = step
+        self.capacity = capacity
+        self.mins = array('d', bytes(8 * capacity))
+        self.maxs = array('d', bytes(8 * capacity))
+        self.means = array('d', bytes(8 * capacity))
+        self.head = 0  # Slot the next point is written to
+        self.count = 0
+    
+    def append(self, low, high, mean):
+        """
+        Add a point, overwriting the oldest once the buffer is full.
+        
+        Args:
+            low (float): The smallest value in the point's time span.
+            high (float): The largest value in the point's time span.
+            mean (float): The average value in the point's time span.
+        """
+        head = self.head
+        self.mins[head] = low
+        self.maxs[head] = high
+        self.means[head] = mean
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+    
+    def latest(self, count):
+        """
+        Get the most recent points.
+        
+        Args:
+            count (int): The most points to get.
+        
+        Returns:
+            tuple: Lists of the mins, maxs and means, oldest first.
+        """
+        count = min(count, self.count)
+        start = (self.head - count) % self.capacity
+        if start + count <= self.capacity:
+            span = slice(start, start + count)
+            return self.mins[span].tolist(), self.maxs[span].tolist(), self.means[span].tolist()
+        
+        # The points wrap around the end of the buffer
+        first = slice(start, self.capacity)
+        second = slice(0, start + count - self.capacity)
+        return ((self.mins[first] + self.mins[second]).tolist(),
+                (self.maxs[first] + self.maxs[second]).tolist(),
+                (self.means[first] + self.means[second]).tolist())
+
+class TimeSeries:
+    """
+    A metric kept at several resolutions, e.g. per second, minute and hour.
+    
+    Each level is a fixed-size ring buffer. Whenever a level has collected
+    enough points to cover one step of the next level, they are rolled up
+    into a single (min, max, mean) point there. Memory stays the same
+    however long the session runs; only the history older than a level's
+    capacity is dropped, after it has been rolled up.
+    """
+    __slots__ = ('levels', 'factors', 'pending', 'revision')
+    
+    def __init__(self, levels=STATS_LEVELS):
+        """
+        Initialize a time series.
+        
+        Args:
+            levels (list, optional): (step in seconds, capacity) of each level, finest first.
+                Each step must be a whole multiple of the one before.
+        """
+        self.levels = [SeriesLevel(step, capacity) for step, capacity in levels]
+        self.factors = [round(coarse.step / fine.step) for fine, coarse in zip(self.levels, self.levels[1:])]
+        self.pending = [[0, 0.0, 0.0, 0.0] for _ in self.factors]  # Per level: count, min, max, sum
+        self.revision = 0  # Incremented on every new point
+    
+    def add(self, value):
+        """
+        Add a sample at the finest resolution.
+        
+        Args:
+            value (float): The sample.
+        """
+        self.revision += 1
+        low = high = mean = float(value)
+        for index, level in enumerate(self.levels):
+            level.append(low, high, mean)
+            if index == len(self.factors):
+                return
+            
+            # Collect the point for the next level's rollup
+            pending = self.pending[index]
+            if pending[0]:
+                pending[1] = min(pending[1], low)
+                pending[2] = max(pending[2], high)
+                pending[3] += mean
+            else:
+                pending[1:] = [low, high, mean]
+            pending[0] += 1
+            if pending[0] < self.factors[index]:
+                return
+            
+            low, high, mean = pending[1], pending[2], pending[3] / pending[0]
+            pending[0] = 0
+    
+    def level_for(self, duration):
+        """
+        Get the finest level that holds a whole time span.
+        
+        Args:
+            duration (float): The time span in seconds.
+        
+        Returns:
+            SeriesLevel: The level, or the coarsest level if none covers the span.
+        """
+        for level in self.levels:
+            if duration <= level.step * level.capacity:
+                return level
+        return self.levels[-1]
+
+def downsample(mins, maxs, width):
+    """
+    Reduce points to at most one (min, max) pair per pixel column.
+    
+    Every point's extremes stay visible, however many points share a column.
+    
+    Args:
+        mins (list): The minimum of each point, oldest first.
+        maxs (list): The maximum of each point, oldest first.
+        width (int): The number of pixel columns.
+    
+    Returns:
+        list: (min, max) pairs, one per column if there are more points than columns.
+    """
+    count = len(mins)
+    if count <= width:
+        return list(zip(mins, maxs))
+    
+    columns = []
+    for column in range(width):
+        start = column * count // width
+        end = (column + 1) * count // width
+        columns.append((min(mins[start:end]), max(maxs[start:end])))
+    return columns
+
+class StatsRecorder:
+    """
+    Samples game stats at a fixed interval into time series.
+    
+    Gauges (e.g. currency) record their value at each sample. Counters
+    (e.g. total clicks) record their increase per second since the last
+    sample. If the game slept through several intervals, the same values
+    are recorded for each of them so the time axis stays even.
+    """
+    def __init__(self, gauges=(), counters=(), interval=STATS_INTERVAL, levels=STATS_LEVELS):
+        """
+        Initialize the recorder.
+        
+        Args:
+            gauges (tuple, optional): The names of stats recorded as values.
+            counters (tuple, optional): The names of stats recorded as rates per second.
+            interval (float, optional): The seconds between samples.
+            levels (list, optional): (step in seconds, capacity) of each resolution, finest first.
+        """
+        self.interval = interval
+        self.series = {name: TimeSeries(levels) for name in (*gauges, *counters)}
+        self.counters = {name: None for name in counters}  # Dictionary of name -> last counter value
+        self.next_time = None  # Time of the next sample
+    
+    def update(self, now, sample_func):
+        """
+        Record samples for every interval that has passed.
+        
+        Args:
+            now (float): The current time in seconds.
+            sample_func (function): Returns a dictionary of stat name -> value; only called when a sample is due.
+        
+        Returns:
+            bool: True if samples were recorded, False otherwise.
+        """
+        if self.next_time is None:
+            self.next_time = now + self.interval
+            for name, value in sample_func().items():
+                if name in self.counters:
+                    self.counters[name] = value
+            return False
+        if now < self.next_time:
+            return False
+        
+        steps = int((now - self.next_time) // self.interval) + 1
+        self.next_time += steps * self.interval
+        for name, value in sample_func().items():
+            if name in self.counters:
+                last = self.counters[name]
+                self.counters[name] = value
+                value = (value - last) / (steps * self.interval)
+            series = self.series[name]
+            for _ in range(steps):
+                series.add(value)
+        return True
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""
+Texture atlas and sprite batching for the clicker game.
+
+The atlas packs every image variant listed in the asset manifest into one
+surface with a JSON index. It is built the first time the game runs (or
+with `python -m src.utils.texture_atlas`) and rebuilt whenever a source
+image or the manifest's image entries change.
+"""
+
+import os
+import sys
+import json
+import pygame
+from src.config import ATLAS_IMAGE, ATLAS_INDEX, ATLAS_PADDING, ATLAS_MAX_WIDTH, ASSET_MANIFEST
+from src.utils.helpers import ASSETS_DIR
+
+ATLAS_VERSION = 1
+
+def sprite_key(name, scale):
+    """
+    Get the index key of an image variant.
+    
+    Args:
+        name (str): The manifest name of the image.
+        scale (tuple): The size (width, height) of the variant, or None for the original.
+    
+    Returns:
+        str: The key, e.g. "levi@90x90" or "levi".
+    """
+    return f"{name}@{scale[0]}x{scale[1]}" if scale else name
+
+def pack(sizes, max_width=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING):
+    """
+    Pack rectangles into rows ("shelves"), tallest first.
+    
+    Args:
+        sizes (dict): A dictionary of key -> (width, height).
+        max_width (int, optional): The widest a row may be.
+        padding (int, optional): Empty pixels around every rectangle.
+    
+    Returns:
+        tuple: A dictionary of key -> (x, y, width, height) and the atlas size (width, height).
+    """
+    rects = {}
+    x = y = row_height = width = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if x and x + w + padding > max_width:
+            y += row_height
+            x = row_height = 0
+        rects[key] = (x + padding, y + padding, w, h)
+        x += w + padding
+        row_height = max(row_height, h + padding)
+        width = max(width, x + padding)
+    return rects, (max(width, 1), max(y + row_height + padding, 1))
+
+def source_signature(images, assets_dir):
+    """
+    Describe the inputs of an atlas so a stale atlas can be detected.
+    
+    Args:
+        images (dict): The 'images' section of the asset manifest.
+        assets_dir (str): The base directory for assets.
+    
+    Returns:
+        dict: The manifest entries with each source file's size and modification time.
+    """
+    signature = {}
+    for name, entry in sorted(images.items()):
+        path = os.path.join(assets_dir, 'images', entry.get('file', name))
+        try:
+            stat = os.stat(path)
+            file_info = [stat.st_size, int(stat.st_mtime)]
+        except OSError:
+            file_info = None
+        signature[name] = {'entry': entry, 'file': file_info}
+    return signature
+
+class TextureAtlas:
+    """
+    One surface holding many images, with the rectangle of each.
+    """
+    def __init__(self, surface, rects):
+        """
+        Initialize a texture atlas.
+        
+        Args:
+            surface (pygame.Surface): The packed atlas image.
+            rects (dict): A dictionary of sprite key -> pygame.Rect.
+        """
+        self.surface = surface
+        self.rects = rects
+        self.sprites = {}  # Dictionary of sprite key -> subsurface, created on first use
+    
+    @classmethod
+    def build(cls, images, assets_dir):
+        """
+        Build an atlas from the images in the asset manifest.
+        
+        Each source image is read once and every listed scale is produced
+        from it; images without scales are packed at their original size.
+        
+        Args:
+            images (dict): The 'images' section of the asset manifest.
+            assets_dir (str): The base directory for assets.
+        
+        Returns:
+            TextureAtlas: The new atlas.
+        """
+        variants = {}
+        for name, entry in images.items():
+            path = os.path.join(assets_dir, 'images', entry.get('file', name))
+            try:
+                source = pygame.image.load(path)
+            except (pygame.error, OSError) as e:
+                print(f"Error loading image {path} for the atlas: {e}")
+                continue
+            
+            # smoothscale only supports 24 and 32 bit surfaces
+            if source.get_bitsize() not in (24, 32):
+                converted = pygame.Surface(source.get_size(), pygame.SRCALPHA)
+                converted.blit(source, (0, 0))
+                source = converted
+            for scale in [tuple(s) for s in entry.get('scales', [])] or [None]:
+                variants[sprite_key(name, scale)] = pygame.transform.smoothscale(source, scale) if scale else source
+        
+        layout, size = pack({key: image.get_size() for key, image in variants.items()})
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.blits([(variants[key], rect[:2]) for key, rect in layout.items()], doreturn=False)
+        return cls(surface, {key: pygame.Rect(rect) for key, rect in layout.items()})
+    
+    @classmethod
+    def load(cls, image_path, index_path):
+        """
+        Load a saved atlas.
+        
+        Args:
+            image_path (str): The path of the atlas image.
+            index_path (str): The path of the JSON index.
+        
+        Returns:
+            TextureAtlas: The atlas.
+        """
+        with open(index_path, 'r') as f:
+            index = json.load(f)
+        
+        surface = pygame.image.load(image_path)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return cls(surface, {key: pygame.Rect(rect) for key, rect in index['sprites'].items()})
+    
+    @classmethod
+    def load_or_build(cls, images, assets_dir, image_file=ATLAS_IMAGE, index_file=ATLAS_INDEX):
+        """
+        Load the atlas for the manifest, building and saving it if it is missing or stale.
+        
+        Args:
+            images (dict): The 'images' section of the asset manifest.
+            assets_dir (str): The base directory for assets.
+            image_file (str, optional): The atlas image file name in the assets directory.
+            index_file (str, optional): The JSON index file name in the assets directory.
+        
+        Returns:
+            TextureAtlas: The atlas.
+        """
+        image_path = os.path.join(assets_dir, image_file)
+        index_path = os.path.join(assets_dir, index_file)
+        signature = source_signature(images, assets_dir)
+        
+        try:
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('version') == ATLAS_VERSION and index.get('sources') == signature:
+                return cls.load(image_path, index_path)
+        except (OSError, ValueError, pygame.error):
+            pass
+        
+        atlas = cls.build(images, assets_dir)
+        atlas.save(image_path, index_path, signature)
+        return atlas
+    
+    def save(self, image_path, index_path, signature=None):
+        """
+        Save the atlas image and its JSON index.
+        
+        Args:
+            image_path (str): The path to write the atlas image to.
+            index_path (str): The path to write the JSON index to.
+            signature (dict, optional): The source signature used to detect a stale atlas.
+        """
+        try:
+            pygame.image.save(self.surface, image_path)
+            index = {
+                'version': ATLAS_VERSION,
+                'image': os.path.basename(image_path),
+                'size': list(self.surface.get_size()),
+                'sources': signature or {},
+                'sprites': {key: list(rect) for key, rect in self.rects.items()},
+            }
+            with open(index_path, 'w') as f:
+                json.dump(index, f, indent=2)
+        except (OSError, pygame.error) as e:
+            print(f"Error saving texture atlas: {e}")
+    
+    def __contains__(self, key):
+        """Check if the atlas holds a sprite key."""
+        return key in self.rects
+    
+    def get(self, name, scale=None):
+        """
+        Get one sprite as a surface that shares the atlas pixels.
+        
+        Args:
+            name (str): The manifest name of the image.
+            scale (tuple, optional): The size (width, height) of the variant.
+        
+        Returns:
+            pygame.Surface: The sprite, or None if the atlas does not hold it.
+        """
+        key = sprite_key(name, scale)
+        sprite = self.sprites.get(key)
+        if sprite is None and key in self.rects:
+            sprite = self.surface.subsurface(self.rects[key])
+            self.sprites[key] = sprite
+        return sprite
+
+class SpriteBatch:
+    """
+    Collects sprites from one atlas and draws them with a single blits call.
+    """
+    __slots__ = ('atlas', 'items')
+    
+    def __init__(self, atlas):
+        """
+        Initialize a sprite batch.
+        
+        Args:
+            atlas (TextureAtlas): The atlas every sprite comes from.
+        """
+        self.atlas = atlas
+        self.items = []  # List of (atlas surface, position, area) blit sequences
+    
+    def add(self, name, scale, position):
+        """
+        Queue a sprite to draw.
+        
+        Args:
+            name (str): The manifest name of the image.
+            scale (tuple): The size (width, height) of the variant, or None for the original.
+            position (tuple): The top-left position (x, y) to draw at.
+        """
+        self.items.append((self.atlas.surface, position, self.atlas.rects[sprite_key(name, scale)]))
+    
+    def add_many(self, name, scale, positions):
+        """
+        Queue the same sprite at many positions.
+        
+        Args:
+            name (str): The manifest name of the image.
+            scale (tuple): The size (width, height) of the variant, or None for the original.
+            positions (iterable): The top-left positions (x, y) to draw at.
+        """
+        surface = self.atlas.surface
+        area = self.atlas.rects[sprite_key(name, scale)]
+        self.items.extend((surface, position, area) for position in positions)
+    
+    def draw(self, surface):
+        """
+        Draw every queued sprite and empty the batch.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+        """
+        if self.items:
+            surface.blits(self.items, doreturn=False)
+            self.items.clear()
+
+def main(argv=None):
+    """
+    Build the texture atlas for the asset manifest from the command line.
+    
+    Returns:
+        int: The process exit code.
+    """
+    with open(os.path.join(ASSETS_DIR, ASSET_MANIFEST), 'r') as f:
+        images = json.load(f).get('images', {})
+    
+    atlas = TextureAtlas.build(images, ASSETS_DIR)
+    atlas.save(os.path.join(ASSETS_DIR, ATLAS_IMAGE), os.path.join(ASSETS_DIR, ATLAS_INDEX),
+               source_signature(images, ASSETS_DIR))
+    print(f"Packed {len(atlas.rects)} sprites into a {atlas.surface.get_width()}x{atlas.surface.get_height()} atlas")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
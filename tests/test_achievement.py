@@ -0,0 +1,57 @@
+"""
+Tests for the achievement system.
+"""
+
+import unittest
+from src.config import ACHIEVEMENTS
+from src.models.achievement import Achievement, AchievementTracker, create_achievements_from_config
+
+class TestAchievementTracker(unittest.TestCase):
+    """Test cases for the AchievementTracker class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.achievements = [
+            Achievement('clicks_10', 'Ten', 'Click 10 times', 'total_clicks', 10),
+            Achievement('clicks_1', 'One', 'Click once', 'total_clicks', 1),
+            Achievement('clicks_100', 'Hundred', 'Click 100 times', 'total_clicks', 100),
+            Achievement('earned_50', 'Fifty', 'Earn 50', 'currency_earned', 50),
+        ]
+        self.tracker = AchievementTracker(self.achievements)
+    
+    def test_thresholds_unlock_in_order(self):
+        """Test that reaching thresholds unlocks each achievement once."""
+        self.assertEqual(self.tracker.update('total_clicks', 0), [])
+        self.assertEqual([a.id for a in self.tracker.update('total_clicks', 1)], ['clicks_1'])
+        self.assertEqual(self.tracker.update('total_clicks', 5), [])
+        self.assertEqual(self.tracker.next_threshold('total_clicks'), 10)
+        
+        # Jumping past several thresholds unlocks them all
+        self.assertEqual([a.id for a in self.tracker.update('total_clicks', 500)], ['clicks_10', 'clicks_100'])
+        self.assertIsNone(self.tracker.next_threshold('total_clicks'))
+        self.assertEqual(self.tracker.update('total_clicks', 1000), [])
+        
+        self.assertFalse(self.tracker.is_unlocked('earned_50'))
+        self.assertEqual(self.tracker.update('unknown_stat', 10 ** 9), [])
+    
+    def test_update_many(self):
+        """Test updating several stats at once."""
+        unlocked = self.tracker.update_many({'total_clicks': 10, 'currency_earned': 50})
+        self.assertEqual([a.id for a in unlocked], ['clicks_1', 'clicks_10', 'earned_50'])
+        self.assertEqual(self.tracker.to_list(), ['clicks_1', 'clicks_10', 'earned_50'])
+    
+    def test_restored_achievements_stay_unlocked(self):
+        """Test that achievements unlocked in a save are skipped."""
+        tracker = AchievementTracker(self.achievements, ['clicks_10', 'removed_achievement'])
+        self.assertEqual(tracker.to_list(), ['clicks_10'])
+        self.assertEqual([a.id for a in tracker.update('total_clicks', 50)], ['clicks_1'])
+        self.assertEqual(tracker.next_threshold('total_clicks'), 100)
+    
+    def test_config_round_trip(self):
+        """Test creating achievements from the configuration."""
+        achievements = create_achievements_from_config()
+        self.assertEqual([a.to_dict() for a in achievements], ACHIEVEMENTS)
+        self.assertEqual(len({a.id for a in achievements}), len(ACHIEVEMENTS))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for the session analytics log and report.
+"""
+
+import os
+import tempfile
+import unittest
+from src.utils.analytics import AnalyticsLog, HEADER, RECORD, SESSION_START, CLICKS, PURCHASE, FRAME
+
+try:
+    import numpy
+    from src.utils.analytics_report import load_records, summarize, format_report
+except ImportError:
+    numpy = None
+
+class TestAnalyticsLog(unittest.TestCase):
+    """Test cases for the AnalyticsLog class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = os.path.join(temp_dir.name, 'analytics.log')
+    
+    def read_header(self):
+        """Read the header fields of the log file."""
+        with open(self.path, 'rb') as f:
+            return HEADER.unpack(f.read(HEADER.size))
+    
+    def test_records_survive_reopening(self):
+        """Test that records and the session count are kept across sessions."""
+        log = AnalyticsLog(self.path, capacity=8)
+        log.log(CLICKS, count=3, value=30)
+        log.map.close()  # Stop without flushing or closing, like a crash
+        log.file.close()
+        
+        log = AnalyticsLog(self.path, capacity=8)
+        log.close()
+        self.assertEqual(self.read_header()[4:], (3, 2))
+        self.assertEqual(os.path.getsize(self.path), 64 + 8 * 24)
+    
+    def test_other_layout_is_replaced(self):
+        """Test that a log with another capacity is started over."""
+        AnalyticsLog(self.path, capacity=8).close()
+        AnalyticsLog(self.path, capacity=16).close()
+        self.assertEqual(self.read_header()[3:], (16, 1, 1))
+    
+    def test_out_of_range_fields_are_clamped(self):
+        """Test that huge or fractional values are stored instead of failing the write."""
+        log = AnalyticsLog(self.path, capacity=8)
+        log.log(CLICKS, count=2 ** 40, value=1e30)
+        log.log(CLICKS, count=-1, value=-2 ** 70)
+        log.log(CLICKS, count=1, value=12.75)
+        records = [RECORD.unpack_from(log.map, 64 + slot * RECORD.size)[3:] for slot in range(1, 4)]
+        log.close()
+        self.assertEqual(records, [(2 ** 32 - 1, 2 ** 63 - 1), (0, -2 ** 63), (1, 12)])
+    
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_report_reads_the_ring_in_order(self):
+        """Test that the report orders a wrapped ring and sums each session."""
+        log = AnalyticsLog(self.path, capacity=8)
+        for _ in range(4):
+            log.log(CLICKS, count=2, value=10)
+        log.close()
+        log = AnalyticsLog(self.path, capacity=8)
+        log.log(PURCHASE, code=1, count=1, value=50)
+        log.log(CLICKS, count=5, value=25)
+        log.log_frame(0.004)
+        log.close()
+        
+        # 10 records were written, so the first session's start was overwritten
+        records = load_records(self.path)
+        self.assertEqual(records['kind'].tolist(), [CLICKS, CLICKS, CLICKS, CLICKS,
+                                                    SESSION_START, PURCHASE, CLICKS, FRAME])
+        
+        summary = summarize(records)
+        self.assertEqual(summary['clicks'], 13)
+        self.assertEqual(summary['purchases'], {'auto_clicker': 1})
+        self.assertEqual(summary['frame_ms'][50], 4.0)
+        self.assertEqual([(s['session'], s['clicks'], s['earned'], s['purchases']) for s in summary['sessions']],
+                         [(0, 8, 40, 0), (1, 5, 25, 1)])
+        self.assertIn("auto_clicker x1", format_report(summary))
+
+if __name__ == '__main__':
+    unittest.main()
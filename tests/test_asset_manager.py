@@ -0,0 +1,103 @@
+"""
+Tests for the AssetManager.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import pygame
+from src.utils import asset_manager
+from src.utils.asset_manager import AssetManager
+
+class TestAssetManager(unittest.TestCase):
+    """Test cases for the AssetManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        pygame.font.init()
+        self.assets_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.assets_dir, 'images'))
+        
+        image = pygame.Surface((40, 20), pygame.SRCALPHA)
+        image.fill((255, 0, 0, 255))
+        pygame.image.save(image, os.path.join(self.assets_dir, 'images', 'red.png'))
+        
+        self.manifest_path = os.path.join(self.assets_dir, 'manifest.json')
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'images': {'red': {'file': 'red.png', 'scales': [[10, 5], [20, 10]]}}}, f)
+        
+        # Point the loaders at the temporary assets directory
+        patcher = mock.patch('src.utils.helpers.ASSETS_DIR', self.assets_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.manager = AssetManager(self.manifest_path, self.assets_dir)
+        self.addCleanup(self.manager.shutdown)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.assets_dir)
+    
+    def test_preload_scales_and_progress(self):
+        """Test that preloading produces every listed scale and reports progress."""
+        progress = []
+        self.manager.preload(lambda loaded, total, name: progress.append((loaded, total, name)))
+        self.manager.wait()
+        
+        self.assertEqual(self.manager.progress, 1.0)
+        self.assertEqual(len(progress), 2)
+        self.assertEqual(progress[-1][:2], (2, 2))
+        self.assertEqual(self.manager.get_image('red', (10, 5)).get_size(), (10, 5))
+        self.assertTrue(self.manager.is_cached('image', 'red', (20, 10)))
+    
+    def test_images_loaded_from_disk_once(self):
+        """Test that an image is read once no matter how many scales are requested."""
+        with mock.patch.object(asset_manager, 'load_image', wraps=asset_manager.load_image) as load:
+            self.manager.preload()
+            self.manager.wait()
+            self.manager.get_image('red', (30, 15))
+            self.manager.get_image('red')
+        
+        self.assertEqual(load.call_count, 1)
+    
+    def test_cached_objects_are_reused(self):
+        """Test that repeated requests return the same surface."""
+        first = self.manager.get_image('red', (10, 5))
+        second = self.manager.get_image('red', [10, 5])
+        self.assertIs(first, second)
+    
+    def test_concurrent_requests_are_deduplicated(self):
+        """Test that a pending load is shared instead of started twice."""
+        release = threading.Event()
+        
+        def slow_load(filename, scale=None, convert_alpha=True):
+            release.wait(5)
+            return pygame.Surface((1, 1))
+        
+        with mock.patch.object(asset_manager, 'load_image', side_effect=slow_load) as load:
+            futures = [self.manager._request(('image', 'red', None)) for _ in range(5)]
+            release.set()
+            self.manager.wait()
+        
+        self.assertEqual(len(set(map(id, futures))), 1)
+        self.assertEqual(load.call_count, 1)
+    
+    def test_missing_font_fallback_is_cached(self):
+        """Test that a missing font falls back to SysFont only once."""
+        with mock.patch('pygame.font.SysFont', wraps=pygame.font.SysFont) as sys_font:
+            first = self.manager.get_font('missing.ttf', 16)
+            second = self.manager.get_font('missing.ttf', 16)
+        
+        self.assertIs(first, second)
+        self.assertEqual(sys_font.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests for click rate tracking and macro detection.
+"""
+
+import random
+import unittest
+from src.utils.click_rate import SlidingWindowCounter, MacroDetector, ClickRateTracker
+
+class TestSlidingWindowCounter(unittest.TestCase):
+    """Test cases for the SlidingWindowCounter class."""
+    
+    def test_events_leave_the_window(self):
+        """Test that counts expire bucket by bucket as time passes."""
+        counter = SlidingWindowCounter(10, buckets=10)
+        counter.add(0.5, 5)
+        counter.add(3.5, 10)
+        self.assertEqual(counter.rate(9.9), 1.5)
+        self.assertEqual(counter.rate(10.0), 1.0)  # The first second has left the window
+        self.assertEqual(counter.rate(13.9), 0.0)
+        
+        # A long pause clears every bucket at once
+        counter.add(14.0, 3)
+        self.assertEqual(counter.rate(1000.0), 0.0)
+        counter.add(1000.5)
+        self.assertEqual(counter.total, 1)
+
+class TestMacroDetector(unittest.TestCase):
+    """Test cases for the MacroDetector class."""
+    
+    def click_stream(self, detector, intervals, start=0.0):
+        """Record one click after each interval and return when each flag was raised."""
+        now = start
+        detector.record(now)
+        flags = []
+        for index, interval in enumerate(intervals):
+            now += interval
+            if detector.record(now):
+                flags.append(index)
+        return flags
+    
+    def test_human_clicks_pass(self):
+        """Test that irregular clicks at a human rate are not flagged."""
+        rng = random.Random(1)
+        detector = MacroDetector(samples=30, max_cv=0.05, max_rate=25)
+        self.assertEqual(self.click_stream(detector, [rng.uniform(0.1, 0.2) for _ in range(200)]), [])
+        self.assertFalse(detector.flagged)
+    
+    def test_regular_clicks_are_flagged(self):
+        """Test that clicks at an exact interval are flagged once the window fills."""
+        detector = MacroDetector(samples=30, max_cv=0.05, max_rate=25)
+        rng = random.Random(2)
+        intervals = [0.1 + rng.uniform(-0.001, 0.001) for _ in range(100)]
+        self.assertEqual(self.click_stream(detector, intervals), [29])
+        self.assertEqual(detector.reason, 'regular')
+        
+        # A pause starts a new streak
+        detector.record(detector.last_time + 5.0)
+        self.assertFalse(detector.flagged)
+    
+    def test_fast_batches_are_flagged(self):
+        """Test that thousands of clicks per second are flagged by rate."""
+        detector = MacroDetector(samples=10, max_cv=0.0, max_rate=25)
+        now = 0.0
+        flagged = []
+        for frame in range(20):
+            now += 1 / 60
+            flagged.append(detector.record(now, count=50))
+        self.assertEqual(flagged.index(True), 10)
+        self.assertEqual(detector.reason, 'rate')
+
+class TestClickRateTracker(unittest.TestCase):
+    """Test cases for the ClickRateTracker class."""
+    
+    def test_rates_per_window(self):
+        """Test that each window reports its own average rate."""
+        tracker = ClickRateTracker(windows=(1, 10, 60))
+        for tick in range(100):
+            tracker.record(tick * 0.1, 2)  # 20 clicks per second for 10 seconds
+        
+        self.assertEqual(tracker.rate(1, 9.95), 20.0)
+        self.assertEqual(tracker.rate(10, 9.95), 20.0)
+        self.assertAlmostEqual(tracker.rate(60, 9.95), 200 / 60)
+        self.assertEqual(tracker.rate(1, 20.0), 0.0)
+        self.assertFalse(tracker.record(30.0))
+
+if __name__ == '__main__':
+    unittest.main()
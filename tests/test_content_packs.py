@@ -0,0 +1,145 @@
+"""
+Tests for upgrade content packs.
+"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.models.player import Player
+from src.models.upgrade import create_upgrades_from_config
+from src.utils import content_packs
+from src.utils.content_packs import ContentPack, discover_packs, add_pack_upgrades, validate_upgrade
+
+ROCKET = {'id': 'rocket', 'name': 'Rocket', 'description': 'Clicks in space', 'base_cost': 500,
+          'cost_multiplier': 2.5, 'effect_value': 10, 'effect': 'click_power', 'max_level': 3,
+          'requires': {'upgrades': {'click_power': 5}}}
+
+STATIONS = """
+[[upgrades]]
+id = "station"
+name = "Space Station"
+base_cost = 5000
+cost_multiplier = 3
+effect_value = 25
+effect = "auto_clicker"
+
+[upgrades.requires]
+upgrades = { rocket = 1 }
+currency_earned = 100000
+"""
+
+class TestContentPacks(unittest.TestCase):
+    """Test cases for content pack loading."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.packs_dir = os.path.join(temp_dir.name, 'packs')
+        self.cache_dir = os.path.join(self.packs_dir, '.cache')
+        self.pack_dir = os.path.join(self.packs_dir, 'space')
+        os.makedirs(self.pack_dir)
+        self.write('rockets.json', json.dumps({'upgrades': [ROCKET]}))
+        self.write('stations.toml', STATIONS)
+        self.write('notes.txt', 'Not a pack file')
+    
+    def write(self, file_name, text):
+        """Write a file into the test pack."""
+        with open(os.path.join(self.pack_dir, file_name), 'w') as f:
+            f.write(text)
+    
+    def load(self):
+        """Discover the test packs and add their upgrades to the config's."""
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            upgrades = add_pack_upgrades(create_upgrades_from_config(),
+                                         discover_packs(self.packs_dir, self.cache_dir))
+        return upgrades, output.getvalue()
+    
+    def test_discovery_is_lazy(self):
+        """Test that packs are found without parsing their files."""
+        packs = discover_packs(self.packs_dir, self.cache_dir)
+        self.assertEqual([pack.name for pack in packs], ['space'])
+        self.assertEqual(packs[0].files, ['rockets.json', 'stations.toml'])
+        self.assertFalse(packs[0].loaded)
+        self.assertEqual([upgrade.id for upgrade in packs[0].upgrades], ['rocket', 'station'])
+        self.assertTrue(packs[0].loaded)
+        self.assertEqual(discover_packs(os.path.join(self.packs_dir, 'missing'), self.cache_dir), [])
+    
+    def test_json_and_toml_upgrades(self):
+        """Test that pack upgrades are added with their effects and prerequisites."""
+        upgrades, output = self.load()
+        self.assertEqual(output, "")
+        self.assertEqual(list(upgrades)[-2:], ['rocket', 'station'])
+        self.assertEqual(upgrades['rocket'].to_dict(), ROCKET)
+        self.assertEqual(upgrades['station'].description, '')
+        self.assertEqual(upgrades['station'].requires,
+                         {'upgrades': {'rocket': 1}, 'currency_earned': 100000})
+        
+        player = Player()
+        player.currency = 5000
+        self.assertTrue(player.purchase_upgrade(upgrades['station']))
+        self.assertEqual(player.auto_click_power, 25)
+    
+    def test_warm_start_uses_cache(self):
+        """Test that compiled files are reused until the file changes."""
+        self.load()
+        with mock.patch.object(content_packs, 'compile_file', side_effect=AssertionError("parsed again")):
+            upgrades, output = self.load()
+        self.assertEqual(output, "")
+        self.assertEqual(upgrades['rocket'].to_dict(), ROCKET)
+        
+        self.write('rockets.json', json.dumps({'upgrades': [dict(ROCKET, name='Big Rocket')]}))
+        upgrades, _ = self.load()
+        self.assertEqual(upgrades['rocket'].name, 'Big Rocket')
+    
+    def test_invalid_packs_are_skipped(self):
+        """Test that a pack with an invalid or clashing upgrade is left out whole."""
+        self.write('rockets.json', json.dumps({'upgrades': [dict(ROCKET, effect='teleport')]}))
+        upgrades, output = self.load()
+        self.assertNotIn('station', upgrades)
+        self.assertIn("Error loading content pack space", output)
+        self.assertIn("unknown effect 'teleport'", output)
+        
+        self.write('rockets.json', json.dumps({'upgrades': [dict(ROCKET, id='click_power')]}))
+        upgrades, output = self.load()
+        self.assertNotIn('station', upgrades)
+        self.assertIn("already in use: click_power", output)
+        
+        self.write('rockets.json', '{"upgrades": [')
+        _, output = self.load()
+        self.assertIn("rockets.json", output)
+    
+    def test_packs_are_checked_against_earlier_packs(self):
+        """Test that a pack may require upgrades of the packs before it, but not after it."""
+        os.makedirs(os.path.join(self.packs_dir, 'tycho'))
+        os.makedirs(os.path.join(self.packs_dir, 'aaa'))
+        with open(os.path.join(self.packs_dir, 'tycho', 'base.json'), 'w') as f:
+            json.dump({'upgrades': [dict(ROCKET, id='moon_base', requires={'upgrades': {'station': 1}})]}, f)
+        with open(os.path.join(self.packs_dir, 'aaa', 'early.json'), 'w') as f:
+            json.dump({'upgrades': [dict(ROCKET, id='early', requires={'upgrades': {'rocket': 1}})]}, f)
+        upgrades, output = self.load()
+        self.assertIn('moon_base', upgrades)
+        self.assertNotIn('early', upgrades)
+        self.assertIn("Error loading content pack aaa: Upgrade early requires unknown upgrade rocket", output)
+    
+    def test_validate_upgrade(self):
+        """Test the checks on a single upgrade definition."""
+        self.assertEqual(validate_upgrade(ROCKET, 'test')[0], 'rocket')
+        for bad in ({'id': 'a'}, dict(ROCKET, base_cost='cheap'), dict(ROCKET, max_level=0),
+                    dict(ROCKET, colour='red'), dict(ROCKET, requires={'prestige': 1}), dict(ROCKET, effect_value=True)):
+            with self.assertRaises(ValueError):
+                validate_upgrade(bad, 'test')
+    
+    def test_duplicate_ids_in_a_pack(self):
+        """Test that an upgrade defined in two files of a pack is rejected."""
+        self.write('more_rockets.json', json.dumps({'upgrades': [ROCKET]}))
+        pack = ContentPack(self.pack_dir, self.cache_dir)
+        with self.assertRaisesRegex(ValueError, 'defined twice'):
+            pack.upgrades
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
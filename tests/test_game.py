@@ -0,0 +1,309 @@
+"""
+Tests for the Game class.
+"""
+
+import contextlib
+import io
+import json
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import tempfile
+import unittest
+import pygame
+from src.config import MAX_CLICK_PARTICLES_PER_FRAME, LEVI_VALUE, LEVI_SPAWN_MAX_TIME, WIN_AMOUNT, IDLE_MAX_WAIT
+from src.game import Game
+from src.utils.leaderboard import Leaderboard
+from src.utils.save_manager import SaveManager
+from src.utils.analytics import AnalyticsLog, HEADER_SIZE, RECORD, CLICKS, PURCHASE
+from src.utils.content_packs import ContentPack
+
+class TestGame(unittest.TestCase):
+    """Test cases for the Game class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.save_path = os.path.join(temp_dir.name, 'save_data.json')
+        self.game = Game(save_manager=SaveManager(self.save_path))
+        self.addCleanup(self.game.assets.shutdown)
+        pygame.event.clear()
+        self.click_pos = self.game.click_area.center
+    
+    def post_click(self, pos):
+        """Post a left mouse button press and release at a position."""
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=pos))
+    
+    def test_click_burst_is_coalesced(self):
+        """Test that a burst of clicks is credited exactly with capped effects."""
+        self.game.player.click_power = 7
+        for _ in range(500):
+            self.post_click(self.click_pos)
+        
+        self.game.handle_events()
+        
+        self.assertEqual(self.game.player.currency, 3500)
+        text_particles = [p for p in self.game.particles if p.text is not None]
+        self.assertEqual(len(text_particles), 1)
+        self.assertEqual(text_particles[0].text, "+3.5K")
+        self.assertLessEqual(len(self.game.particles), MAX_CLICK_PARTICLES_PER_FRAME + 1)
+    
+    def test_single_click(self):
+        """Test that a single click keeps the full particle effect."""
+        self.post_click(self.click_pos)
+        self.game.handle_events()
+        
+        self.assertEqual(self.game.player.currency, 1)
+        self.assertEqual(len(self.game.particles), 6)
+    
+    def test_clicks_are_credited_before_purchase(self):
+        """Test that clicks earlier in the frame count towards a purchase."""
+        button = self.game.shop_panel.elements[0]
+        button_pos = (self.game.shop_panel.rect.x + button.rect.centerx,
+                      self.game.shop_panel.rect.y + button.rect.centery)
+        button.update(button.rect.center)  # Hover the button
+        
+        for _ in range(10):
+            self.post_click(self.click_pos)
+        self.post_click(button_pos)
+        self.game.handle_events()
+        
+        self.assertEqual(self.game.player.get_upgrade_level('click_power'), 1)
+        self.assertEqual(self.game.player.currency, 0)
+    
+    def test_purchase_updates_button_label(self):
+        """Test that buying an upgrade updates its shop button."""
+        self.game.player.currency = 10
+        self.assertTrue(self.game.purchase_upgrade('click_power'))
+        self.assertEqual(self.game.upgrade_buttons['click_power'].layout.lines,
+                         ["Click Power (Lvl 1)", "Cost: 15"])
+    
+    def test_locked_upgrade_unlocks_from_prerequisites(self):
+        """Test that an upgrade stays locked until its prerequisites are met."""
+        golden_mullet = {'id': 'golden_mullet', 'name': 'Golden Mullet', 'base_cost': 100, 'cost_multiplier': 2,
+                         'effect_value': 2, 'effect': 'click_multiplier', 'max_level': 1,
+                         'requires': {'upgrades': {'click_power': 2}, 'achievements': ['clicks_100']}}
+        game = Game(save_manager=SaveManager(self.save_path), content_packs=[self.make_pack([golden_mullet])])
+        self.addCleanup(game.assets.shutdown)
+        game.load_content_packs()
+        button = game.upgrade_buttons['golden_mullet']
+        self.assertTrue(button.disabled)
+        game.player.currency = 1000
+        self.assertFalse(game.purchase_upgrade('golden_mullet'))
+        
+        self.assertTrue(game.purchase_upgrade('click_power'))
+        self.assertTrue(game.purchase_upgrade('click_power'))
+        self.assertEqual(game.unlocks.missing('golden_mullet'), {'achievement:clicks_100': 1})
+        self.assertIn("Clicker", button.text)
+        self.assertTrue(button.disabled)
+        
+        game.handle_clicks([self.click_pos] * 100)
+        self.assertFalse(button.disabled)
+        self.assertTrue(game.purchase_upgrade('golden_mullet'))
+    
+    def test_click_rate_is_tracked(self):
+        """Test that clicks feed the live click rate."""
+        for _ in range(12):
+            self.post_click(self.click_pos)
+        self.game.handle_events()
+        self.assertEqual(self.game.get_click_rate(), 12.0)
+    
+    def test_clicks_are_mapped_from_a_scaled_window(self):
+        """Test that clicks in a scaled window hit the logical click area."""
+        self.game.viewport.resize(pygame.Surface((1600, 1200)))
+        self.post_click(self.click_pos)  # Lands above and left of the scaled click area
+        self.post_click((self.click_pos[0] * 2, self.click_pos[1] * 2))
+        self.game.handle_events()
+        self.game.render()
+        
+        self.assertEqual(self.game.player.currency, 1)
+    
+    def test_auto_income_follows_game_time(self):
+        """Test that auto income accrues from game time advanced by update."""
+        self.game.player.auto_click_power = 2
+        self.game.update(0.25)
+        self.assertEqual(self.game.player.currency, 0)
+        
+        self.game.update(0.75)
+        self.assertEqual(self.game.player.currency, 2)
+    
+    def test_stage_2_releases_levis(self):
+        """Test that buying Stage 2 spawns Levis that can be clicked."""
+        self.game.player.currency = 100
+        self.assertTrue(self.game.purchase_upgrade('stage_2_unlock'))
+        self.assertEqual(len(self.game.levis), 1)
+        
+        # Fly the Levi onto the screen and click it
+        self.game.levis.xs[0] = 50
+        self.game.levis.ys[0] = 50
+        self.game.levis.vxs[0] = 0
+        self.game.levis.grid_dirty = True
+        self.post_click((60, 60))
+        self.game.handle_events()
+        
+        self.assertEqual(len(self.game.levis), 0)
+        self.assertEqual(self.game.player.currency, LEVI_VALUE)
+        
+        # Another one arrives on the spawn timer
+        self.game.update(LEVI_SPAWN_MAX_TIME)
+        self.assertEqual(len(self.game.levis), 1)
+    
+    def test_win_is_recorded(self):
+        """Test that reaching WIN_AMOUNT records the run time once."""
+        self.game.leaderboard = Leaderboard(':memory:')
+        self.addCleanup(self.game.leaderboard.close)
+        self.post_click(self.click_pos)
+        self.game.handle_events()
+        
+        self.game.update(1.5)
+        self.game.player.currency = WIN_AMOUNT
+        self.game.update(1.0)
+        self.game.update(1.0)
+        
+        self.assertTrue(self.game.won)
+        self.assertEqual([entry['time'] for entry in self.game.leaderboard.get_top()], [2.5])
+    
+    def test_idle_timeout(self):
+        """Test that the game only sleeps when nothing is animating."""
+        self.game.scheduler.cancel(self.game.autosave_timer)
+        self.assertEqual(self.game.get_idle_timeout(), IDLE_MAX_WAIT)
+        
+        # The next autosave or visible currency increment ends the sleep
+        self.game.scheduler.schedule(2.0, lambda: None)
+        self.assertEqual(self.game.get_idle_timeout(), 2.0)
+        self.game.player.auto_click_power = 1
+        self.game.update(0.25)
+        self.assertAlmostEqual(self.game.get_idle_timeout(), 0.75)
+        self.game.player.auto_click_power = 100
+        self.assertIsNone(self.game.get_idle_timeout())
+        
+        # Particles keep the game drawing every frame
+        self.game.player.auto_click_power = 0
+        self.post_click(self.click_pos)
+        self.game.handle_events()
+        self.assertIsNone(self.game.get_idle_timeout())
+    
+    def test_achievements_unlock_and_persist(self):
+        """Test that achievements unlock from stats and are restored from the save."""
+        self.post_click(self.click_pos)
+        self.game.handle_events()
+        self.assertTrue(self.game.achievements.is_unlocked('first_click'))
+        self.assertEqual(self.game.toast.text, "Achievement unlocked: First Click")
+        
+        self.game.player.currency = 50
+        self.game.purchase_upgrade('auto_clicker')
+        self.game.update(1000.0)
+        self.assertTrue(self.game.achievements.is_unlocked('hands_free'))
+        self.assertTrue(self.game.achievements.is_unlocked('earned_1k'))
+        self.assertEqual(self.game.toast.text, "Achievement unlocked: Thousandaire")
+        
+        game = Game(save_manager=SaveManager(self.save_path))
+        self.addCleanup(game.assets.shutdown)
+        self.assertEqual(game.achievements.to_list(), ['earned_1k', 'first_click', 'hands_free'])
+    
+    def test_player_is_restored_from_save(self):
+        """Test that the balance, upgrade levels and tracked stats come back with the achievements."""
+        for _ in range(3):
+            self.post_click(self.click_pos)
+            self.game.handle_events()
+        self.game.player.earn(200)
+        self.assertTrue(self.game.purchase_upgrade('click_power'))
+        self.assertTrue(self.game.purchase_upgrade('stage_2_unlock'))
+        self.game.autosave()
+        
+        game = Game(save_manager=SaveManager(self.save_path))
+        self.addCleanup(game.assets.shutdown)
+        player = game.player
+        self.assertEqual(player.currency, self.game.player.currency)
+        self.assertEqual(player.owned_upgrades, {'click_power': 1, 'stage_2_unlock': 1})
+        self.assertEqual(player.click_power, self.game.player.click_power)
+        self.assertEqual((player.total_clicks, player.currency_earned), (3, 203))
+        self.assertEqual(game.achievements.to_list(), self.game.achievements.to_list())
+        self.assertIn("(Lvl 1)", game.upgrade_buttons['click_power'].text)
+        self.assertEqual(len(game.levis), 1)
+    
+    def make_pack(self, upgrades, name='test'):
+        """Create a content pack with one file of upgrade definitions."""
+        pack_dir = os.path.join(os.path.dirname(self.save_path), 'packs', name)
+        os.makedirs(pack_dir, exist_ok=True)
+        with open(os.path.join(pack_dir, 'upgrades.json'), 'w') as f:
+            json.dump({'upgrades': upgrades}, f)
+        return ContentPack(pack_dir, os.path.join(os.path.dirname(self.save_path), 'cache'))
+    
+    def test_content_pack_upgrades(self):
+        """Test that content packs are loaded after startup and a bad pack is left out alone."""
+        rocket = {'id': 'rocket', 'name': 'Rocket', 'base_cost': 500, 'cost_multiplier': 2,
+                  'effect_value': 10, 'effect': 'click_power', 'requires': {'upgrades': {'click_power': 5}}}
+        loop = {'id': 'loop', 'name': 'Loop', 'base_cost': 1, 'cost_multiplier': 2,
+                'effect_value': 1, 'effect': 'click_power', 'requires': {'upgrades': {'loop': 1}}}
+        packs = [self.make_pack([rocket], 'rockets'), self.make_pack([loop], 'loops')]
+        game = Game(save_manager=SaveManager(self.save_path), content_packs=packs)
+        self.addCleanup(game.assets.shutdown)
+        self.assertNotIn('rocket', game.upgrades)
+        self.assertFalse(packs[0].loaded)
+        
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            game.load_content_packs()
+        self.assertIn('rocket', game.upgrades)
+        self.assertNotIn('loop', game.upgrades)
+        self.assertIn("Error loading content pack loops", output.getvalue())
+        self.assertIn("cycle", output.getvalue())
+        self.assertEqual(game.upgrade_buttons['rocket'].layout.lines[0], "Rocket")
+        self.assertTrue(game.upgrade_buttons['rocket'].disabled)
+        self.assertEqual(game.upgrade_codes['rocket'], 4)
+    
+    def test_content_packs_load_in_the_background(self):
+        """Test that packs are parsed off the frame thread and added to the shop once done."""
+        cheap = {'id': 'cheap', 'name': 'Cheap', 'base_cost': 1, 'cost_multiplier': 2,
+                 'effect_value': 1, 'effect': 'click_power'}
+        game = Game(save_manager=SaveManager(self.save_path), content_packs=[self.make_pack([cheap])])
+        self.addCleanup(game.assets.shutdown)
+        game.start_loading_content_packs()
+        self.assertEqual(game.content_packs, [])
+        
+        upgrades, unlocks = game.pack_loader.result(timeout=5)
+        self.assertIn('cheap', upgrades)
+        self.assertNotIn('cheap', game.upgrades)
+        game.add_loaded_content_packs()
+        self.assertIn('cheap', game.upgrades)
+        self.assertIs(game.unlocks, unlocks)
+        self.assertIsNone(game.pack_loader)
+        self.assertIn('cheap', game.upgrade_buttons)
+    
+    def test_purchase_loads_content_packs(self):
+        """Test that buying a pack upgrade before the packs are loaded loads them."""
+        cheap = {'id': 'cheap', 'name': 'Cheap', 'base_cost': 1, 'cost_multiplier': 2,
+                 'effect_value': 1, 'effect': 'click_power'}
+        game = Game(save_manager=SaveManager(self.save_path), content_packs=[self.make_pack([cheap])])
+        self.addCleanup(game.assets.shutdown)
+        game.player.currency = 1
+        self.assertTrue(game.purchase_upgrade('cheap'))
+        self.assertEqual(game.content_packs, [])
+    
+    def test_events_are_logged(self):
+        """Test that clicks and purchases are written to the analytics log."""
+        log_path = os.path.join(os.path.dirname(self.save_path), 'analytics.log')
+        self.game.analytics = AnalyticsLog(log_path, capacity=16)
+        self.addCleanup(self.game.analytics.close)
+        for _ in range(10):
+            self.post_click(self.click_pos)
+        self.game.handle_events()
+        self.game.purchase_upgrade('click_power')
+        
+        log = self.game.analytics
+        records = [(kind, code, count, value) for _, kind, code, count, value
+                   in RECORD.iter_unpack(log.map[HEADER_SIZE:HEADER_SIZE + log.written * RECORD.size])]
+        self.assertEqual(records[1:], [(CLICKS, 0, 10, 10), (PURCHASE, 0, 1, 10)])
+    
+    def test_wait_for_activity_keeps_the_event(self):
+        """Test that the event ending an idle wait is still handled."""
+        self.post_click(self.click_pos)
+        self.game.wait_for_activity(1.0)
+        self.game.handle_events()
+        self.assertEqual(self.game.player.currency, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the speedrun leaderboard.
+"""
+
+import bisect
+import os
+import random
+import tempfile
+import unittest
+from src.utils.leaderboard import Leaderboard, format_time
+
+class TestLeaderboard(unittest.TestCase):
+    """Test cases for the Leaderboard class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.leaderboard = Leaderboard(':memory:')
+        self.addCleanup(self.leaderboard.close)
+    
+    def test_top_and_rank(self):
+        """Test that runs are ordered by time and ranked."""
+        for run_time, name in [(90.0, "Liam"), (45.5, "Levi"), (120.0, "Anonymous"), (60.0, "Liam")]:
+            self.leaderboard.add_score(run_time, name)
+        
+        top = self.leaderboard.get_top(3)
+        self.assertEqual([entry['time'] for entry in top], [45.5, 60.0, 90.0])
+        self.assertEqual(top[0]['name'], "Levi")
+        self.assertEqual(len(self.leaderboard), 4)
+        
+        self.assertEqual(self.leaderboard.get_rank(45.5), 1)
+        self.assertEqual(self.leaderboard.get_rank(75.0), 3)
+        self.assertEqual(self.leaderboard.get_rank(500.0), 5)
+    
+    def test_personal_bests(self):
+        """Test that each profile keeps only its fastest run."""
+        self.assertTrue(self.leaderboard.add_score(90.0, "Liam"))
+        self.assertTrue(self.leaderboard.add_score(60.0, "Liam"))
+        self.assertFalse(self.leaderboard.add_score(75.0, "Liam"))
+        self.leaderboard.add_scores([(30.0, "Levi", None), (100.0, "Kiosk 1", "kiosk")])
+        
+        self.assertEqual(self.leaderboard.get_personal_best("Liam"), 60.0)
+        self.assertIsNone(self.leaderboard.get_personal_best("Nobody"))
+        self.assertEqual(self.leaderboard.get_profile_rank("Liam"), 2)
+        self.assertEqual(self.leaderboard.get_profile_rank("kiosk"), 3)
+        self.assertEqual([entry['name'] for entry in self.leaderboard.get_top(per_profile=True)],
+                         ["Levi", "Liam", "Kiosk 1"])
+    
+    def test_rank_on_a_large_table(self):
+        """Test that bucketed ranks match a full count over many runs and personal best changes."""
+        rng = random.Random(3)
+        self.leaderboard.add_scores([(rng.uniform(30, 600), f"player{i % 2000}", None) for i in range(50000)])
+        for i in range(200):
+            self.leaderboard.add_score(rng.uniform(20, 600), f"player{i}")
+        self.leaderboard.add_score(300.0, "whole")
+        
+        times = sorted(time for (time,) in self.leaderboard.connection.execute("SELECT time FROM scores"))
+        bests = sorted(time for (time,) in self.leaderboard.connection.execute("SELECT time FROM bests"))
+        for run_time in (0.5, 20.0, 45.25, 300.0, 300.5, 599.999, 1000.0):
+            self.assertEqual(self.leaderboard.get_rank(run_time), bisect.bisect_left(times, run_time) + 1)
+            self.assertEqual(self.leaderboard.get_rank(run_time, per_profile=True),
+                             bisect.bisect_left(bests, run_time) + 1)
+    
+    def test_counts_are_built_for_an_existing_database(self):
+        """Test that a database from before the run counts is counted when opened."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = os.path.join(temp_dir.name, 'leaderboard.db')
+        leaderboard = Leaderboard(path)
+        leaderboard.add_scores([(10.5, "a", None), (11.0, "b", None), (11.5, "c", None)])
+        with leaderboard.connection:
+            for name in ('scores_count_insert', 'bests_count_insert', 'bests_count_update'):
+                leaderboard.connection.execute(f"DROP TRIGGER {name}")
+            leaderboard.connection.execute("DROP TABLE score_buckets")
+            leaderboard.connection.execute("DROP TABLE best_buckets")
+        leaderboard.close()
+        
+        leaderboard = Leaderboard(path)
+        self.addCleanup(leaderboard.close)
+        self.assertEqual(leaderboard.get_rank(11.2), 3)
+        leaderboard.add_score(5.0, "d")
+        self.assertEqual(leaderboard.get_rank(11.2, per_profile=True), 4)
+    
+    def test_format_time(self):
+        """Test run time formatting."""
+        self.assertEqual(format_time(125.9), "2:05")
+        self.assertEqual(format_time(7), "0:07")
+
+if __name__ == '__main__':
+    unittest.main()
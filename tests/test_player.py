@@ -52,6 +52,13 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(gained, 5)
         self.assertEqual(self.player.currency, 6)
     
+    def test_click_batch(self):
+        """Test processing several clicks at once."""
+        self.player.click_power = 3
+        gained = self.player.click(100)
+        self.assertEqual(gained, 300)
+        self.assertEqual(self.player.currency, 300)
+    
     def test_auto_click(self):
         """Test the auto_click method."""
         # No auto click power initially
@@ -70,6 +77,29 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(gained, 1)
         self.assertEqual(self.player.currency, 3)
     
+    def test_lazy_income(self):
+        """Test that a player with a clock accrues auto income when read."""
+        now = [0.0]
+        player = Player(clock=lambda: now[0])
+        player.auto_click_power = 3
+        
+        now[0] = 10.5
+        self.assertEqual(player.currency, 31)
+        self.assertEqual(player.balance, 0)  # Nothing is materialized by reading
+        self.assertEqual(player.auto_click(1.0), 0)
+        
+        # Clicking and purchasing keep the fractional progress
+        player.click()
+        self.assertEqual(player.currency, 32)
+        now[0] = 10.7
+        self.assertEqual(player.currency, 33)
+        self.assertFalse(player.purchase_upgrade(self.auto_clicker_upgrade))
+        
+        # A new rate only applies from the time it was set
+        player.auto_click_power = 4
+        now[0] = 11.7
+        self.assertEqual(player.currency, 37)
+    
     def test_purchase_upgrade(self):
         """Test purchasing upgrades."""
         # Cannot afford upgrade initially
@@ -107,6 +137,20 @@ class TestPlayer(unittest.TestCase):
         self.player.purchase_upgrade(self.click_power_upgrade)
         self.assertEqual(self.player.get_upgrade_level('click_power'), 2)
     
+    def test_earned_stats(self):
+        """Test that clicks and earnings are counted regardless of spending."""
+        now = [0.0]
+        player = Player(clock=lambda: now[0])
+        player.click(3)
+        player.earn(150)
+        player.auto_click_power = 2
+        now[0] = 2.5
+        self.assertEqual(player.total_clicks, 3)
+        self.assertEqual(player.currency_earned, 158)
+        
+        player.currency = 0  # Spending does not lower the earned total
+        self.assertEqual(player.currency_earned, 158)
+    
     def test_to_dict_and_from_dict(self):
         """Test converting player to and from dictionary."""
         # Set up player state
@@ -114,6 +158,7 @@ class TestPlayer(unittest.TestCase):
         self.player.click_power = 3
         self.player.auto_click_power = 2
         self.player.owned_upgrades = {'click_power': 2, 'auto_clicker': 1}
+        self.player.click(4)
         
         # Convert to dict
         player_dict = self.player.to_dict()
@@ -122,10 +167,12 @@ class TestPlayer(unittest.TestCase):
         new_player = Player.from_dict(player_dict)
         
         # Check values
-        self.assertEqual(new_player.currency, 100)
+        self.assertEqual(new_player.currency, 112)
         self.assertEqual(new_player.click_power, 3)
         self.assertEqual(new_player.auto_click_power, 2)
         self.assertEqual(new_player.owned_upgrades, {'click_power': 2, 'auto_clicker': 1})
+        self.assertEqual(new_player.total_clicks, 4)
+        self.assertEqual(new_player.currency_earned, 12)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
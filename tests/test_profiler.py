@@ -0,0 +1,83 @@
+"""
+Tests for the frame profiler.
+"""
+
+import csv
+import os
+import tempfile
+import unittest
+from src.utils.profiler import FrameProfiler, percentile
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test cases for the FrameProfiler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.profiler = FrameProfiler(window=100)
+    
+    def record_frames(self, durations):
+        """Record one frame per duration with a single 'update' section."""
+        for duration in durations:
+            self.profiler.begin_frame()
+            self.profiler.record('update', duration)
+            self.profiler.end_frame()
+    
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2)
+        self.assertEqual(percentile([1, 2, 3, 4], 51), 3)
+        self.assertEqual(percentile([1, 2, 3, 4], 0), 1)
+        self.assertEqual(percentile([1, 2, 3, 4], 100), 4)
+        self.assertEqual(percentile([], 50), 0.0)
+    
+    def test_rolling_percentiles(self):
+        """Test that percentiles are computed over the rolling window."""
+        self.record_frames([0.001] * 100)
+        self.record_frames([0.010] * 100)
+        
+        pcts = self.profiler.get_percentiles('update')
+        self.assertAlmostEqual(pcts[50], 10.0)
+        self.assertAlmostEqual(pcts[99], 10.0)
+        self.assertIn('frame', self.profiler.get_summary())
+    
+    def test_section_context_manager(self):
+        """Test that sections accumulate within a frame."""
+        self.profiler.begin_frame()
+        with self.profiler.section('render'):
+            pass
+        with self.profiler.section('render'):
+            pass
+        self.profiler.end_frame()
+        
+        self.assertEqual(len(self.profiler.samples['render']), 1)
+        self.assertEqual(self.profiler.sections, ['render', 'frame'])
+    
+    def test_disabled(self):
+        """Test that a disabled profiler records nothing."""
+        profiler = FrameProfiler(enabled=False)
+        profiler.begin_frame()
+        with profiler.section('update'):
+            pass
+        profiler.end_frame()
+        self.assertEqual(profiler.sections, [])
+        self.assertEqual(len(profiler.trace), 0)
+    
+    def test_dump_csv(self):
+        """Test writing the frame trace to CSV."""
+        self.record_frames([0.002, 0.004])
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'trace.csv')
+            self.assertTrue(self.profiler.dump_csv(path))
+            with open(path, newline='') as f:
+                rows = list(csv.reader(f))
+        
+        self.assertEqual(rows[0], ['frame', 'timestamp', 'update_ms', 'frame_ms'])
+        self.assertEqual(len(rows), 3)
+        self.assertAlmostEqual(float(rows[2][2]), 4.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests for the random number service.
+"""
+
+import unittest
+from src.utils.rng import RandomService
+from src.utils.helpers import create_particle_burst
+
+class TestRandomService(unittest.TestCase):
+    """Test cases for the RandomService class."""
+    
+    def test_same_seed_replays(self):
+        """Test that the same seed produces the same sequences."""
+        first = RandomService(seed=42).stream('particles').uniform_batch(0, 1, 10)
+        second = RandomService(seed=42).stream('particles').uniform_batch(0, 1, 10)
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, RandomService(seed=43).stream('particles').uniform_batch(0, 1, 10))
+    
+    def test_streams_are_independent(self):
+        """Test that drawing from one stream does not affect another."""
+        quiet = RandomService(seed=7)
+        busy = RandomService(seed=7)
+        busy.stream('particles').uniform_batch(0, 1, 1000)
+        self.assertEqual(quiet.stream('simulation').random(), busy.stream('simulation').random())
+        self.assertNotEqual(quiet.stream('particles').random(), quiet.stream('simulation').random())
+    
+    def test_reseed(self):
+        """Test that reseeding restarts existing streams."""
+        rng = RandomService(seed=1)
+        stream = rng.stream('spawns')
+        first = stream.random()
+        rng.reseed(1)
+        self.assertEqual(stream.random(), first)
+    
+    def test_batch_ranges(self):
+        """Test that batch draws stay within their bounds."""
+        stream = RandomService(seed=3).stream('simulation')
+        ints = stream.randint_batch(3, 8, 5000)
+        self.assertEqual(set(ints), set(range(3, 9)))
+        floats = stream.uniform_batch(0.5, 1.5, 5000)
+        self.assertTrue(all(0.5 <= value < 1.5 for value in floats))
+        for dx, dy in stream.velocity_batch(50, 150, 1000):
+            self.assertTrue(50 - 1e-9 <= (dx * dx + dy * dy) ** 0.5 <= 150 + 1e-9)
+    
+    def test_particle_burst_is_reproducible(self):
+        """Test that particle bursts replay exactly from a seed."""
+        bursts = [
+            create_particle_burst([(0, 0), (10, 10)], (0, 0, 255), 20, RandomService(seed=5).stream('particles'))
+            for _ in range(2)
+        ]
+        self.assertEqual([p.velocity for p in bursts[0]], [p.velocity for p in bursts[1]])
+        self.assertEqual([p.size for p in bursts[0]], [p.size for p in bursts[1]])
+        self.assertEqual(bursts[0][-1].position, [10, 10])
+    
+    def test_empty_particle_burst(self):
+        """Test that a burst of no particles is empty and draws nothing."""
+        stream = RandomService(seed=5).stream('particles')
+        self.assertEqual(create_particle_burst([(0, 0)], (0, 0, 255), 0, stream), [])
+        self.assertEqual(create_particle_burst([], (0, 0, 255), 3, stream), [])
+        self.assertEqual(stream.uniform_batch(0, 1, 3), RandomService(seed=5).stream('particles').uniform_batch(0, 1, 3))
+
+if __name__ == '__main__':
+    unittest.main()
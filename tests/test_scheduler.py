@@ -0,0 +1,88 @@
+"""
+Tests for the timed event scheduler.
+"""
+
+import unittest
+from src.utils.scheduler import Scheduler
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for the Scheduler class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.scheduler = Scheduler()
+        self.fired = []
+    
+    def test_timers_fire_in_order(self):
+        """Test that due timers fire once, in due time order."""
+        self.scheduler.schedule(2.0, self.fired.append, 'b')
+        self.scheduler.schedule(1.0, self.fired.append, 'a')
+        self.scheduler.schedule(5.0, self.fired.append, 'c')
+        
+        self.assertEqual(self.scheduler.update(0.5), 0)
+        self.assertEqual(self.scheduler.update(2.0), 2)
+        self.assertEqual(self.fired, ['a', 'b'])
+        self.assertEqual(self.scheduler.pending(), 1)
+    
+    def test_repeat(self):
+        """Test that repeating timers keep their period without drifting."""
+        self.scheduler.schedule(1.0, self.fired.append, 'tick', repeat=True)
+        for _ in range(14):
+            self.scheduler.update(0.25)
+        
+        self.assertEqual(len(self.fired), 3)
+        self.assertEqual(self.scheduler.pending(), 1)
+    
+    def test_cancel(self):
+        """Test that cancelled timers never fire and the heap is compacted."""
+        timers = [self.scheduler.schedule(1.0, self.fired.append, i) for i in range(200)]
+        for timer in timers[:150]:
+            self.scheduler.cancel(timer)
+        
+        self.assertEqual(self.scheduler.pending(), 50)
+        self.assertLess(len(self.scheduler.heap), 200)
+        self.scheduler.update(1.0)
+        self.assertEqual(self.fired, list(range(150, 200)))
+    
+    def test_pause_timer(self):
+        """Test that a paused timer keeps its remaining time."""
+        timer = self.scheduler.schedule(1.0, self.fired.append, 'buff')
+        self.scheduler.update(0.4)
+        self.scheduler.pause_timer(timer)
+        self.scheduler.update(5.0)
+        self.assertEqual(self.fired, [])
+        
+        self.scheduler.resume_timer(timer)
+        self.scheduler.resume_timer(timer)
+        self.scheduler.update(0.5)
+        self.assertEqual(self.fired, [])
+        self.scheduler.update(0.1)
+        self.assertEqual(self.fired, ['buff'])
+    
+    def test_pause_scheduler(self):
+        """Test that no time passes while the scheduler is paused."""
+        self.scheduler.schedule(1.0, self.fired.append, 'spawn')
+        self.scheduler.pause()
+        self.scheduler.update(10.0)
+        self.assertEqual(self.fired, [])
+        
+        self.scheduler.resume()
+        self.scheduler.update(1.0)
+        self.assertEqual(self.fired, ['spawn'])
+    
+    def test_time_until_next(self):
+        """Test the time until the next live timer fires."""
+        self.assertIsNone(self.scheduler.time_until_next())
+        first = self.scheduler.schedule(1.0, self.fired.append, 'a')
+        self.scheduler.schedule(3.0, self.fired.append, 'b')
+        self.scheduler.update(0.5)
+        self.assertEqual(self.scheduler.time_until_next(), 0.5)
+        
+        self.scheduler.cancel(first)
+        self.assertEqual(self.scheduler.time_until_next(), 2.5)
+        self.assertEqual(self.scheduler.pending(), 1)
+        self.scheduler.pause()
+        self.assertIsNone(self.scheduler.time_until_next())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+"""
+Tests for the headless game server.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.models.upgrade import Upgrade
+from src.server.client import GameClient
+from src.server.game_server import GameServer
+from src.utils.content_packs import ContentPack
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the GameServer class."""
+    
+    async def asyncSetUp(self):
+        """Start a server on a free local port."""
+        self.server = GameServer(port=0, tick_interval=0.02)
+        await self.server.start()
+        self.client = GameClient()
+        await self.client.connect(self.server.host, self.server.port)
+    
+    async def asyncTearDown(self):
+        """Stop the client and server."""
+        await self.client.close()
+        await self.server.stop()
+    
+    async def test_hello_creates_session(self):
+        """Test that hello creates a session and returns its state."""
+        welcome = await self.client.hello()
+        self.assertIn(welcome['session_id'], self.server.sessions)
+        self.assertEqual(welcome['state']['currency'], 0)
+    
+    async def test_clicks_are_batched_into_one_diff(self):
+        """Test that many clicks before a tick arrive as one diff."""
+        await self.client.hello()
+        for _ in range(50):
+            await self.client.click()
+        
+        diff = await asyncio.wait_for(self.client.wait_for('diff'), 1)
+        while self.client.state['currency'] < 50:
+            diff = await asyncio.wait_for(self.client.wait_for('diff'), 1)
+        self.assertEqual(self.client.state['currency'], 50)
+        self.assertEqual(set(diff['diff']), {'currency', 'total_clicks', 'earned'})
+    
+    async def test_purchase_starts_income(self):
+        """Test that buying an auto clicker schedules the session for income."""
+        await self.client.hello()
+        session = self.server.sessions[self.client.session_id]
+        self.assertNotIn(session, self.server.income_sessions)
+        
+        await self.client.click(50)
+        self.assertTrue(await self.client.purchase('auto_clicker'))
+        self.assertIn(session, self.server.income_sessions)
+        self.assertFalse(await self.client.purchase('auto_clicker'))
+    
+    async def test_purchase_checks_prerequisites(self):
+        """Test that an upgrade gated on an upgrade level and an achievement can be bought."""
+        self.server.upgrades['golden_mullet'] = Upgrade(
+            'golden_mullet', 'Golden Mullet', '', 10, 1.5, 1, 1,
+            {'upgrades': {'click_power': 1}, 'achievements': ['clicks_100']}, effect='click_power')
+        await self.client.hello()
+        await self.client.click(50)
+        self.assertFalse(await self.client.purchase('golden_mullet'))
+        self.assertTrue(await self.client.purchase('click_power'))
+        self.assertFalse(await self.client.purchase('golden_mullet'))
+        
+        await self.client.click(60)
+        self.assertTrue(await self.client.purchase('golden_mullet'))
+        session = self.server.sessions[self.client.session_id]
+        self.assertTrue(session.achievements.is_unlocked('clicks_100'))
+    
+    async def test_resume_session(self):
+        """Test that a client can reconnect to its session."""
+        await self.client.hello()
+        await self.client.click(7)
+        await asyncio.wait_for(self.client.wait_for('diff'), 1)
+        await self.client.close()
+        
+        client = GameClient()
+        await client.connect(self.server.host, self.server.port)
+        welcome = await client.hello(self.client.session_id)
+        await client.close()
+        self.assertEqual(welcome['state']['currency'], 7)
+    
+    async def test_errors(self):
+        """Test error replies for bad messages."""
+        await self.client.send({'type': 'click'})
+        self.assertEqual((await self.client.receive())['type'], 'error')
+        await self.client.hello()
+        await self.client.send({'type': 'dance'})
+        self.assertEqual((await self.client.receive())['type'], 'error')
+    
+    async def test_bad_field_types(self):
+        """Test that ids that are not strings get an error instead of closing the connection."""
+        await self.client.send({'type': 'hello', 'session_id': ['a']})
+        self.assertEqual((await self.client.receive())['message'], "invalid session id")
+        await self.client.hello()
+        await self.client.send({'type': 'purchase', 'upgrade_id': {'id': 'click_power'}})
+        self.assertEqual((await self.client.receive())['message'], "invalid upgrade id")
+        await self.client.send({'type': 'click', 'count': 1})
+        self.assertEqual(len(self.server.sessions), 1)
+
+class TestGameServerTick(unittest.TestCase):
+    """Test cases for the server's tick scheduling without sockets."""
+    
+    def test_only_connected_income_sessions_are_ticked(self):
+        """Test that ticks skip idle sessions and income is evaluated lazily."""
+        now = [0.0]
+        server = GameServer(clock=lambda: now[0])
+        idle = server.create_session()
+        earner = server.create_session()
+        offline = server.create_session()
+        for session in (idle, earner):
+            session.writer = object()
+        for session in (earner, offline):
+            session.player.auto_click_power = 3
+            server.update_income(session)
+        
+        now[0] = 1.0
+        server.tick()
+        
+        self.assertEqual(server.income_sessions, {earner})
+        self.assertEqual(server.dirty, {earner})
+        self.assertEqual(earner.player.currency, 3)
+        self.assertEqual(offline.player.currency, 3)
+        self.assertEqual(idle.player.currency, 0)
+    
+    def test_disconnected_sessions_expire(self):
+        """Test that sessions without a client are removed after the TTL, oldest first."""
+        now = [0.0]
+        server = GameServer(clock=lambda: now[0], session_ttl=10)
+        writer = MessageWriter()
+        connected = server.handle_message(None, writer, {'type': 'hello'})
+        old = server.create_session()
+        now[0] = 5.0
+        new = server.create_session()
+        
+        now[0] = 12.0
+        server.expire_sessions()
+        self.assertEqual(set(server.sessions.values()), {connected, new})
+        now[0] = 15.0
+        server.expire_sessions()
+        self.assertEqual(set(server.sessions.values()), {connected})
+        self.assertEqual(server.idle_since, {})
+        self.assertIsNone(server.sessions.get(old.id))
+    
+    def test_second_hello_leaves_the_old_session(self):
+        """Test that a new hello on a connection detaches its previous session so it can expire."""
+        now = [0.0]
+        server = GameServer(clock=lambda: now[0], session_ttl=10)
+        writer = MessageWriter()
+        first = server.handle_message(None, writer, {'type': 'hello'})
+        first.player.auto_click_power = 1
+        server.update_income(first)
+        second = server.handle_message(first, writer, {'type': 'hello'})
+        
+        self.assertIsNot(first, second)
+        self.assertIsNone(first.writer)
+        self.assertNotIn(first, server.income_sessions)
+        now[0] = 11.0
+        server.expire_sessions()
+        self.assertEqual(list(server.sessions.values()), [second])
+    
+    def test_resuming_a_connected_session_moves_it(self):
+        """Test that resuming a session another connection holds tells that connection and cuts it off."""
+        server = GameServer()
+        old_writer, new_writer = MessageWriter(), MessageWriter()
+        old_session = server.handle_message(None, old_writer, {'type': 'hello'})
+        session = server.handle_message(None, new_writer, {'type': 'hello', 'session_id': old_session.id})
+        
+        self.assertIs(session, old_session)
+        self.assertIs(session.writer, new_writer)
+        self.assertEqual(old_writer.messages[-1], {'type': 'error', 'message': "session resumed elsewhere"})
+        self.assertIsNone(server.handle_message(old_session, old_writer, {'type': 'click', 'count': 5}))
+        self.assertEqual(session.player.currency, 0)
+        self.assertNotIn(session.id, server.idle_since)
+    
+    def test_session_cap_drops_oldest_idle_session(self):
+        """Test that a full server drops the longest idle session, or refuses a new one."""
+        server = GameServer(max_sessions=2)
+        writer = MessageWriter()
+        idle = server.create_session()
+        connected = server.handle_message(None, writer, {'type': 'hello'})
+        newest = server.handle_message(None, writer, {'type': 'hello'})
+        self.assertEqual(set(server.sessions.values()), {connected, newest})
+        self.assertNotIn(idle.id, server.sessions)
+        
+        server.handle_message(None, writer, {'type': 'hello'})
+        self.assertEqual(writer.messages[-1], {'type': 'error', 'message': "server full"})
+
+class MessageWriter:
+    """A stand-in for a client connection that keeps the messages written to it."""
+    
+    def __init__(self):
+        self.messages = []
+    
+    def write(self, data):
+        self.messages.append(json.loads(data))
+
+class TestGameServerContentPacks(unittest.TestCase):
+    """Test cases for the server's content pack loading."""
+    
+    def make_pack(self, name, upgrades):
+        """Create a content pack with one file of upgrade definitions."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        pack_dir = os.path.join(temp_dir.name, name)
+        os.makedirs(pack_dir)
+        with open(os.path.join(pack_dir, 'upgrades.json'), 'w') as f:
+            json.dump({'upgrades': upgrades}, f)
+        return ContentPack(pack_dir, os.path.join(temp_dir.name, '.cache'))
+    
+    def test_packs_load_on_first_unknown_purchase(self):
+        """Test that packs are parsed when first needed and bad packs are left out."""
+        cheap = {'id': 'cheap', 'name': 'Cheap', 'base_cost': 1, 'cost_multiplier': 2,
+                 'effect_value': 1, 'effect': 'click_power'}
+        loop = dict(cheap, id='loop', requires={'upgrades': {'loop': 1}})
+        server = GameServer()
+        server.content_packs = [self.make_pack('cheap', [cheap]), self.make_pack('loops', [loop])]
+        writer = MessageWriter()
+        session = server.handle_message(None, writer, {'type': 'hello'})
+        session.click(1)
+        
+        self.assertFalse(server.content_packs[0].loaded)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            server.handle_message(session, writer, {'type': 'purchase', 'upgrade_id': 'cheap'})
+        self.assertTrue(writer.messages[-1]['success'])
+        self.assertNotIn('loop', server.upgrades)
+        self.assertIn("cycle", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
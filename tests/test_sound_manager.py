@@ -0,0 +1,83 @@
+"""
+Tests for the SoundManager.
+"""
+
+import os
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import unittest
+from unittest import mock
+import pygame
+from src.config import SOUND_RESERVED_CHANNELS
+from src.utils.asset_manager import AssetManager
+from src.utils.sound_manager import SoundManager
+
+class TestSoundManager(unittest.TestCase):
+    """Test cases for the SoundManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            self.skipTest(f"No audio device: {e}")
+        self.addCleanup(pygame.mixer.quit)
+        
+        self.assets = AssetManager(manifest_path=os.devnull)
+        self.addCleanup(self.assets.shutdown)
+        
+        # One second of silence, long enough to still be playing during the test
+        sound = pygame.mixer.Sound(buffer=bytes(44100 * 4))
+        for name in ('click', 'purchase'):
+            self.assets.manifest['sounds'][name] = {}
+            self.assets.cache[('sound', name, None)] = sound
+        
+        self.limits = {
+            'click': {'max_voices': 2, 'min_interval': 0.05},
+            'purchase': {'max_voices': 8, 'min_interval': 0.0},
+        }
+        self.sounds = SoundManager(self.assets, limits=self.limits)
+    
+    def test_unknown_sound_is_ignored(self):
+        """Test that sounds missing from the manifest are not played."""
+        self.assertFalse(self.sounds.play('missing'))
+    
+    def test_rate_limit(self):
+        """Test that plays closer than min_interval are dropped."""
+        with mock.patch('time.perf_counter', side_effect=[1.0, 1.01, 1.1]):
+            self.assertTrue(self.sounds.play('click'))
+            self.assertFalse(self.sounds.play('click'))
+            self.assertTrue(self.sounds.play('click'))
+    
+    def test_voice_limit(self):
+        """Test that a sound never uses more than max_voices channels."""
+        self.limits['click']['min_interval'] = 0.0
+        for _ in range(10):
+            self.assertTrue(self.sounds.play('click'))
+        self.assertLessEqual(len(self.sounds.voices['click']), 2)
+    
+    def test_channel_pool_is_reserved(self):
+        """Test that playback stays within the reserved pool."""
+        for _ in range(20):
+            self.sounds.play('purchase')
+        self.assertEqual(len(self.sounds.channels), SOUND_RESERVED_CHANNELS)
+        self.assertLessEqual(len(self.sounds.voices['purchase']), 8)
+    
+    def test_disabled(self):
+        """Test that a disabled manager plays nothing."""
+        sounds = SoundManager(self.assets, limits=self.limits, enabled=False)
+        self.assertFalse(sounds.play('click'))
+
+    def test_manifest_sounds_play(self):
+        """Test that the game's click and purchase sounds load from the shipped manifest and play."""
+        assets = AssetManager()
+        self.addCleanup(assets.shutdown)
+        sounds = SoundManager(assets)
+        assets.wait()
+        
+        self.assertTrue(sounds.play('click'))
+        self.assertTrue(sounds.play('purchase'))
+        self.assertEqual(len(sounds.channels), SOUND_RESERVED_CHANNELS)
+
+if __name__ == '__main__':
+    unittest.main()
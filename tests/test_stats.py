@@ -0,0 +1,106 @@
+"""
+Tests for the time series statistics.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import unittest
+import pygame
+from src.utils.stats import SeriesLevel, TimeSeries, StatsRecorder, downsample
+from src.ui.graph import GraphPanel
+
+class TestTimeSeries(unittest.TestCase):
+    """Test cases for the time series classes."""
+    
+    def test_ring_buffer_wraps(self):
+        """Test that a full level keeps only the newest points in order."""
+        level = SeriesLevel(1, 4)
+        for value in range(6):
+            level.append(value, value, value)
+        
+        self.assertEqual(level.count, 4)
+        mins, maxs, means = level.latest(10)
+        self.assertEqual(mins, [2, 3, 4, 5])
+        self.assertEqual(level.latest(2)[1], [4, 5])
+    
+    def test_rollup(self):
+        """Test that points roll up into min, max and mean at coarser levels."""
+        series = TimeSeries([(1, 10), (5, 10), (25, 10)])
+        for value in range(25):
+            series.add(value)
+        
+        self.assertEqual(series.levels[0].latest(10)[0], list(range(15, 25)))
+        mins, maxs, means = series.levels[1].latest(10)
+        self.assertEqual(mins, [0, 5, 10, 15, 20])
+        self.assertEqual(maxs, [4, 9, 14, 19, 24])
+        self.assertEqual(means, [2, 7, 12, 17, 22])
+        self.assertEqual(series.levels[2].latest(10), ([0], [24], [12]))
+        self.assertEqual(series.revision, 25)
+    
+    def test_level_for(self):
+        """Test that the finest level covering a time span is chosen."""
+        series = TimeSeries([(1, 600), (60, 1440), (3600, 720)])
+        self.assertEqual(series.level_for(600).step, 1)
+        self.assertEqual(series.level_for(3600).step, 60)
+        self.assertEqual(series.level_for(10 ** 9).step, 3600)
+    
+    def test_downsample_keeps_extremes(self):
+        """Test that downsampling keeps each column's min and max."""
+        mins = [0, 5, -3, 2, 9, 1]
+        maxs = [1, 6, -2, 3, 10, 2]
+        self.assertEqual(downsample(mins, maxs, 3), [(0, 6), (-3, 3), (1, 10)])
+        self.assertEqual(downsample(mins[:2], maxs[:2], 3), [(0, 1), (5, 6)])
+
+class TestStatsRecorder(unittest.TestCase):
+    """Test cases for the StatsRecorder class."""
+    
+    def test_gauges_and_counters(self):
+        """Test sampling values and rates, including intervals slept through."""
+        values = {'currency': 0, 'clicks': 0}
+        recorder = StatsRecorder(gauges=('currency',), counters=('clicks',), levels=[(1, 100)])
+        self.assertFalse(recorder.update(0.0, lambda: values))
+        
+        values.update(currency=10, clicks=4)
+        self.assertFalse(recorder.update(0.5, lambda: values))
+        self.assertTrue(recorder.update(1.0, lambda: values))
+        
+        # Two seconds pass in one update
+        values.update(currency=20, clicks=10)
+        self.assertTrue(recorder.update(3.2, lambda: values))
+        
+        self.assertEqual(recorder.series['currency'].levels[0].latest(10)[0], [10, 20, 20])
+        self.assertEqual(recorder.series['clicks'].levels[0].latest(10)[0], [4, 3, 3])
+        self.assertEqual(recorder.next_time, 4.0)
+
+class TestGraphPanel(unittest.TestCase):
+    """Test cases for the GraphPanel class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        pygame.font.init()
+        self.series = TimeSeries([(1, 600), (60, 1440)])
+        self.panel = GraphPanel(pygame.Rect(0, 0, 200, 100), [("Income", self.series)], [('10m', 600), ('24h', 86400)])
+        self.surface = pygame.Surface((200, 100))
+    
+    def test_plot_is_cached_until_new_points(self):
+        """Test that the plot is only drawn again after the series changes."""
+        self.panel.render(self.surface)
+        empty_plot = self.panel.plot
+        self.panel.render(self.surface)
+        self.assertIs(self.panel.plot, empty_plot)
+        
+        for value in range(5000):
+            self.series.add(value % 100)
+        self.panel.render(self.surface)
+        self.assertIsNot(self.panel.plot, empty_plot)
+        
+        self.panel.cycle_range()
+        plot = self.panel.plot
+        self.panel.render(self.surface)
+        self.assertIsNot(self.panel.plot, plot)
+        self.assertEqual(self.panel.plot.get_size(), (200, 100))
+
+if __name__ == '__main__':
+    unittest.main()
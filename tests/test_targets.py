@@ -0,0 +1,80 @@
+"""
+Tests for the moving target pool.
+"""
+
+import random
+import unittest
+from src.config import SCREEN_WIDTH, LEVI_OFFSCREEN_MARGIN
+from src.entities.targets import TargetPool
+
+class TestTargetPool(unittest.TestCase):
+    """Test cases for the TargetPool class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pool = TargetPool(capacity=8, size=(90, 90))
+        self.rng = random.Random(0)
+    
+    def place(self, x, y, vx=100.0):
+        """Spawn a target and move it to a known position."""
+        slot = self.pool.spawn(self.rng)
+        self.pool.xs[slot] = x
+        self.pool.ys[slot] = y
+        self.pool.vxs[slot] = vx
+        self.pool.grid_dirty = True
+        return slot
+    
+    def test_spawn_at_edges(self):
+        """Test that targets spawn off screen, moving inwards."""
+        for _ in range(8):
+            slot = self.pool.spawn(self.rng)
+            x = self.pool.xs[slot]
+            self.assertIn(x, (-LEVI_OFFSCREEN_MARGIN, SCREEN_WIDTH + LEVI_OFFSCREEN_MARGIN))
+            self.assertEqual(self.pool.vxs[slot] > 0, x < 0)
+        
+        # The pool never grows past its capacity
+        self.assertEqual(self.pool.spawn(self.rng), -1)
+        self.assertEqual(len(self.pool), 8)
+    
+    def test_update_removes_offscreen(self):
+        """Test that targets move and are recycled once they leave the screen."""
+        leaving = self.place(SCREEN_WIDTH + LEVI_OFFSCREEN_MARGIN - 1, 100)
+        staying = self.place(0, 200, vx=-50.0)
+        
+        self.assertEqual(self.pool.update(0.1), 1)
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.pool.xs[0], -5.0)
+        self.assertEqual((leaving, staying), (0, 1))
+    
+    def test_hit_test(self):
+        """Test that clicks find the topmost target under them."""
+        self.place(100, 100)
+        self.place(150, 150)
+        
+        self.assertEqual(self.pool.hit_test((120, 120)), 0)
+        self.assertEqual(self.pool.hit_test((170, 170)), 1)  # Both overlap; the later one is on top
+        self.assertEqual(self.pool.hit_test((239, 239)), 1)
+        self.assertEqual(self.pool.hit_test((240, 240)), -1)
+        self.assertEqual(self.pool.hit_test((99, 120)), -1)
+        
+        self.pool.remove(0)
+        self.assertEqual(self.pool.hit_test((120, 120)), -1)
+        self.assertEqual(self.pool.hit_test((170, 170)), 0)  # Moved into the freed slot
+    
+    def test_hit_test_matches_brute_force(self):
+        """Test the grid against checking every target."""
+        pool = TargetPool(capacity=300, size=(90, 90))
+        for _ in range(300):
+            slot = pool.spawn(self.rng)
+            pool.xs[slot] = self.rng.uniform(-100, 900)
+        pool.update(0.0)
+        
+        for _ in range(500):
+            px, py = self.rng.uniform(-100, 900), self.rng.uniform(50, 400)
+            expected = max((slot for slot in range(len(pool))
+                            if pool.xs[slot] <= px < pool.xs[slot] + 90 and pool.ys[slot] <= py < pool.ys[slot] + 90),
+                           default=-1)
+            self.assertEqual(pool.hit_test((px, py)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Tests for the texture atlas and sprite batch.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import pygame
+from src.utils.texture_atlas import TextureAtlas, SpriteBatch, pack, sprite_key
+
+class TestTextureAtlas(unittest.TestCase):
+    """Test cases for the TextureAtlas and SpriteBatch classes."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        self.assets_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.assets_dir)
+        os.makedirs(os.path.join(self.assets_dir, 'images'))
+        
+        for name, color in (('red', (255, 0, 0, 255)), ('blue', (0, 0, 255, 255))):
+            image = pygame.Surface((40, 20), pygame.SRCALPHA)
+            image.fill(color)
+            pygame.image.save(image, os.path.join(self.assets_dir, 'images', f"{name}.png"))
+        
+        self.images = {
+            'red': {'file': 'red.png', 'scales': [[10, 5], [20, 10]]},
+            'blue': {'file': 'blue.png'},
+        }
+    
+    def test_pack_does_not_overlap(self):
+        """Test that packed rectangles stay apart and inside the atlas."""
+        sizes = {str(i): (30 + i * 7 % 50, 10 + i * 13 % 40) for i in range(40)}
+        rects, (width, height) = pack(sizes, max_width=200, padding=2)
+        
+        placed = [pygame.Rect(rect) for rect in rects.values()]
+        for i, rect in enumerate(placed):
+            self.assertTrue(pygame.Rect(0, 0, width, height).contains(rect))
+            self.assertEqual(rect.collidelist(placed[i + 1:]), -1)
+    
+    def test_build_and_reload(self):
+        """Test that variants are packed, saved with an index and reused until stale."""
+        atlas = TextureAtlas.load_or_build(self.images, self.assets_dir)
+        self.assertEqual(set(atlas.rects), {'red@10x5', 'red@20x10', 'blue'})
+        self.assertEqual(atlas.get('red', (10, 5)).get_size(), (10, 5))
+        self.assertEqual(atlas.get('blue').get_at((5, 5)), (0, 0, 255, 255))
+        self.assertIsNone(atlas.get('green'))
+        
+        with open(os.path.join(self.assets_dir, 'atlas.json')) as f:
+            self.assertEqual(json.load(f)['sprites']['blue'], list(atlas.rects['blue']))
+        
+        with mock.patch.object(TextureAtlas, 'build', wraps=TextureAtlas.build) as build:
+            TextureAtlas.load_or_build(self.images, self.assets_dir)
+            self.images['blue']['scales'] = [[8, 4]]
+            rebuilt = TextureAtlas.load_or_build(self.images, self.assets_dir)
+        
+        self.assertEqual(build.call_count, 1)
+        self.assertIn(sprite_key('blue', (8, 4)), rebuilt)
+    
+    def test_sprite_batch_is_one_blits_call(self):
+        """Test that a batch draws every sprite with one blits call."""
+        atlas = TextureAtlas.build(self.images, self.assets_dir)
+        batch = SpriteBatch(atlas)
+        batch.add('blue', None, (0, 0))
+        batch.add_many('red', (10, 5), [(50, 0), (50, 10)])
+        
+        blits = []
+        target = mock.Mock()
+        target.blits.side_effect = lambda items, doreturn: blits.extend(items)
+        batch.draw(target)
+        
+        target.blits.assert_called_once()
+        self.assertEqual([item[1] for item in blits], [(0, 0), (50, 0), (50, 10)])
+        self.assertEqual(blits[1][2], atlas.rects['red@10x5'])
+        self.assertEqual(batch.items, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+"""
+Tests for the UI components.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import unittest
+from unittest import mock
+import pygame
+from src.ui.button import Button
+from src.ui.panel import Panel
+from src.ui.text import GlyphAtlas, get_glyph_atlas
+from src.ui.text_layout import TextLayout, WORD_CACHE_SIZE
+from src.utils.helpers import create_text_particle, update_particle, render_particle
+
+class TestButton(unittest.TestCase):
+    """Test cases for the Button class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        pygame.font.init()
+        self.surface = pygame.Surface((200, 200))
+        self.button = Button(pygame.Rect(10, 10, 100, 40), "Buy")
+    
+    def test_faces_cover_every_state(self):
+        """Test that a face is pre-rendered for every state."""
+        self.assertEqual(set(self.button.faces),
+                         {'normal', 'hover', 'disabled', 'max_level', 'max_level_hover'})
+        for face in self.button.faces.values():
+            self.assertEqual(face.get_size(), (100, 40))
+    
+    def test_render_is_a_single_blit(self):
+        """Test that rendering does not draw shapes or text."""
+        with mock.patch('pygame.draw.rect') as draw_rect:
+            self.button.render(self.surface)
+        draw_rect.assert_not_called()
+        self.assertEqual(self.surface.get_at((12, 30)), self.button.faces['normal'].get_at((2, 20)))
+    
+    def test_state_selection(self):
+        """Test which face is used for each button state."""
+        self.assertEqual(self.button.get_state(), 'normal')
+        self.button.update((20, 20))
+        self.assertEqual(self.button.get_state(), 'hover')
+        self.button.set_disabled(True)
+        self.assertEqual(self.button.get_state(), 'disabled')
+        self.button.set_max_level(True)
+        self.assertEqual(self.button.get_state(), 'max_level_hover')
+    
+    def test_set_text_rebuilds_faces(self):
+        """Test that changing the text rebuilds the faces."""
+        old_face = self.button.faces['normal']
+        self.button.set_text("Sold")
+        self.assertIsNot(self.button.faces['normal'], old_face)
+
+class TestTextLayout(unittest.TestCase):
+    """Test cases for the TextLayout class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.font.init()
+        self.font = pygame.font.SysFont('Arial', 24)
+        self.layout = TextLayout(self.font, (0, 0, 0), max_width=170)
+    
+    def test_newlines_and_wrapping(self):
+        """Test that text is split at newlines and wrapped to the width."""
+        self.layout.set_text("Click Power (Lvl 2)\nCost: 22")
+        self.assertEqual(self.layout.lines, ["Click Power (Lvl 2)", "Cost: 22"])
+        self.assertEqual(self.layout.height, 2 * self.font.get_linesize())
+        
+        self.layout.set_text("Release the LEVI! Release the LEVI!\nCost: 100")
+        self.assertGreater(len(self.layout.lines), 2)
+        for line in self.layout.lines:
+            self.assertLessEqual(self.font.size(line)[0], 170)
+        self.assertEqual(" ".join(self.layout.lines[:-1]), "Release the LEVI! Release the LEVI!")
+    
+    def test_only_changed_lines_are_rendered(self):
+        """Test that unchanged lines reuse their cached surfaces."""
+        self.layout.set_text("Click Power (Lvl 2)\nCost: 22")
+        name_surface = self.layout.line_surfaces["Click Power (Lvl 2)"]
+        
+        with mock.patch.object(self.layout, 'font', wraps=self.font) as font:
+            self.assertTrue(self.layout.set_text("Click Power (Lvl 2)\nCost: 33"))
+            self.assertFalse(self.layout.set_text("Click Power (Lvl 2)\nCost: 33"))
+        
+        font.render.assert_called_once_with("Cost: 33", True, (0, 0, 0))
+        self.assertIs(self.layout.line_surfaces["Click Power (Lvl 2)"], name_surface)
+        self.assertNotIn("Cost: 22", self.layout.line_surfaces)
+    
+    def test_word_cache_is_bounded(self):
+        """Test that changing costs do not grow the word cache forever."""
+        for cost in range(2 * WORD_CACHE_SIZE):
+            self.layout.set_text(f"Click Power (Lvl 2)\nCost: {cost}")
+        
+        self.assertLessEqual(len(self.layout.word_widths), WORD_CACHE_SIZE)
+        self.assertNotIn("Cost: 0", self.layout.word_widths)
+        self.assertEqual(self.layout.lines, ["Click Power (Lvl 2)", f"Cost: {2 * WORD_CACHE_SIZE - 1}"])
+    
+    def test_button_draws_every_line(self):
+        """Test that a button label with a newline draws two lines."""
+        button = Button(pygame.Rect(0, 0, 180, 80), "Auto Clicker\nCost: 50")
+        self.assertEqual(button.layout.lines, ["Auto Clicker", "Cost: 50"])
+
+class TestPanel(unittest.TestCase):
+    """Test cases for the Panel class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        pygame.font.init()
+        self.surface = pygame.Surface((300, 300))
+        self.panel = Panel(pygame.Rect(50, 50, 200, 200))
+        self.panel.add_element(Button(pygame.Rect(10, 10, 100, 40), "Buy"))
+    
+    def test_background_and_subsurface_are_cached(self):
+        """Test that rendering twice reuses the background and subsurface."""
+        self.panel.render(self.surface)
+        background = self.panel.background
+        content = self.panel.content_surface
+        
+        with mock.patch('pygame.draw.rect') as draw_rect:
+            self.panel.render(self.surface)
+        
+        draw_rect.assert_not_called()
+        self.assertIs(self.panel.background, background)
+        self.assertIs(self.panel.content_surface, content)
+    
+    def test_new_target_gets_new_subsurface(self):
+        """Test that rendering to another surface creates a new subsurface."""
+        self.panel.render(self.surface)
+        content = self.panel.content_surface
+        self.panel.render(pygame.Surface((300, 300)))
+        self.assertIsNot(self.panel.content_surface, content)
+
+class TestGlyphAtlas(unittest.TestCase):
+    """Test cases for the GlyphAtlas class and text particles."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        pygame.font.init()
+        self.surface = pygame.Surface((300, 300))
+    
+    def test_render_matches_measure(self):
+        """Test that composed text has the measured width."""
+        atlas = GlyphAtlas(16, (0, 200, 0))
+        rect = atlas.render(self.surface, "+1.5K", (150, 150), centered=True)
+        self.assertEqual(rect.width, atlas.measure("+1.5K"))
+        self.assertLessEqual(abs(rect.centerx - 150), 1)
+    
+    def test_faded_text_leaves_glyphs_opaque(self):
+        """Test that fading one text does not fade the shared glyphs for other callers."""
+        atlas = GlyphAtlas(24, (255, 255, 255))
+        alphas = {char: glyph.get_alpha() for char, glyph in atlas.glyphs.items()}
+        faded = atlas.render(self.surface, "8", (10, 10), alpha=60)
+        self.assertEqual({char: glyph.get_alpha() for char, glyph in atlas.glyphs.items()}, alphas)
+        
+        opaque = atlas.render(self.surface, "8", (100, 10))
+        brightest = lambda rect: max(self.surface.get_at((x, y)).r for x in range(rect.left, rect.right)
+                                     for y in range(rect.top, rect.bottom))
+        self.assertEqual(brightest(opaque), 255)
+        self.assertLess(brightest(faded), 70)
+    
+    def test_atlas_is_shared(self):
+        """Test that atlases are cached per font, size and color."""
+        self.assertIs(get_glyph_atlas(16, (1, 2, 3)), get_glyph_atlas(16, [1, 2, 3]))
+        self.assertIsNot(get_glyph_atlas(16, (1, 2, 3)), get_glyph_atlas(24, (1, 2, 3)))
+    
+    def test_text_particle_uses_cached_glyphs(self):
+        """Test that drawing popups does not render text with the font."""
+        particle = create_text_particle((100, 100), "+999", (0, 200, 0))
+        atlas = get_glyph_atlas(particle.size, particle.color)
+        
+        with mock.patch.object(atlas, 'font') as font:
+            for _ in range(100):
+                render_particle(self.surface, particle)
+        font.render.assert_not_called()
+    
+    def test_text_particle_rises(self):
+        """Test that text particles rise without gravity and keep their size."""
+        particle = create_text_particle((100, 100), "+1", (0, 200, 0), size=16)
+        self.assertTrue(update_particle(particle, 0.5))
+        self.assertEqual(particle.position[1], 75)
+        self.assertEqual(particle.velocity, [0, -50])
+        self.assertEqual(particle.size, 16)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests for the upgrade prerequisite graph.
+"""
+
+import unittest
+from src.models.player import Player
+from src.models.upgrade import Upgrade
+from src.models.unlocks import UnlockGraph, check_requirements, compile_requirements, achievement_stat
+
+def make_upgrade(upgrade_id, requires=None, max_level=None):
+    """Create an upgrade with the given prerequisites."""
+    return Upgrade(upgrade_id, upgrade_id.title(), '', 10, 1.5, 1, max_level, requires)
+
+class TestUnlockGraph(unittest.TestCase):
+    """Test cases for the UnlockGraph class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.upgrades = {upgrade.id: upgrade for upgrade in [
+            make_upgrade('base'),
+            make_upgrade('second', {'upgrades': {'base': 2}}),
+            make_upgrade('third', {'upgrades': {'second': 1}, 'currency_earned': 500}),
+            make_upgrade('secret', {'achievements': ['clicks_100'], 'total_clicks': 50}),
+        ]}
+        self.graph = UnlockGraph(self.upgrades, ['clicks_100'])
+    
+    def test_compile_requirements(self):
+        """Test flattening a prerequisite definition into stat thresholds."""
+        self.assertEqual(compile_requirements(None), {})
+        self.assertEqual(compile_requirements({'upgrades': {'base': 2}, 'currency_earned': 500,
+                                               'achievements': ['clicks_100']}),
+                         {'base_level': 2, 'currency_earned': 500, 'achievement:clicks_100': 1})
+        with self.assertRaises(ValueError):
+            compile_requirements({'prestige': 1})
+    
+    def test_prerequisites_unlock_incrementally(self):
+        """Test that only upgrades depending on a changed stat are updated."""
+        self.assertTrue(self.graph.is_unlocked('base'))
+        self.assertFalse(self.graph.is_unlocked('second'))
+        self.assertEqual(self.graph.update('base_level', 1), [])
+        self.assertEqual(self.graph.update('base_level', 2), ['second'])
+        self.assertTrue(self.graph.is_unlocked('second'))
+        
+        # A prerequisite of several is met, but the upgrade stays locked until all are
+        self.assertEqual(self.graph.update('second_level', 1), ['third'])
+        self.assertFalse(self.graph.is_unlocked('third'))
+        self.assertEqual(self.graph.missing('third'), {'currency_earned': 500})
+        self.assertEqual(self.graph.update('currency_earned', 499), [])
+        self.assertEqual(self.graph.update('currency_earned', 10 ** 6), ['third'])
+        self.assertTrue(self.graph.is_unlocked('third'))
+        self.assertEqual(self.graph.update('currency_earned', 10 ** 9), [])
+    
+    def test_achievement_prerequisites(self):
+        """Test prerequisites on achievements and clicks."""
+        changed = self.graph.update_many({'total_clicks': 100, achievement_stat('clicks_100'): 1})
+        self.assertEqual(changed, ['secret', 'secret'])
+        self.assertTrue(self.graph.is_unlocked('secret'))
+        self.assertEqual(self.graph.missing('secret'), {})
+    
+    def test_invalid_prerequisites(self):
+        """Test that unknown prerequisites and cycles are rejected."""
+        with self.assertRaises(ValueError):
+            UnlockGraph({'a': make_upgrade('a', {'upgrades': {'missing': 1}})})
+        with self.assertRaises(ValueError):
+            UnlockGraph(self.upgrades, ['first_click'])
+        
+        cycle = {upgrade.id: upgrade for upgrade in [
+            make_upgrade('a', {'upgrades': {'c': 1}}),
+            make_upgrade('b', {'upgrades': {'a': 1}}),
+            make_upgrade('c', {'upgrades': {'b': 1}}),
+        ]}
+        with self.assertRaisesRegex(ValueError, 'cycle'):
+            UnlockGraph(cycle)
+    
+    def test_check_requirements_against_known_upgrades(self):
+        """Test that new upgrades may require known ones and are searched for cycles among themselves."""
+        new = {upgrade.id: upgrade for upgrade in [
+            make_upgrade('d', {'upgrades': {'base': 1, 'e': 1}}),
+            make_upgrade('e', {'achievements': ['clicks_100']}),
+        ]}
+        requirements = check_requirements(new, self.upgrades, ['clicks_100'])
+        self.assertEqual(requirements['d'], {'base_level': 1, 'e_level': 1})
+        with self.assertRaisesRegex(ValueError, 'unknown upgrade base'):
+            check_requirements(new)
+        
+        new['e'] = make_upgrade('e', {'upgrades': {'d': 1}})
+        with self.assertRaisesRegex(ValueError, 'cycle: d -> e -> d'):
+            check_requirements(new, self.upgrades)
+    
+    def test_deep_chain(self):
+        """Test a long chain of upgrades that each require the one before."""
+        upgrades = {'u0': make_upgrade('u0')}
+        for index in range(1, 5000):
+            upgrade = make_upgrade(f'u{index}', {'upgrades': {f'u{index - 1}': 1}})
+            upgrades[upgrade.id] = upgrade
+        graph = UnlockGraph(upgrades)
+        self.assertEqual(graph.update('u0_level', 1), ['u1'])
+        self.assertFalse(graph.is_unlocked('u2'))
+    
+    def test_matches_direct_check(self):
+        """Test that the graph agrees with checking prerequisites against the player."""
+        player = Player()
+        player.owned_upgrades['base'] = 2
+        self.graph.update('base_level', 2)
+        for upgrade_id, upgrade in self.upgrades.items():
+            self.assertEqual(upgrade.is_available(player, self.graph), upgrade.is_available(player), upgrade_id)
+        
+        player.total_clicks = 100
+        self.graph.update_many({'total_clicks': 100, achievement_stat('clicks_100'): 1})
+        self.assertTrue(self.upgrades['secret'].is_available(player, self.graph))
+        self.assertFalse(self.upgrades['secret'].is_available(player))
+        self.assertTrue(self.upgrades['secret'].is_available(player, achievements=['clicks_100']))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Tests for the Upgrade model.
+"""
+
+import unittest
+from src.config import UPGRADES
+from src.models.upgrade import Upgrade, create_upgrades_from_config
+
+class TestUpgrade(unittest.TestCase):
+    """Test cases for the Upgrade class."""
+    
+    def test_to_dict_and_from_dict(self):
+        """Test converting an upgrade to and from its config dictionary."""
+        for upgrade_config in UPGRADES:
+            upgrade = Upgrade.from_dict(upgrade_config)
+            self.assertEqual(upgrade.to_dict(), upgrade_config)
+    
+    def test_create_upgrades_from_config(self):
+        """Test building the upgrade dictionary from the config."""
+        upgrades = create_upgrades_from_config()
+        self.assertEqual(list(upgrades), [u['id'] for u in UPGRADES])
+        self.assertEqual(upgrades['click_power'].get_cost(1), 15)
+    
+    def test_slots(self):
+        """Test that upgrades do not carry a per-instance __dict__."""
+        upgrade = Upgrade.from_dict(UPGRADES[0])
+        self.assertFalse(hasattr(upgrade, '__dict__'))
+        with self.assertRaises(AttributeError):
+            upgrade.unknown_attribute = 1
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for the Viewport class.
+"""
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import unittest
+import pygame
+from src.ui.viewport import Viewport
+
+class TestViewport(unittest.TestCase):
+    """Test cases for the Viewport class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        pygame.display.init()
+        self.viewport = Viewport((800, 600), band_height=40)
+    
+    def test_unscaled_window(self):
+        """Test that an 800x600 window uses logical coordinates directly."""
+        self.assertTrue(self.viewport.identity)
+        self.assertEqual(self.viewport.to_logical((123, 456)), (123, 456))
+        
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 20))
+        self.assertIs(self.viewport.map_event(event), event)
+    
+    def test_letterboxed_window(self):
+        """Test that a wider window is centered with bars and mapped back."""
+        self.viewport.resize(pygame.Surface((1000, 600)))
+        self.assertEqual(self.viewport.rect, pygame.Rect(100, 0, 800, 600))
+        self.assertEqual(self.viewport.to_logical((150, 10)), (50, 10))
+        self.assertEqual(self.viewport.to_logical((50, 10)), (-50, 10))
+        
+        self.viewport.resize(pygame.Surface((1600, 1400)))
+        self.assertEqual(self.viewport.rect, pygame.Rect(0, 100, 1600, 1200))
+        event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=(401, 401))
+        mapped = self.viewport.map_event(event)
+        self.assertEqual(mapped.pos, (200, 150))
+        self.assertEqual(mapped.button, 3)
+    
+    def test_only_changed_bands_are_scaled(self):
+        """Test that present scales the whole frame once, then only changes."""
+        window = pygame.Surface((1600, 1200))
+        self.viewport.resize(window)
+        self.viewport.surface.fill((10, 20, 30))
+        
+        self.assertEqual(self.viewport.present(), [pygame.Rect(0, 0, 1600, 1200)])
+        self.assertEqual(self.viewport.present(), [])
+        
+        # A change in rows 110-129 touches the bands at 80 and 120
+        self.viewport.surface.fill((255, 0, 0), pygame.Rect(100, 110, 50, 20))
+        self.assertEqual(self.viewport.present(), [pygame.Rect(0, 160, 1600, 160)])
+        self.assertEqual(window.get_at((250, 240))[:3], (255, 0, 0))
+        self.assertEqual(window.get_at((250, 100))[:3], (10, 20, 30))
+    
+    def test_resize_redraws_everything(self):
+        """Test that a new window size scales the whole frame again."""
+        self.viewport.resize(pygame.Surface((400, 300)))
+        self.viewport.present()
+        self.viewport.resize(pygame.Surface((1200, 900)))
+        self.assertEqual(self.viewport.present(), [pygame.Rect(0, 0, 1200, 900)])
+
+if __name__ == '__main__':
+    unittest.main()